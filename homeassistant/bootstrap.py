@@ -84,6 +84,7 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
@@ -310,6 +311,7 @@ async def async_setup_hass(
 
     if not (recovery_mode := runtime_config.recovery_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+        await conf_util.async_load_yaml_parse_cache(hass)
 
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
@@ -435,6 +437,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_code_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -450,6 +453,7 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    startup_trace.async_start_startup_trace(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     # Prime custom component cache early so we know if registry entries are tied
@@ -1021,7 +1025,9 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
+            stage_start = monotonic()
             await async_setup_multi_components(hass, domain_group, config)
+            _async_add_stage_span(hass, name, stage_start)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1029,6 +1035,7 @@ async def _async_set_up_integrations(
     # Start setup
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
+        stage_start = monotonic()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
@@ -1039,12 +1046,14 @@ async def _async_set_up_integrations(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
+        _async_add_stage_span(hass, "stage 1", stage_start)
 
     # Add after dependencies when setting up stage 2 domains
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        stage_start = monotonic()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
@@ -1055,9 +1064,11 @@ async def _async_set_up_integrations(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
+        _async_add_stage_span(hass, "stage 2", stage_start)
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
+    stage_start = monotonic()
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
             await hass.async_block_till_done()
@@ -1067,7 +1078,11 @@ async def _async_set_up_integrations(
             hass._active_tasks,  # noqa: SLF001
         )
 
+    _async_add_stage_span(hass, "wrap up", stage_start)
+
     watcher.async_stop()
+    if trace := startup_trace.async_get_active_startup_trace(hass):
+        trace.async_finish()
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -1075,3 +1090,12 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        if trace:
+            _LOGGER.debug("Startup critical path: %s", trace.async_critical_path())
+
+
+@core.callback
+def _async_add_stage_span(hass: core.HomeAssistant, name: str, start: float) -> None:
+    """Add a bootstrap stage to the startup trace."""
+    if trace := startup_trace.async_get_active_startup_trace(hass):
+        trace.async_add_span(name, startup_trace.SPAN_STAGE, start, monotonic())
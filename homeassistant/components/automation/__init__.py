@@ -7,6 +7,7 @@ import asyncio
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 import logging
+import time
 from typing import Any, Protocol, cast
 
 from propcache import cached_property
@@ -1009,7 +1010,11 @@ async def _async_process_config(
         automation_matches: set[int] = set()
         config_matches: set[int] = set()
         automation_configs_with_id: dict[str, tuple[int, AutomationEntityConfig]] = {}
-        automation_configs_without_id: list[tuple[int, AutomationEntityConfig]] = []
+        # Configurations without id can only match automations with the same
+        # name, bucket them by name to avoid comparing every pair
+        automation_configs_without_id: dict[
+            str, list[tuple[int, AutomationEntityConfig]]
+        ] = {}
 
         for config_idx, automation_config in enumerate(automation_configs):
             if automation_id := automation_config.config_block.get(CONF_ID):
@@ -1018,7 +1023,9 @@ async def _async_process_config(
                     automation_config,
                 )
                 continue
-            automation_configs_without_id.append((config_idx, automation_config))
+            automation_configs_without_id.setdefault(
+                _automation_name(automation_config), []
+            ).append((config_idx, automation_config))
 
         for automation_idx, automation in enumerate(automations):
             if automation.unique_id:
@@ -1032,7 +1039,9 @@ async def _async_process_config(
                     config_matches.add(config_idx)
                 continue
 
-            for config_idx, automation_config in automation_configs_without_id:
+            for config_idx, automation_config in automation_configs_without_id.get(
+                cast(str, automation.name), ()
+            ):
                 if config_idx in config_matches:
                     # Only allow an automation config to match at most once
                     continue
@@ -1044,6 +1053,7 @@ async def _async_process_config(
 
         return automation_matches, config_matches
 
+    start = time.monotonic()
     automation_configs = await _prepare_automation_config(hass, config, None)
     automations: list[BaseAutomationEntity] = list(component.entities)
 
@@ -1067,6 +1077,15 @@ async def _async_process_config(
     entities = await _create_automation_entities(hass, updated_automation_configs)
     await component.async_add_entities(entities)
 
+    LOGGER.debug(
+        "Processed automation config in %.3f seconds: %s unchanged, %s removed, "
+        "%s added",
+        time.monotonic() - start,
+        len(automation_matches),
+        len(tasks),
+        len(entities),
+    )
+
 
 def _automation_matches_config(
     automation: BaseAutomationEntity | None, config: AutomationEntityConfig | None
@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
 from homeassistant.components.recorder.statistics import StatisticsRow
+from homeassistant.components.recorder.util import async_add_read_job_for_connection
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
@@ -272,7 +273,10 @@ async def ws_get_fossil_energy_consumption(
     statistic_ids.add(msg["co2_statistic_id"])
 
     # Fetch energy + CO2 statistics
-    statistics = await recorder.get_instance(hass).async_add_executor_job(
+    statistics = await async_add_read_job_for_connection(
+        hass,
+        connection,
+        msg["id"],
         recorder.statistics.statistics_during_period,
         hass,
         start_time,
@@ -5,3 +5,20 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of rows fetched and sent at a time for history streams
+HISTORY_STREAM_BATCH_SIZE = 10000
+
+DOWNSAMPLE_LAST = "last"
+DOWNSAMPLE_LTTB = "lttb"
+DOWNSAMPLE_MAX = "max"
+DOWNSAMPLE_MEAN = "mean"
+DOWNSAMPLE_MIN = "min"
+DOWNSAMPLE_METHODS = (
+    DOWNSAMPLE_LTTB,
+    DOWNSAMPLE_LAST,
+    DOWNSAMPLE_MAX,
+    DOWNSAMPLE_MEAN,
+    DOWNSAMPLE_MIN,
+)
+MIN_DOWNSAMPLE_POINTS = 3
@@ -0,0 +1,149 @@
+"""Downsample history states for graphs."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+from typing import Any
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+
+from .const import (
+    DOWNSAMPLE_LAST,
+    DOWNSAMPLE_LTTB,
+    DOWNSAMPLE_MAX,
+    DOWNSAMPLE_MEAN,
+    DOWNSAMPLE_MIN,
+)
+
+# A numeric state with its timestamp, value and compressed state
+type _Point = tuple[float, float, dict[str, Any]]
+
+
+def _numeric_value(state: str) -> float | None:
+    """Return the value of a numeric state or None."""
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _lttb(points: list[_Point], threshold: int) -> list[dict[str, Any]]:
+    """Select threshold points with Largest-Triangle-Three-Buckets.
+
+    The first and last point are always kept. Every other point is
+    picked from its bucket as the one forming the largest triangle with
+    the previously picked point and the average of the next bucket.
+    """
+    if len(points) <= max(threshold, 2):
+        return [state for _, _, state in points]
+    if threshold < 3:
+        return [points[0][2], points[-1][2]]
+    every = (len(points) - 2) / (threshold - 2)
+    sampled = [points[0][2]]
+    picked = 0
+    for bucket in range(threshold - 2):
+        avg_start = int((bucket + 1) * every) + 1
+        avg_end = min(int((bucket + 2) * every) + 1, len(points))
+        avg_count = avg_end - avg_start
+        avg_x = sum(point[0] for point in points[avg_start:avg_end]) / avg_count
+        avg_y = sum(point[1] for point in points[avg_start:avg_end]) / avg_count
+        picked_x, picked_y, _ = points[picked]
+        max_area = -1.0
+        next_picked = picked
+        for idx in range(int(bucket * every) + 1, int((bucket + 1) * every) + 1):
+            x, y, _ = points[idx]
+            area = abs(
+                (picked_x - avg_x) * (y - picked_y)
+                - (picked_x - x) * (avg_y - picked_y)
+            )
+            if area > max_area:
+                max_area = area
+                next_picked = idx
+        sampled.append(points[next_picked][2])
+        picked = next_picked
+    sampled.append(points[-1][2])
+    return sampled
+
+
+def _mean_state(points: list[_Point]) -> dict[str, Any]:
+    """Return the last state of points with the mean of their values."""
+    precision = max(
+        len(state[COMPRESSED_STATE_STATE].partition(".")[2]) for _, _, state in points
+    )
+    mean = sum(point[1] for point in points) / len(points)
+    return {**points[-1][2], COMPRESSED_STATE_STATE: f"{mean:.{precision}f}"}
+
+
+_AGGREGATES: dict[str, Callable[[list[_Point]], dict[str, Any]]] = {
+    DOWNSAMPLE_LAST: lambda points: points[-1][2],
+    DOWNSAMPLE_MAX: lambda points: max(points, key=lambda point: point[1])[2],
+    DOWNSAMPLE_MEAN: _mean_state,
+    DOWNSAMPLE_MIN: lambda points: min(points, key=lambda point: point[1])[2],
+}
+
+
+def _aggregate(
+    points: list[_Point], method: str, start_ts: float, bucket_size: float
+) -> list[dict[str, Any]]:
+    """Aggregate points to one state per bucket of bucket_size seconds."""
+    aggregate = _AGGREGATES[method]
+    aggregated: list[dict[str, Any]] = []
+    bucket_points: list[_Point] = []
+    current_bucket = -1
+    for point in points:
+        if (bucket := int((point[0] - start_ts) // bucket_size)) != current_bucket:
+            if bucket_points:
+                aggregated.append(aggregate(bucket_points))
+            bucket_points = []
+            current_bucket = bucket
+        bucket_points.append(point)
+    if bucket_points:
+        aggregated.append(aggregate(bucket_points))
+    return aggregated
+
+
+def downsample_states(
+    states: list[dict[str, Any]],
+    max_points: int,
+    method: str,
+    start_ts: float,
+    end_ts: float,
+) -> list[dict[str, Any]]:
+    """Downsample the compressed states of an entity to about max_points.
+
+    Only runs of numeric states are downsampled. States that are not
+    numeric, such as unavailable, are kept so graphs still show the gaps,
+    and the first and last state are kept since they are the only ones
+    with attributes when the response is minimal.
+    """
+    if len(states) <= max_points:
+        return states
+    runs: list[list[_Point]] = [[]]
+    between: list[dict[str, Any] | None] = []
+    numeric_count = 0
+    for state in states[1:-1]:
+        if (value := _numeric_value(state[COMPRESSED_STATE_STATE])) is None:
+            between.append(state)
+            runs.append([])
+            continue
+        runs[-1].append((state[COMPRESSED_STATE_LAST_UPDATED], value, state))
+        numeric_count += 1
+    if not numeric_count:
+        return states
+    between.append(None)
+
+    bucket_size = max(end_ts - start_ts, 1) / max_points
+    downsampled = [states[0]]
+    for run, after in zip(runs, between, strict=True):
+        if run:
+            if method == DOWNSAMPLE_LTTB:
+                threshold = round((max_points - 2) * len(run) / numeric_count)
+                downsampled.extend(_lttb(run, threshold))
+            else:
+                downsampled.extend(_aggregate(run, method, start_ts, bucket_size))
+        if after is not None:
+            downsampled.append(after)
+    downsampled.append(states[-1])
+    return downsampled
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -13,6 +13,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import (
+    async_add_read_job_for_connection,
+    async_stream_read_job_to_connection,
+)
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -38,7 +42,15 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    DOWNSAMPLE_LTTB,
+    DOWNSAMPLE_METHODS,
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_BATCH_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_DOWNSAMPLE_POINTS,
+)
+from .downsample import downsample_states
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,25 +84,36 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
+    downsample: str,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if max_points:
+        start_ts = start_time.timestamp()
+        end_ts = (end_time or dt_util.utcnow()).timestamp()
+        states = {
+            entity_id: downsample_states(
+                cast(list[dict[str, Any]], entity_states),
+                max_points,
+                downsample,
+                start_ts,
+                end_ts,
+            )
+            for entity_id, entity_states in states.items()
+        }
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +126,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=MIN_DOWNSAMPLE_POINTS)),
+        vol.Optional("downsample", default=DOWNSAMPLE_LTTB): vol.In(DOWNSAMPLE_METHODS),
     }
 )
 @websocket_api.async_response
@@ -159,7 +184,10 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -170,6 +198,8 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
+            msg["downsample"],
         )
     )
 
@@ -213,7 +243,7 @@ def _generate_websocket_response(
     )
 
 
-def _generate_historical_response(
+def _generate_historical_responses(
     hass: HomeAssistant,
     msg_id: int,
     start_time: dt,
@@ -224,47 +254,51 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
-    """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
-    )
+) -> Generator[bytes, None, float]:
+    """Generate a historical response for each batch of states.
+
+    Returns the timestamp of the newest state.
+    """
+    assert entity_ids is not None
     last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+    for states in history.iter_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        HISTORY_STREAM_BATCH_SIZE,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    ):
+        batch_last_time_ts = 0.0
+        for state_list in cast(dict[str, list[dict[str, Any]]], states).values():
+            if (
+                state_list
+                and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
+                > batch_last_time_ts
+            ):
+                batch_last_time_ts = cast(float, state_last_time)
+        if batch_last_time_ts == 0:
+            continue
+        # Batches can end before a previous one, the end time
+        # of the messages must not go back in time
+        last_time_ts = max(last_time_ts, batch_last_time_ts)
+        yield _generate_websocket_response(
+            msg_id,
+            start_time,
+            dt_util.utc_from_timestamp(last_time_ts),
+            cast(dict[str, list[dict[str, Any]]], states),
+        )
 
-    if last_time_ts == 0:
+    if last_time_ts == 0 and send_empty:
         # If we did not send any states ever, we need to send an empty response
         # so the websocket client knows it should render/process/consume the
         # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
-
-    return (
-        last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
-    )
+        yield _generate_websocket_response(msg_id, start_time, end_time, {})
+    return last_time_ts
 
 
 async def _async_send_historical_states(
@@ -280,10 +314,15 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
+    """Fetch history significant_states and send them to the client.
+
+    Large periods are sent as several messages as the
+    states are fetched instead of a single message.
+    """
+    last_time_ts = await async_stream_read_job_to_connection(
+        hass,
+        connection,
+        _generate_historical_responses,
         hass,
         msg_id,
         start_time,
@@ -295,9 +334,7 @@ async def _async_send_historical_states(
         no_attributes,
         send_empty,
     )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts else None
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
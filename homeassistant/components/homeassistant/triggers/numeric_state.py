@@ -34,13 +34,12 @@ from homeassistant.helpers import (
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_same_state
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
+from .state import async_get_state_trigger_index
+
 
 def validate_above_below[_T: dict[str, Any]](value: _T) -> _T:
     """Validate that above and below can co-exist."""
@@ -193,7 +192,7 @@ async def async_attach_trigger(
             except exceptions.ConditionError:
                 # This is an internal same-state listener so we just drop the
                 # error. The same error will be reached and logged by the
-                # primary async_track_state_change_event() listener.
+                # primary state trigger listener.
                 return False
 
         try:
@@ -230,7 +229,18 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Value templates and thresholds from other entities can change the
+    # result of any state change, otherwise only the tracked value matters
+    index = async_get_state_trigger_index(hass)
+    if value_template is not None or isinstance(below, str) or isinstance(above, str):
+        unsub = index.async_add(entity_ids, state_automation_listener)
+    else:
+        unsub = index.async_add(
+            entity_ids,
+            state_automation_listener,
+            state_changes_only=True,
+            attribute=attribute,
+        )
 
     @callback
     def async_remove() -> None:
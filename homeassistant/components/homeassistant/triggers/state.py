@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
 import logging
 
@@ -15,6 +16,7 @@ from homeassistant.core import (
     Event,
     EventStateChangedData,
     HassJob,
+    HassJobType,
     HomeAssistant,
     State,
     callback,
@@ -31,9 +33,14 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_STATE_TRIGGER_INDEX: HassKey[StateTriggerIndex] = HassKey(
+    "homeassistant.state_trigger_index"
+)
+
 CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
@@ -69,6 +76,168 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+type StateTriggerListener = Callable[[Event[EventStateChangedData]], None]
+
+
+@dataclass(slots=True)
+class _EntityTriggers:
+    """The triggers listening to the state changes of an entity."""
+
+    unsub: CALLBACK_TYPE
+    # Triggers only matching specific new states, keyed by the new state
+    by_to_state: dict[str, list[StateTriggerListener]] = field(default_factory=dict)
+    # Triggers matching other changes of the state
+    state_changes: list[StateTriggerListener] = field(default_factory=list)
+    # Triggers matching changes of an attribute, keyed by the attribute
+    by_attribute: dict[str, list[StateTriggerListener]] = field(default_factory=dict)
+    # Triggers matching changes of the state or any attribute
+    all_changes: list[StateTriggerListener] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Return if no triggers are left."""
+        return not (
+            self.by_to_state
+            or self.state_changes
+            or self.by_attribute
+            or self.all_changes
+        )
+
+
+class StateTriggerIndex:
+    """Dispatch state changes to the state based triggers of all automations.
+
+    There is one state change listener per entity. The triggers of an entity
+    that only match specific new states are indexed by that state, so a state
+    change only calls the triggers that can match it. Attaching or removing a
+    trigger only updates the entries of its entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._entities: dict[str, _EntityTriggers] = {}
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: str | Iterable[str],
+        listener: StateTriggerListener,
+        to_states: Iterable[str] | None = None,
+        state_changes_only: bool = False,
+        attribute: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """Add a trigger listener for the state changes of entities.
+
+        If to_states is passed, the listener is only called when the state
+        changes to one of them. If state_changes_only is set, changes of the
+        attributes alone do not call the listener. If attribute is passed,
+        the listener is only called when the value of the attribute changes.
+
+        Entities being added or removed always call the listener, unless
+        it only matches specific new states.
+        """
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+        states = None if to_states is None else set(to_states)
+        for entity_id in entity_ids:
+            if (triggers := self._entities.get(entity_id)) is None:
+                triggers = self._entities[entity_id] = _EntityTriggers(
+                    async_track_state_change_event(
+                        self._hass,
+                        entity_id,
+                        self._async_state_changed,
+                        job_type=HassJobType.Callback,
+                    )
+                )
+            if states is not None:
+                for to_state in states:
+                    triggers.by_to_state.setdefault(to_state, []).append(listener)
+            elif attribute is not None:
+                triggers.by_attribute.setdefault(attribute, []).append(listener)
+            elif state_changes_only:
+                triggers.state_changes.append(listener)
+            else:
+                triggers.all_changes.append(listener)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger listener."""
+            for entity_id in entity_ids:
+                triggers = self._entities[entity_id]
+                if states is not None:
+                    for to_state in states:
+                        _remove_keyed_listener(triggers.by_to_state, to_state, listener)
+                elif attribute is not None:
+                    _remove_keyed_listener(triggers.by_attribute, attribute, listener)
+                elif state_changes_only:
+                    triggers.state_changes.remove(listener)
+                else:
+                    triggers.all_changes.remove(listener)
+                if triggers.is_empty():
+                    triggers.unsub()
+                    del self._entities[entity_id]
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Call the trigger listeners that can match a state change."""
+        if (triggers := self._entities.get(event.data["entity_id"])) is None:
+            return
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        listeners: list[StateTriggerListener] = []
+        if old_state is None or new_state is None:
+            if new_state is not None and (
+                to_state_listeners := triggers.by_to_state.get(new_state.state)
+            ):
+                listeners += to_state_listeners
+            listeners += triggers.state_changes
+            for attribute_listeners in triggers.by_attribute.values():
+                listeners += attribute_listeners
+        else:
+            if old_state.state != new_state.state:
+                if to_state_listeners := triggers.by_to_state.get(new_state.state):
+                    listeners += to_state_listeners
+                listeners += triggers.state_changes
+            old_attributes = old_state.attributes
+            new_attributes = new_state.attributes
+            for attribute, attribute_listeners in triggers.by_attribute.items():
+                if old_attributes.get(attribute) != new_attributes.get(attribute):
+                    listeners += attribute_listeners
+        listeners += triggers.all_changes
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s",
+                    event.data["entity_id"],
+                    listener,
+                )
+
+
+def _remove_keyed_listener(
+    listeners_by_key: dict[str, list[StateTriggerListener]],
+    key: str,
+    listener: StateTriggerListener,
+) -> None:
+    """Remove a listener stored by key."""
+    listeners = listeners_by_key[key]
+    listeners.remove(listener)
+    if not listeners:
+        del listeners_by_key[key]
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -232,7 +401,18 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Triggers for specific new states are only called for those states,
+    # matching any new state ("*") only needs the changes of the state
+    to_states: list[str] | None = None
+    if attribute is None and to_state is not None and to_state != MATCH_ALL:
+        to_states = [to_state] if isinstance(to_state, str) else to_state
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids,
+        state_automation_listener,
+        to_states,
+        state_changes_only=not match_all,
+        attribute=attribute,
+    )
 
     @callback
     def async_remove() -> None:
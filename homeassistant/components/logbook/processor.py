@@ -6,11 +6,14 @@ from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -84,6 +87,10 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Length in seconds of the windows a period is read in when
+# its events are generated in batches
+ITER_EVENTS_WINDOW = 3600
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -150,6 +157,32 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    def _statement(
+        self, session: Session, start_day: float, end_day: float
+    ) -> StatementLambdaElement:
+        """Return the statement to select the events for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def get_events(
         self,
         start_day: dt,
@@ -157,33 +190,41 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
+            stmt = self._statement(session, start_day.timestamp(), end_day.timestamp())
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def iter_events(
+        self, start_day: dt, end_day: dt, batch_size: int
+    ) -> Generator[list[dict[str, Any]]]:
+        """Generate the events for a period of time in batches.
+
+        The period is read in windows of ITER_EVENTS_WINDOW, each in
+        its own session, so no session is open while a batch is
+        being sent and the memory used does not depend on the length
+        of the period.
+        """
+        end_ts = end_day.timestamp()
+        window_start_ts = start_day.timestamp()
+        events: list[dict[str, Any]] = []
+        while True:
+            window_end_ts = min(window_start_ts + ITER_EVENTS_WINDOW, end_ts)
+            with session_scope(hass=self.hass, read_only=True) as session:
+                stmt = self._statement(session, window_start_ts, window_end_ts)
+                rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            events.extend(self.humanify(rows))
+            while len(events) >= batch_size:
+                yield events[:batch_size]
+                del events[:batch_size]
+            if window_end_ts >= end_ts:
+                break
+            # The bounds of a window are exclusive, so the next
+            # window starts just before the end of this one
+            window_start_ts = math.nextafter(window_end_ts, -math.inf)
+        if events:
+            yield events
+
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Collection
-from datetime import datetime as dt
 
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
@@ -18,8 +17,8 @@ from .entities_and_devices import entities_devices_stmt
 
 
 def statement_for_request(
-    start_day_dt: dt,
-    end_day_dt: dt,
+    start_day: float,
+    end_day: float,
     event_type_ids: tuple[int, ...],
     entity_ids: list[str] | None = None,
     states_metadata_ids: Collection[int] | None = None,
@@ -28,8 +27,6 @@ def statement_for_request(
     context_id: str | None = None,
 ) -> StatementLambdaElement:
     """Generate the logbook statement for a logbook request."""
-    start_day = start_day_dt.timestamp()
-    end_day = end_day_dt.timestamp()
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
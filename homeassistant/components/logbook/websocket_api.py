@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -13,6 +13,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.util import (
+    async_add_read_job_for_connection,
+    async_stream_read_job_to_connection,
+)
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
@@ -35,6 +39,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many events to fetch and send at a time
+LOGBOOK_STREAM_BATCH_SIZE = 1000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,74 +108,70 @@ async def _async_send_historical_events(
     )
 
     if not is_big_query:
-        message, last_event_time = await _async_get_ws_stream_events(
+        # If there are no historical results, we still send an empty
+        # message if its the last one (not partial) so consumers of
+        # the api know their request was answered but there were no results
+        return await _async_send_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             event_processor,
             partial,
+            not partial or force_send,
         )
-        # If there is no last_event_time, there are no historical
-        # results, but we still send an empty message
-        # if its the last one (not partial) so
-        # consumers of the api know their request was
-        # answered but there were no results
-        if last_event_time or not partial or force_send:
-            connection.send_message(message)
-        return last_event_time
 
     # This is a big query so we deliver
     # the first three hours and then
     # we fetch the old data
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
+    recent_query_last_event_time = await _async_send_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         event_processor,
-        partial=True,
+        True,
+        False,
     )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
-
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
+    older_query_last_event_time = await _async_send_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         event_processor,
         partial,
+        not partial or force_send,
     )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
-async def _async_get_ws_stream_events(
+async def _async_send_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    send_empty: bool,
+) -> dt | None:
+    """Send the events of a period as they are fetched from the database."""
+    return await async_stream_read_job_to_connection(
+        hass,
+        connection,
         _ws_stream_get_events,
         msg_id,
         start_time,
         end_time,
         event_processor,
         partial,
+        send_empty,
     )
 
 
@@ -184,18 +186,14 @@ def _generate_stream_message(
     }
 
 
-def _ws_stream_get_events(
+def _generate_stream_message_bytes(
     msg_id: int,
+    events: list[dict[str, Any]],
     start_day: dt,
     end_day: dt,
-    event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+) -> bytes:
+    """Generate a logbook stream message response as json."""
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -203,7 +201,40 @@ def _ws_stream_get_events(
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return json_bytes(messages.event_message(msg_id, message)), last_time
+    return json_bytes(messages.event_message(msg_id, message))
+
+
+def _ws_stream_get_events(
+    msg_id: int,
+    start_day: dt,
+    end_day: dt,
+    event_processor: EventProcessor,
+    partial: bool,
+    send_empty: bool,
+) -> Generator[bytes, None, dt | None]:
+    """Fetch events and generate a message for each batch in the executor.
+
+    Returns the time of the newest event.
+    """
+    # The last batch is held back until the next one is
+    # fetched since only the last message may not be partial
+    events: list[dict[str, Any]] | None = None
+    for next_events in event_processor.iter_events(
+        start_day, end_day, LOGBOOK_STREAM_BATCH_SIZE
+    ):
+        if events:
+            yield _generate_stream_message_bytes(
+                msg_id, events, start_day, end_day, True
+            )
+        events = next_events
+    if not events:
+        if send_empty:
+            yield _generate_stream_message_bytes(
+                msg_id, [], start_day, end_day, partial
+            )
+        return None
+    yield _generate_stream_message_bytes(msg_id, events, start_day, end_day, partial)
+    return dt_util.utc_from_timestamp(events[-1]["when"])
 
 
 async def _async_events_consumer(
@@ -501,7 +532,10 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_formatted_get_events,
             msg["id"],
             start_time,
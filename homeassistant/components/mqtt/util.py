@@ -145,6 +145,110 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A level of the topic filters in a TopicTrie."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # Values of the filters ending at this level with their insertion order
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie[_T]:
+    """Match topics against topic filters with wildcards.
+
+    The filters are stored level by level, so matching a topic walks
+    the levels of the topic instead of testing every filter.
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._sequence = 0
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if a value was added for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        self._sequence += 1
+        node.values[value] = self._sequence
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        levels = topic_filter.split("/")
+        nodes = [self._root]
+        for level in levels:
+            nodes.append(nodes[-1].children[level])
+        del nodes[-1].values[value]
+        # Prune the levels no other filter uses anymore
+        for idx in range(len(levels) - 1, -1, -1):
+            node = nodes[idx + 1]
+            if node.values or node.children:
+                break
+            del nodes[idx].children[levels[idx]]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the filters matching a topic in insertion order."""
+        matches: list[dict[_T, int]] = []
+        _match_topic_trie(
+            self._root, topic.split("/"), 0, not topic.startswith("$"), matches
+        )
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return list(matches[0])
+        merged: dict[_T, int] = {}
+        for values in matches:
+            merged.update(values)
+        return sorted(merged, key=merged.__getitem__)
+
+
+def _match_topic_trie[_T](
+    node: _TopicTrieNode[_T],
+    levels: list[str],
+    idx: int,
+    wildcards: bool,
+    matches: list[dict[_T, int]],
+) -> None:
+    """Collect the values of the filters below node matching levels[idx:].
+
+    Wildcards do not match the first level of topics starting with `$`.
+    """
+    children = node.children
+    wildcard = wildcards or idx > 0
+    # A multi-level wildcard also matches its parent level
+    if wildcard and (node_all := children.get("#")) is not None and node_all.values:
+        matches.append(node_all.values)
+    if idx == len(levels):
+        if node.values:
+            matches.append(node.values)
+        return
+    if (child := children.get(levels[idx])) is not None:
+        _match_topic_trie(child, levels, idx + 1, wildcards, matches)
+    if wildcard and (child := children.get("+")) is not None:
+        _match_topic_trie(child, levels, idx + 1, wildcards, matches)
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
@@ -34,6 +34,7 @@ from .const import (  # noqa: F401
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
+    MAX_DB_READ_POOL_SIZE,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -61,6 +62,10 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SPOOL = "spool"
+CONF_DB_READ_POOL_SIZE = "db_read_pool_size"
+CONF_DB_READ_URL = "db_read_url"
+CONF_PARTITION_BY_DAY = "partition_by_day"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -113,6 +118,12 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SPOOL, default=False): cv.boolean,
+                    vol.Optional(CONF_DB_READ_POOL_SIZE, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_DB_READ_POOL_SIZE)
+                    ),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_PARTITION_BY_DAY, default=False): cv.boolean,
                 }
             ),
         )
@@ -163,6 +174,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        spool=conf[CONF_SPOOL],
+        db_read_pool_size=conf[CONF_DB_READ_POOL_SIZE],
+        db_read_url=conf.get(CONF_DB_READ_URL),
+        partition_by_day=conf[CONF_PARTITION_BY_DAY],
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -30,6 +30,16 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# When the spool is enabled, events are written to disk instead
+# of the queue once the backlog reaches SPOOL_BACKLOG_THRESHOLD
+# and replayed once the backlog drops below SPOOL_RESUME_BACKLOG
+SPOOL_BACKLOG_THRESHOLD = 30000
+SPOOL_RESUME_BACKLOG = 1000
+# The number of spooled events to buffer in memory between writes
+SPOOL_FLUSH_SIZE = 1000
+# The number of spooled events to record in each commit on replay
+SPOOL_REPLAY_COMMIT_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -45,6 +55,9 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
+# Upper bound for the number of read pool workers and their connections
+MAX_DB_READ_POOL_SIZE = 16
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
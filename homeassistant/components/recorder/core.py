@@ -36,6 +36,7 @@ from homeassistant.core import (
     Event,
     EventStateChangedData,
     HomeAssistant,
+    State,
     callback,
 )
 from homeassistant.helpers.event import (
@@ -44,13 +45,15 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import migration, partition, statistics
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -61,6 +64,10 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPOOL_BACKLOG_THRESHOLD,
+    SPOOL_FLUSH_SIZE,
+    SPOOL_REPLAY_COMMIT_SIZE,
+    SPOOL_RESUME_BACKLOG,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -77,9 +84,10 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, ReadJobTiming
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .spool import SPOOL_FILE, RecorderSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -100,6 +108,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpoolReplayTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -116,6 +125,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -139,6 +149,7 @@ DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
+SPOOL_CHECK_INTERVAL = timedelta(seconds=10)
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -164,6 +175,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        spool: bool = False,
+        db_read_pool_size: int = 0,
+        db_read_url: str | None = None,
+        partition_by_day: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -191,9 +206,32 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # History, logbook and statistics reads run on a separate pool
+        # of workers with their own connections when db_read_pool_size
+        # is set, so they do not queue behind each other or other jobs
+        self.db_read_pool_size = db_read_pool_size
+        self.db_read_url = db_read_url
+        self.read_engine: Engine | None = None
+        self.read_worker_thread_ids: set[int] = set()
+        self.read_job_timings: dict[str, ReadJobTiming] = {}
+        self._read_job_timings_lock = threading.Lock()
+        # The states, events and short term statistics tables are
+        # partitioned by day when partition_by_day is set, so the purge
+        # drops partitions instead of deleting rows
+        self.partition_by_day = partition_by_day
+        self.day_partitioned = False
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
+        # Events are buffered in _spool_buffer and written to the spool
+        # instead of the queue while the backlog is too large
+        self._spool = (
+            RecorderSpool(hass.config.path(STORAGE_DIR, SPOOL_FILE)) if spool else None
+        )
+        self._spool_buffer: list[Event] | None = None
+        self._spool_write: asyncio.Task[None] | None = None
+        self._spool_replaying = False
+
         # The entity_filter is exposed on the recorder instance so that
         # it can be used to see if an entity is being recorded and is called
         # by is_entity_recorder and the sensor recorder.
@@ -211,15 +249,20 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_states_cache = statistics.get_statistics_states_cache(hass)
+        # States only join the statistics states cache once they are committed
+        self._pending_statistics_states: list[State] = []
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -227,6 +270,7 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._spool_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -260,7 +304,16 @@ class Recorder(threading.Thread):
         return self._event_listener is not None
 
     def get_session(self) -> Session:
-        """Get a new sqlalchemy session."""
+        """Get a new sqlalchemy session.
+
+        Sessions created by the read pool workers use the read-only
+        connections of the read pool.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.get_ident() in self.read_worker_thread_ids
+        ):
+            return self._get_read_session()
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
@@ -282,18 +335,32 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.db_read_pool_size:
+            self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+                self.read_worker_thread_ids,
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=self.db_read_pool_size,
+                shutdown_hook=self._shutdown_read_pool,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_read_pool(self) -> None:
+        """Close the read pool connections in the current thread."""
+        if self.read_engine and hasattr(self.read_engine.pool, "shutdown"):
+            self.read_engine.pool.shutdown()
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put = (
+            self._queue.put_nowait if self._spool is None else self._async_queue_event
+        )
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -333,6 +400,95 @@ class Recorder(threading.Thread):
             name="Recorder queue watcher",
         )
 
+    @callback
+    def _async_queue_event(self, event: Event) -> None:
+        """Queue an event or spool it if the backlog is too large."""
+        if (spool_buffer := self._spool_buffer) is not None:
+            spool_buffer.append(event)
+            if len(spool_buffer) >= SPOOL_FLUSH_SIZE:
+                self._async_flush_spool_buffer()
+            return
+        self._queue.put_nowait(event)
+        if not self._spool_replaying and self.backlog >= SPOOL_BACKLOG_THRESHOLD:
+            self._async_start_spooling()
+
+    @callback
+    def _async_start_spooling(self) -> None:
+        """Start writing events to the spool instead of the queue."""
+        assert self._spool is not None
+        _LOGGER.warning(
+            "The recorder backlog queue reached %s events; new events will be "
+            "written to %s until the database catches up",
+            self.backlog,
+            self._spool.path,
+        )
+        self._spool_buffer = []
+        self._spool_listener = async_track_time_interval(
+            self.hass,
+            self._async_check_spool,
+            SPOOL_CHECK_INTERVAL,
+            name="Recorder spool watcher",
+        )
+
+    @callback
+    def _async_flush_spool_buffer(self) -> None:
+        """Write the buffered events to the spool after the previous write."""
+        assert self._spool_buffer is not None
+        events, self._spool_buffer = self._spool_buffer, []
+        self._spool_write = self.hass.async_create_background_task(
+            self._async_write_spool(self._spool_write, events),
+            "recorder spool write",
+        )
+
+    async def _async_write_spool(
+        self, previous_write: asyncio.Task[None] | None, events: list[Event]
+    ) -> None:
+        """Write events to the spool once the previous write is done."""
+        assert self._spool is not None
+        if previous_write:
+            await previous_write
+        try:
+            await self.hass.async_add_executor_job(self._spool.append, events)
+        except OSError:
+            _LOGGER.exception("Error writing %s events to the spool", len(events))
+
+    async def _async_wait_spool_written(self) -> None:
+        """Flush the spool buffer and wait for all writes to finish."""
+        self._async_flush_spool_buffer()
+        while (spool_write := self._spool_write) and not spool_write.done():
+            await spool_write
+
+    @callback
+    def _async_check_spool(self, now: datetime) -> None:
+        """Flush the spool buffer or replay the spool if the database caught up."""
+        if self.backlog >= SPOOL_RESUME_BACKLOG:
+            self._async_flush_spool_buffer()
+            return
+        if self._spool_listener:
+            self._spool_listener()
+            self._spool_listener = None
+        self.hass.async_create_background_task(
+            self._async_stop_spooling(), "recorder stop spooling"
+        )
+
+    async def _async_stop_spooling(self) -> None:
+        """Queue the spooled events for replay and resume queueing events."""
+        await self._async_wait_spool_written()
+        # Nothing may be awaited from here on so no event can be queued
+        # between the replay task and the events buffered during the
+        # last write, which keeps the events in order.
+        assert self._spool_buffer is not None
+        events, self._spool_buffer = self._spool_buffer, None
+        self._spool_replaying = True
+        self.queue_task(SpoolReplayTask())
+        for event in events:
+            self._queue.put_nowait(event)
+
+    @callback
+    def _async_spool_replayed(self) -> None:
+        """Allow spooling again once the spool has been replayed."""
+        self._spool_replaying = False
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -356,6 +512,50 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a job that only reads from the database from within the event loop.
+
+        The job runs on the read pool if one is configured and on the
+        database executor otherwise. Cancelling the returned future
+        before a worker picks the job up drops it.
+        """
+        return self.hass.loop.run_in_executor(
+            self._db_read_executor or self._db_executor,
+            self._run_read_job,
+            target,
+            *args,
+        )
+
+    def get_read_job_timings(self) -> dict[str, dict[str, float]]:
+        """Return the timings of the read jobs by target."""
+        with self._read_job_timings_lock:
+            return {
+                name: {
+                    "count": timing.count,
+                    "total": timing.total,
+                    "max": timing.max,
+                    "mean": timing.total / timing.count,
+                }
+                for name, timing in self.read_job_timings.items()
+            }
+
+    def _run_read_job[_T](self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a read job and record how long it took."""
+        start = time.monotonic()
+        try:
+            return target(*args)
+        finally:
+            elapsed = time.monotonic() - start
+            name = getattr(target, "__qualname__", repr(target))
+            _LOGGER.debug("Read job %s took %.3fs", name, elapsed)
+            with self._read_job_timings_lock:
+                if (timing := self.read_job_timings.get(name)) is None:
+                    timing = self.read_job_timings[name] = ReadJobTiming()
+                timing.add(elapsed)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -418,6 +618,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._spool_listener:
+            self._spool_listener()
+            self._spool_listener = None
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -441,6 +644,9 @@ class Recorder(threading.Thread):
         """Shut down the Recorder at final write."""
         if not self._hass_started.done():
             self._hass_started.set_result(SHUTDOWN_TASK)
+        if self._spool_buffer is not None:
+            # The spooled events are replayed on the next start
+            await self._async_wait_spool_written()
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
@@ -779,6 +985,8 @@ class Recorder(threading.Thread):
             self._dismiss_migration_in_progress()
             self._setup_run()
 
+        self._setup_day_partitions()
+
         # Catch up with missed statistics
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
@@ -806,6 +1014,43 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+    def _setup_day_partitions(self) -> None:
+        """Partition the tables by day if enabled and detect if they are.
+
+        Partitioned tables are detected even if partition_by_day is not set,
+        since their foreign keys are not enforced. Partitions are only
+        created and dropped when partition_by_day is set.
+        """
+        assert self.engine is not None
+        dialect_name = self.engine.dialect.name
+        if dialect_name not in partition.PARTITION_DIALECTS:
+            if self.partition_by_day:
+                _LOGGER.warning(
+                    "Partitioning tables by day is only supported"
+                    " with MySQL, MariaDB and PostgreSQL"
+                )
+            return
+        if self.partition_by_day:
+            if self.use_legacy_events_index:
+                # Partitioned tables can not be referenced by the
+                # foreign key of the legacy event_id column of states
+                _LOGGER.warning(
+                    "Not partitioning the tables by day until states"
+                    " are no longer linked to legacy events"
+                )
+            else:
+                migration.partition_tables_by_day(self, self.get_session)
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            self.day_partitioned = any(
+                partition.is_partitioned(session, dialect_name, partitioned_table.table)
+                for partitioned_table in partition.PARTITIONED_TABLES
+            )
+        if self.day_partitioned and not self.partition_by_day:
+            _LOGGER.warning(
+                "The tables are partitioned by day but partition_by_day is not"
+                " set, old rows are purged row by row"
+            )
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -815,6 +1060,10 @@ class Recorder(threading.Thread):
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
+        # Events spooled before the last shutdown are older
+        # than anything in the queue so they are recorded first
+        if self._spool and self._spool.exists():
+            self._guarded_process_one_task_or_event_or_recover(SpoolReplayTask())
         self._pre_process_startup_events(startup_task_or_events)
         for task in startup_task_or_events:
             self._guarded_process_one_task_or_event_or_recover(task)
@@ -1024,6 +1273,27 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _replay_spool(self) -> None:
+        """Record the spooled events in the order they were spooled."""
+        assert self._spool is not None
+        spool = self._spool
+        try:
+            if not spool.exists():
+                return
+            _LOGGER.info("Recording events spooled to %s", spool.path)
+            count = 0
+            for offset, event in spool.read():
+                self._process_one_event(event)
+                count += 1
+                if count % SPOOL_REPLAY_COMMIT_SIZE == 0:
+                    self._commit_event_session_or_retry()
+                    spool.commit(offset)
+            self._commit_event_session_or_retry()
+            spool.remove()
+            _LOGGER.info("Recorded %s spooled events", count)
+        finally:
+            self.hass.add_job(self._async_spool_replayed)
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1081,6 +1351,8 @@ class Recorder(threading.Thread):
 
         dbstate = States.from_event(event)
         old_state = event.data["old_state"]
+        if entity_removed:
+            self.statistics_states_cache.discard(entity_id)
 
         assert self.event_session is not None
         session = self.event_session
@@ -1150,7 +1422,12 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        # States are inserted in bulk at commit time instead of
+        # going through the unit of work one at a time
+        self._event_session_has_pending_writes = True
+        states_manager.add_pending_insert(dbstate)
+        if (new_state := event.data["new_state"]) is not None:
+            self._pending_statistics_states.append(new_state)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1198,6 +1475,8 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        self.states_manager.insert_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1225,6 +1504,10 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        statistics_states_cache = self.statistics_states_cache
+        for state in self._pending_statistics_states:
+            statistics_states_cache.add(state)
+        self._pending_statistics_states.clear()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1247,6 +1530,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        # The states of a session which is rolled back were never recorded
+        self._pending_statistics_states.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1367,22 +1652,19 @@ class Recorder(threading.Thread):
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
 
-    def _setup_connection(self) -> None:
-        """Ensure database is ready to fly."""
+    def _setup_read_recorder_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read pool."""
+        assert self.read_engine is not None
+        dialect_name = self.read_engine.dialect.name
+        setup_connection_for_dialect(self, dialect_name, dbapi_connection, False)
+        setup_read_only_connection_for_dialect(dialect_name, dbapi_connection)
+
+    def _engine_kwargs(self, db_url: str) -> dict[str, Any]:
+        """Return the dialect specific arguments to create an engine."""
         kwargs: dict[str, Any] = {}
-        self._completed_first_database_setup = False
-
-        if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
-            kwargs["connect_args"] = {"check_same_thread": False}
-            kwargs["poolclass"] = MutexPool
-            MutexPool.pool_lock = threading.RLock()
-            kwargs["pool_reset_on_return"] = None
-        elif self.db_url.startswith(SQLITE_URL_PREFIX):
-            kwargs["poolclass"] = RecorderPool
-            kwargs["recorder_and_worker_thread_ids"] = (
-                self.recorder_and_worker_thread_ids
-            )
-        elif self.db_url.startswith(
+        if db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
                 MARIADB_PYMYSQL_URL_PREFIX,
@@ -1401,8 +1683,25 @@ class Recorder(threading.Thread):
                     kwargs["connect_args"]["conv"] = build_mysqldb_conv()
 
         # Disable extended logging for non SQLite databases
-        if not self.db_url.startswith(SQLITE_URL_PREFIX):
+        if not db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
+        return kwargs
+
+    def _setup_connection(self) -> None:
+        """Ensure database is ready to fly."""
+        kwargs = self._engine_kwargs(self.db_url)
+        self._completed_first_database_setup = False
+
+        if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
+            kwargs["connect_args"] = {"check_same_thread": False}
+            kwargs["poolclass"] = MutexPool
+            MutexPool.pool_lock = threading.RLock()
+            kwargs["pool_reset_on_return"] = None
+        elif self.db_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["poolclass"] = RecorderPool
+            kwargs["recorder_and_worker_thread_ids"] = (
+                self.recorder_and_worker_thread_ids
+            )
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1417,6 +1716,32 @@ class Recorder(threading.Thread):
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        if self.db_read_pool_size:
+            self._setup_read_connection()
+
+    def _setup_read_connection(self) -> None:
+        """Set up the read-only connections of the read pool."""
+        db_url = self.db_read_url or self.db_url
+        if db_url == SQLITE_URL_PREFIX or ":memory:" in db_url:
+            # An in-memory database can only be shared through
+            # the connection of the recorder
+            self._get_read_session = self._get_session
+            return
+
+        kwargs = self._engine_kwargs(db_url)
+        if db_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["poolclass"] = RecorderPool
+            kwargs["recorder_and_worker_thread_ids"] = self.read_worker_thread_ids
+        kwargs["pool_size"] = self.db_read_pool_size
+        assert not self.read_engine
+        self.read_engine = create_engine(db_url, **kwargs, future=True)
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_read_recorder_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read database")
 
     def _close_connection(self) -> None:
         """Close the connection."""
@@ -1424,6 +1749,10 @@ class Recorder(threading.Thread):
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1470,13 +1799,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
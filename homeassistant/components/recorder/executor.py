@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from concurrent.futures.thread import _threads_queues, _worker
+from dataclasses import dataclass
 import threading
 from typing import Any
 import weakref
@@ -23,6 +24,21 @@ def _worker_with_shutdown_hook(
     shutdown_hook()
 
 
+@dataclass(slots=True)
+class ReadJobTiming:
+    """Timing of the jobs that ran on the read pool for one target."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Add the time a job took."""
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
 class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
     """A database instance that will not deadlock on shutdown."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
 from typing import Any
 
@@ -17,6 +18,7 @@ from .modern import (
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    iter_significant_states as _modern_iter_significant_states,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -28,6 +30,7 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "iter_significant_states",
     "state_changes_during_period",
 ]
 
@@ -115,6 +118,53 @@ def get_significant_states(
     )
 
 
+def iter_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    batch_size: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Generator[dict[str, list[State | dict[str, Any]]]]:
+    """Generate the significant states during a time period in batches."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        # The legacy schema is only used until the migration is done
+        # so it is not worth streaming
+        yield _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+        return
+    yield from _modern_iter_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        batch_size,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -134,18 +135,15 @@ def get_significant_states(
         )
 
 
-def _significant_states_stmt(
+def _significant_states_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
-    single_metadata_id: int | None,
     metadata_ids: list[int],
     metadata_ids_in_significant_domains: list[int],
     significant_changes_only: bool,
     no_attributes: bool,
-    include_start_time_state: bool,
-    run_start_ts: float | None,
-) -> Select | CompoundSelect:
-    """Query the database for significant state changes."""
+) -> Select:
+    """Query the database for significant state changes during the period."""
     include_last_changed = not significant_changes_only
     stmt = _stmt_and_join_attributes(no_attributes, include_last_changed, False)
     if significant_changes_only:
@@ -172,6 +170,30 @@ def _significant_states_stmt(
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
+    return stmt
+
+
+def _significant_states_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    single_metadata_id: int | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    include_start_time_state: bool,
+    run_start_ts: float | None,
+) -> Select | CompoundSelect:
+    """Query the database for significant state changes."""
+    include_last_changed = not significant_changes_only
+    stmt = _significant_states_period_stmt(
+        start_time_ts,
+        end_time_ts,
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        significant_changes_only,
+        no_attributes,
+    )
     if not include_start_time_state or not run_start_ts:
         return stmt.order_by(States.metadata_id, States.last_updated_ts)
     unioned_subquery = union_all(
@@ -200,6 +222,108 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
+def _significant_states_batch_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    after_metadata_id: int | None,
+    after_last_updated_ts: float,
+    after_state_id: int,
+    batch_size: int,
+) -> Select:
+    """Query a batch of significant state changes during the period.
+
+    The rows are ordered by state_id after the entity and the time,
+    so a batch starts right after the last row of the previous batch.
+    """
+    stmt = _significant_states_period_stmt(
+        start_time_ts,
+        end_time_ts,
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        significant_changes_only,
+        no_attributes,
+    ).add_columns(States.state_id)
+    if after_metadata_id:
+        stmt = stmt.filter(
+            (States.metadata_id > after_metadata_id)
+            | (
+                (States.metadata_id == after_metadata_id)
+                & (
+                    (States.last_updated_ts > after_last_updated_ts)
+                    | (
+                        (States.last_updated_ts == after_last_updated_ts)
+                        & (States.state_id > after_state_id)
+                    )
+                )
+            )
+        )
+    return stmt.order_by(
+        States.metadata_id, States.last_updated_ts, States.state_id
+    ).limit(batch_size)
+
+
+def _significant_states_batch_lambda_stmt(
+    start_time_ts: float,
+    end_time_ts: float | None,
+    metadata_ids: list[int],
+    metadata_ids_in_significant_domains: list[int],
+    significant_changes_only: bool,
+    no_attributes: bool,
+    after_metadata_id: int | None,
+    after_last_updated_ts: float,
+    after_state_id: int,
+    batch_size: int,
+) -> StatementLambdaElement:
+    """Return the statement to select a batch of significant state changes."""
+    return lambda_stmt(
+        lambda: _significant_states_batch_stmt(
+            start_time_ts,
+            end_time_ts,
+            metadata_ids,
+            metadata_ids_in_significant_domains,
+            significant_changes_only,
+            no_attributes,
+            after_metadata_id,
+            after_last_updated_ts,
+            after_state_id,
+            batch_size,
+        ),
+        track_on=[
+            bool(metadata_ids_in_significant_domains),
+            bool(end_time_ts),
+            significant_changes_only,
+            no_attributes,
+            bool(after_metadata_id),
+        ],
+    )
+
+
+def _start_time_states_lambda_stmt(
+    run_start_ts: float,
+    start_time_ts: float,
+    metadata_ids: list[int],
+    no_attributes: bool,
+    include_last_changed: bool,
+) -> StatementLambdaElement:
+    """Return the statement to select the states at the start time."""
+    single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    return lambda_stmt(
+        lambda: _get_start_time_state_stmt(
+            run_start_ts,
+            start_time_ts,
+            single_metadata_id,
+            metadata_ids,
+            no_attributes,
+            include_last_changed,
+        ),
+        track_on=[bool(single_metadata_id), no_attributes, include_last_changed],
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -285,6 +409,111 @@ def get_significant_states_with_session(
     )
 
 
+def iter_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    batch_size: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Generator[dict[str, list[State | dict[str, Any]]]]:
+    """Generate the significant states during a period in batches.
+
+    Each batch of at most batch_size rows is read in its own session,
+    which is closed before the batch is generated, so no session or
+    cursor is kept open between batches and the memory used does not
+    depend on the number of states in the period. The states of an
+    entity may be split over several batches, which together are the
+    same as the states get_significant_states returns.
+    """
+    instance = get_instance(hass)
+    start_time_ts = start_time.timestamp()
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+            return
+        oldest_ts: float | None = None
+        if include_start_time_state and not (
+            oldest_ts := _get_oldest_possible_ts(hass, start_time)
+        ):
+            include_start_time_state = False
+        # The states at the start time are read with the first batch
+        start_rows: Iterable[Row] = ()
+        if include_start_time_state:
+            assert oldest_ts is not None
+            start_rows = sorted(
+                execute_stmt_lambda_element(
+                    session,
+                    _start_time_states_lambda_stmt(
+                        oldest_ts,
+                        start_time_ts,
+                        metadata_ids,
+                        no_attributes,
+                        not significant_changes_only,
+                    ),
+                    orm_rows=False,
+                ),
+                key=itemgetter(_FIELD_MAP["metadata_id"]),
+            )
+    metadata_ids_in_significant_domains: list[int] = []
+    if significant_changes_only:
+        metadata_ids_in_significant_domains = [
+            metadata_id
+            for entity_id, metadata_id in entity_id_to_metadata_id.items()
+            if metadata_id is not None
+            and split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+        ]
+    last_states: dict[str, str | None] = {}
+    after_metadata_id: int | None = None
+    after_last_updated_ts = 0.0
+    after_state_id = 0
+    while True:
+        stmt = _significant_states_batch_lambda_stmt(
+            start_time_ts,
+            end_time_ts,
+            metadata_ids,
+            metadata_ids_in_significant_domains,
+            significant_changes_only,
+            no_attributes,
+            after_metadata_id,
+            after_last_updated_ts,
+            after_state_id,
+            batch_size,
+        )
+        with session_scope(hass=hass, read_only=True) as session:
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        if states := {
+            entity_id: states
+            for entity_id, states in _sorted_states_to_dict(
+                chain(start_rows, rows),
+                start_time_ts if include_start_time_state else None,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes=no_attributes,
+                last_states=last_states,
+            ).items()
+            if states
+        }:
+            yield states
+        if len(rows) < batch_size:
+            return
+        start_rows = ()
+        last_row = rows[-1]
+        after_metadata_id = last_row.metadata_id
+        after_last_updated_ts = last_row.last_updated_ts
+        after_state_id = last_row.state_id
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -679,6 +908,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    last_states: dict[str, str | None] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -690,6 +920,10 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When the states are converted in batches, last_states carries the
+    last minimal response state of each entity from one batch to the
+    next, so only the first batch has a full first state for an entity.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -757,7 +991,10 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
+        if last_states is not None and entity_id in last_states:
+            # The first state was in an earlier batch
+            prev_state = last_states[entity_id]
+        elif not ent_results:
             if (first_state := next(group, None)) is None:
                 continue
             prev_state = first_state[state_idx]
@@ -792,22 +1029,23 @@ def _sorted_states_to_dict(
                     if (state := row[state_idx]) != prev_state
                 ]
             )
-            continue
-
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            ]
-        )
+        else:
+            # Non-compressed state format returns an ISO formatted string
+            _utc_from_timestamp = dt_util.utc_from_timestamp
+            ent_results.extend(
+                [
+                    {
+                        attr_state: (prev_state := state),
+                        attr_time: _utc_from_timestamp(
+                            row[last_updated_ts_idx]
+                        ).isoformat(),
+                    }
+                    for row in group
+                    if (state := row[state_idx]) != prev_state
+                ]
+            )
+        if last_states is not None:
+            last_states[entity_id] = prev_state
 
     if descending:
         for ent_results in result.values():
@@ -32,6 +32,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
+from . import partition
 from .auto_repairs.events.schema import (
     correct_db_schema as events_correct_db_schema,
     validate_db_schema as events_validate_db_schema,
@@ -2842,3 +2843,381 @@ def rebuild_sqlite_table(
         with session_scope(session=session_maker()) as session:
             # Step 12 - Re-enable foreign keys
             session.connection().execute(text("PRAGMA foreign_keys=ON"))
+
+
+def partition_tables_by_day(
+    instance: Recorder, session_maker: Callable[[], Session]
+) -> bool:
+    """Partition the states, events and short term statistics tables by day.
+
+    This must only be called after all migrations are complete
+    and the database is in a consistent state, and only when
+    partition_by_day is set since it can not be undone.
+    """
+    if instance.dialect_name not in partition.PARTITION_DIALECTS:
+        raise RuntimeError(
+            f"partition_tables_by_day not supported for {instance.dialect_name}"
+        )
+
+    with session_scope(session=session_maker()) as session:
+        migration_changes = _get_migration_changes(session)
+    migrator = PartitionTablesByDayMigration(instance.schema_version, migration_changes)
+    try:
+        migrator.migrate_all(instance, session_maker)
+    except SQLAlchemyError:
+        _LOGGER.exception("Error partitioning tables by day")
+        # Swallow the exception since we do not want to ever raise
+        # an integrity error as it would cause the database
+        # to be discarded and recreated from scratch
+        return False
+    return True
+
+
+class PartitionTablesByDayMigration(BaseOffLineMigration):
+    """Migration to partition the states, events and short term statistics tables.
+
+    Unlike the other migrations it only runs when partition_by_day is set.
+
+    All existing rows are kept in the first partition, which is
+    dropped by the purge once all of them are older than purge_keep_days.
+    Each step checks if it was done by an earlier attempt, so a migration
+    that failed part way resumes where it stopped.
+    """
+
+    migration_id = "partition_tables_by_day"
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Partition the tables, returns if the migration is completed."""
+        session_maker = instance.get_session
+        engine = instance.engine
+        assert engine is not None, "engine should never be None"
+        day = partition.partition_day(time())
+        for partitioned_table in partition.PARTITIONED_TABLES:
+            table = partitioned_table.table
+            with session_scope(session=session_maker(), read_only=True) as session:
+                if _is_partitioned_by_day(session, engine, partitioned_table):
+                    continue
+            _LOGGER.warning(
+                "Partitioning table %s by day; %s", table, MIGRATION_NOTE_WHILE
+            )
+            if engine.dialect.name == SupportedDialect.MYSQL:
+                _partition_mysql_table_by_day(
+                    session_maker, engine, partitioned_table, day
+                )
+            else:
+                _partition_postgresql_table_by_day(
+                    session_maker, engine, partitioned_table, day
+                )
+            _LOGGER.warning("Partitioning table %s finished", table)
+        return DataMigrationStatus(needs_migrate=False, migration_done=True)
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        engine = instance.engine
+        assert engine is not None, "engine should never be None"
+        done = all(
+            _is_partitioned_by_day(session, engine, partitioned_table)
+            for partitioned_table in partition.PARTITIONED_TABLES
+        )
+        return DataMigrationStatus(needs_migrate=not done, migration_done=done)
+
+
+def _schema_foreign_keys(
+    table: str, self_references: bool = True
+) -> list[tuple[str, str, str | None, str | None]]:
+    """Return the foreign keys of a table in the schema."""
+    return [
+        (
+            table,
+            foreign_key.parent.name,
+            foreign_key.column.table.name,
+            foreign_key.column.name,
+        )
+        for foreign_key in Base.metadata.tables[table].foreign_keys
+        if self_references or foreign_key.column.table.name != table
+    ]
+
+
+def _is_partitioned_by_day(
+    session: Session, engine: Engine, partitioned_table: partition.PartitionedTable
+) -> bool:
+    """Return if a table is partitioned by day and has all its foreign keys."""
+    table = partitioned_table.table
+    if not partition.is_partitioned(session, engine.dialect.name, table):
+        return False
+    if engine.dialect.name == SupportedDialect.MYSQL:
+        # Partitioned InnoDB tables do not support foreign keys
+        return True
+    existing_columns = {
+        column
+        for foreign_key in sqlalchemy.inspect(engine).get_foreign_keys(table)
+        for column in foreign_key["constrained_columns"]
+    }
+    return all(
+        column in existing_columns
+        for _, column, _, _ in _schema_foreign_keys(table, self_references=False)
+    )
+
+
+def _drop_all_foreign_key_constraints(
+    session_maker: Callable[[], Session], engine: Engine, table: str
+) -> None:
+    """Drop all foreign key constraints of a table."""
+    inspector = sqlalchemy.inspect(engine)
+    for column in {
+        column
+        for foreign_key in inspector.get_foreign_keys(table)
+        for column in foreign_key["constrained_columns"]
+    }:
+        _drop_foreign_key_constraints(session_maker, engine, table, column)
+
+
+def _restore_foreign_keys_if_not_partitioned(
+    session_maker: Callable[[], Session], engine: Engine, table: str
+) -> None:
+    """Restore the foreign keys of a table which could not be partitioned."""
+    with session_scope(session=session_maker(), read_only=True) as session:
+        if partition.is_partitioned(session, engine.dialect.name, table):
+            return
+    _restore_foreign_key_constraints(session_maker, engine, _schema_foreign_keys(table))
+
+
+def _partition_mysql_table_by_day(
+    session_maker: Callable[[], Session],
+    engine: Engine,
+    partitioned_table: partition.PartitionedTable,
+    day: int,
+) -> None:
+    """Partition a MySQL table by day.
+
+    MySQL only partitions on integer columns that are part of every
+    unique key and does not allow foreign keys on partitioned tables,
+    so the day is stored in an extra column filled by a trigger and
+    added to the primary key and unique indexes.
+
+    MySQL commits every schema change right away, so each step is
+    skipped if it is already done and the foreign keys are restored
+    if the table could not be partitioned.
+    """
+    table = partitioned_table.table
+    _drop_all_foreign_key_constraints(session_maker, engine, table)
+    try:
+        _partition_mysql_table_by_day_steps(
+            session_maker, engine, partitioned_table, day
+        )
+    except SQLAlchemyError:
+        _restore_foreign_keys_if_not_partitioned(session_maker, engine, table)
+        raise
+
+
+def _partition_mysql_table_by_day_steps(
+    session_maker: Callable[[], Session],
+    engine: Engine,
+    partitioned_table: partition.PartitionedTable,
+    day: int,
+) -> None:
+    """Run the steps to partition a MySQL table which are not done yet."""
+    table = partitioned_table.table
+    id_column = partitioned_table.id_column
+    day_column = partition.PARTITION_DAY_COLUMN
+    trigger = f"{table}_{day_column}"
+    inspector = sqlalchemy.inspect(engine)
+
+    if day_column not in {column["name"] for column in inspector.get_columns(table)}:
+        with session_scope(session=session_maker()) as session:
+            session.execute(
+                text(
+                    f"ALTER TABLE {table}"
+                    f" ADD COLUMN {day_column} INT NOT NULL DEFAULT 0"
+                )
+            )
+
+    if day_column not in inspector.get_pk_constraint(table)["constrained_columns"]:
+        with session_scope(session=session_maker()) as session:
+            session.execute(
+                text(
+                    f"ALTER TABLE {table} DROP PRIMARY KEY,"
+                    f" ADD PRIMARY KEY ({id_column}, {day_column})"
+                )
+            )
+
+    unique_indexes = {
+        index["name"]: index["column_names"]
+        for index in inspector.get_indexes(table)
+        if index["unique"]
+    }
+    for index in Base.metadata.tables[table].indexes:
+        if not index.unique or day_column in unique_indexes.get(index.name, ()):
+            continue
+        columns = ", ".join([column.name for column in index.columns])
+        drop = f"DROP INDEX {index.name}, " if index.name in unique_indexes else ""
+        with session_scope(session=session_maker()) as session:
+            session.execute(
+                text(
+                    f"ALTER TABLE {table} {drop}"
+                    f"ADD UNIQUE INDEX {index.name} ({columns}, {day_column})"
+                )
+            )
+
+    with session_scope(session=session_maker()) as session:
+        if not session.execute(
+            text(
+                "SELECT 1 FROM information_schema.TRIGGERS"
+                " WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = :trigger"
+            ),
+            {"trigger": trigger},
+        ).first():
+            # Creating a trigger needs the SUPER privilege or
+            # log_bin_trust_function_creators when binary logging is enabled
+            session.execute(
+                text(
+                    f"CREATE TRIGGER {trigger} BEFORE INSERT ON {table}"
+                    f" FOR EACH ROW SET NEW.{day_column} ="
+                    f" FLOOR(NEW.{partitioned_table.column} /"
+                    f" {partition.SECONDS_PER_DAY})"
+                )
+            )
+
+    with session_scope(session=session_maker()) as session:
+        if partition.is_partitioned(session, SupportedDialect.MYSQL, table):
+            return
+        definitions = [
+            partition.mysql_partition_definition(partition_day)
+            for partition_day in range(day, day + partition.PARTITION_DAYS_AHEAD + 1)
+        ]
+        definitions.append(partition.mysql_max_partition_definition())
+        session.execute(
+            text(
+                f"ALTER TABLE {table} PARTITION BY RANGE ({day_column})"
+                f" ({', '.join(definitions)})"
+            )
+        )
+
+
+def _partition_postgresql_table_by_day(
+    session_maker: Callable[[], Session],
+    engine: Engine,
+    partitioned_table: partition.PartitionedTable,
+    day: int,
+) -> None:
+    """Partition a PostgreSQL table by day.
+
+    The table is renamed and attached as the first partition of a new
+    partitioned table, so the existing rows are not copied.
+
+    The table is replaced in a single transaction. The foreign keys are
+    dropped before and restored after it, or restored as they were if
+    the table could not be partitioned.
+    """
+    table = partitioned_table.table
+    with session_scope(session=session_maker(), read_only=True) as session:
+        partitioned = partition.is_partitioned(
+            session, SupportedDialect.POSTGRESQL, table
+        )
+    if not partitioned:
+        _drop_all_foreign_key_constraints(session_maker, engine, table)
+        try:
+            _replace_postgresql_table_with_partitioned_table(
+                session_maker, engine, partitioned_table, day
+            )
+        except SQLAlchemyError:
+            _restore_foreign_keys_if_not_partitioned(session_maker, engine, table)
+            raise
+    # Foreign keys can not reference a partitioned table
+    # unless they include the partition column, so links
+    # between rows of the same table are no longer enforced
+    _restore_foreign_key_constraints(
+        session_maker, engine, _schema_foreign_keys(table, self_references=False)
+    )
+
+
+def _replace_postgresql_table_with_partitioned_table(
+    session_maker: Callable[[], Session],
+    engine: Engine,
+    partitioned_table: partition.PartitionedTable,
+    day: int,
+) -> None:
+    """Replace a PostgreSQL table with a table partitioned by day."""
+    table = partitioned_table.table
+    id_column = partitioned_table.id_column
+    column = partitioned_table.column
+    legacy_table = partition.postgresql_partition_table(table, day)
+    inspector = sqlalchemy.inspect(engine)
+    primary_key = inspector.get_pk_constraint(table)["name"]
+    indexes = [index["name"] for index in inspector.get_indexes(table)]
+
+    with session_scope(session=session_maker()) as session:
+        session.execute(text(f"ALTER TABLE {table} RENAME TO {legacy_table}"))
+        session.execute(
+            text(
+                f"ALTER TABLE {legacy_table} ALTER COLUMN {id_column}"
+                " DROP IDENTITY IF EXISTS"
+            )
+        )
+        session.execute(
+            text(f"ALTER TABLE {legacy_table} ALTER COLUMN {id_column} DROP DEFAULT")
+        )
+        session.execute(
+            text(f"UPDATE {legacy_table} SET {column} = 0 WHERE {column} IS NULL")  # noqa: S608
+        )
+        session.execute(
+            text(f"ALTER TABLE {legacy_table} ALTER COLUMN {column} SET NOT NULL")
+        )
+        session.execute(
+            text(f"ALTER TABLE {legacy_table} DROP CONSTRAINT {primary_key}")
+        )
+        # The indexes are attached to the indexes of the partitioned
+        # table when they are created below instead of being rebuilt
+        for index_name in indexes:
+            session.execute(
+                text(f"ALTER INDEX {index_name} RENAME TO {index_name}_p{day}")
+            )
+
+        session.execute(
+            text(
+                f"CREATE TABLE {table} (LIKE {legacy_table} INCLUDING DEFAULTS)"
+                f" PARTITION BY RANGE ({column})"
+            )
+        )
+        sequence = f"{table}_{id_column}_seq"
+        session.execute(text(f"DROP SEQUENCE IF EXISTS {sequence}"))
+        session.execute(
+            text(f"CREATE SEQUENCE {sequence} OWNED BY {table}.{id_column}")
+        )
+        session.execute(
+            text(
+                f"SELECT setval('{sequence}',"  # noqa: S608
+                f" COALESCE(MAX({id_column}), 0) + 1, false) FROM {legacy_table}"
+            )
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {table} ALTER COLUMN {id_column}"
+                f" SET DEFAULT nextval('{sequence}')"
+            )
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {table} ATTACH PARTITION {legacy_table}"
+                f" {partition.postgresql_partition_bounds(day, first=True)}"
+            )
+        )
+        session.execute(
+            text(f"ALTER TABLE {table} ADD PRIMARY KEY ({id_column}, {column})")
+        )
+        partition.create_partitions(
+            session,
+            SupportedDialect.POSTGRESQL,
+            table,
+            range(day + 1, day + partition.PARTITION_DAYS_AHEAD + 1),
+        )
+        session.execute(
+            text(
+                f"CREATE TABLE {table}_{partition.POSTGRESQL_DEFAULT_PARTITION_SUFFIX}"
+                f" PARTITION OF {table} DEFAULT"
+            )
+        )
+        for index in Base.metadata.tables[table].indexes:
+            index.create(session.connection())
@@ -0,0 +1,310 @@
+"""Day partitioning of the states, events and short term statistics tables.
+
+When the tables are partitioned, purging old rows drops whole partitions
+instead of deleting rows in batches, which is a metadata only operation
+for MySQL, MariaDB and PostgreSQL.
+
+Each partition is named after the last day it holds rows for. The first
+partition also holds all rows that were recorded before the table was
+partitioned.
+
+Partitioning is opt-in with the partition_by_day recorder option. Foreign
+keys are not enforced on the partitioned tables, so the purge clears the
+references to rows in dropped partitions itself.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+
+import homeassistant.util.dt as dt_util
+
+from .const import SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, TABLE_STATISTICS_SHORT_TERM
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+# Partitions are created this many days ahead so rows
+# never end up in the catch-all partition
+PARTITION_DAYS_AHEAD = 3
+
+# MySQL can only partition on integer columns, so the day is stored
+# in an extra column kept up to date by a trigger
+PARTITION_DAY_COLUMN = "partition_day"
+
+# Catch-all partitions for rows newer than the last partition
+MYSQL_MAX_PARTITION = "pmax"
+POSTGRESQL_DEFAULT_PARTITION_SUFFIX = "pdefault"
+
+PARTITION_DIALECTS = (SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL)
+
+_PARTITION_NAME = re.compile(r"p(\d{8})$")
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedTable:
+    """A table partitioned by day."""
+
+    table: str
+    # The primary key
+    id_column: str
+    # The timestamp column rows are partitioned on
+    column: str
+    # Columns of rows in a dropped partition that may
+    # leave rows in another table unreferenced
+    referenced_column: str | None = None
+    # Column of rows in the same table that references the primary key
+    self_reference_column: str | None = None
+
+
+PARTITIONED_TABLES = (
+    PartitionedTable(
+        TABLE_STATES, "state_id", "last_updated_ts", "attributes_id", "old_state_id"
+    ),
+    PartitionedTable(TABLE_EVENTS, "event_id", "time_fired_ts", "data_id"),
+    PartitionedTable(TABLE_STATISTICS_SHORT_TERM, "id", "start_ts"),
+)
+
+
+def partition_day(timestamp: float) -> int:
+    """Return the day number of a UTC timestamp."""
+    return int(timestamp // SECONDS_PER_DAY)
+
+
+def partition_name(day: int) -> str:
+    """Return the name of the partition holding the rows of a day."""
+    return f"p{dt_util.utc_from_timestamp(day * SECONDS_PER_DAY):%Y%m%d}"
+
+
+def partition_day_from_name(name: str) -> int | None:
+    """Return the day of a partition or None if it is not a day partition."""
+    if not (match := _PARTITION_NAME.search(name)):
+        return None
+    return partition_day(
+        datetime.strptime(match.group(1), "%Y%m%d")
+        .replace(tzinfo=dt_util.UTC)
+        .timestamp()
+    )
+
+
+def postgresql_partition_table(table: str, day: int) -> str:
+    """Return the name of the PostgreSQL table of a partition."""
+    return f"{table}_{partition_name(day)}"
+
+
+def mysql_partition_definition(day: int) -> str:
+    """Return the MySQL definition of a partition."""
+    return f"PARTITION {partition_name(day)} VALUES LESS THAN ({day + 1})"
+
+
+def mysql_max_partition_definition() -> str:
+    """Return the MySQL definition of the catch-all partition."""
+    return f"PARTITION {MYSQL_MAX_PARTITION} VALUES LESS THAN MAXVALUE"
+
+
+def postgresql_partition_bounds(day: int, first: bool = False) -> str:
+    """Return the PostgreSQL bounds of a partition."""
+    start = "MINVALUE" if first else str(day * SECONDS_PER_DAY)
+    return f"FOR VALUES FROM ({start}) TO ({(day + 1) * SECONDS_PER_DAY})"
+
+
+def is_partitioned(session: Session, dialect_name: str | None, table: str) -> bool:
+    """Return if a table is partitioned by day."""
+    if dialect_name == SupportedDialect.MYSQL:
+        return bool(get_partition_days(session, dialect_name, table))
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        return bool(
+            session.execute(
+                text(
+                    "SELECT 1 FROM pg_partitioned_table"
+                    " WHERE partrelid = to_regclass(:table)"
+                ),
+                {"table": table},
+            ).first()
+        )
+    return False
+
+
+def get_partition_days(
+    session: Session, dialect_name: str | None, table: str
+) -> list[int]:
+    """Return the days of the partitions of a table, oldest first."""
+    if dialect_name == SupportedDialect.MYSQL:
+        query = text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS"
+            " WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            " AND PARTITION_NAME IS NOT NULL"
+        )
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        query = text(
+            "SELECT child.relname FROM pg_inherits"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE pg_inherits.inhparent = to_regclass(:table)"
+        )
+    else:
+        return []
+    return sorted(
+        day
+        for (name,) in session.execute(query, {"table": table})
+        if (day := partition_day_from_name(name)) is not None
+    )
+
+
+def create_partitions(
+    session: Session, dialect_name: str | None, table: str, days: Iterable[int]
+) -> None:
+    """Create the partitions of a table for days."""
+    if not (days := sorted(days)):
+        return
+    _LOGGER.debug("Creating %s partitions %s", table, days)
+    if dialect_name == SupportedDialect.MYSQL:
+        definitions = [mysql_partition_definition(day) for day in days]
+        definitions.append(mysql_max_partition_definition())
+        session.execute(
+            text(
+                f"ALTER TABLE {table} REORGANIZE PARTITION {MYSQL_MAX_PARTITION}"
+                f" INTO ({', '.join(definitions)})"
+            )
+        )
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        for day in days:
+            session.execute(
+                text(
+                    "CREATE TABLE IF NOT EXISTS"
+                    f" {postgresql_partition_table(table, day)}"
+                    f" PARTITION OF {table} {postgresql_partition_bounds(day)}"
+                )
+            )
+
+
+def drop_partitions(
+    session: Session, dialect_name: str | None, table: str, days: Iterable[int]
+) -> None:
+    """Drop the partitions of a table for days."""
+    if not (days := sorted(days)):
+        return
+    _LOGGER.debug("Dropping %s partitions %s", table, days)
+    if dialect_name == SupportedDialect.MYSQL:
+        names = ", ".join(partition_name(day) for day in days)
+        session.execute(text(f"ALTER TABLE {table} DROP PARTITION {names}"))
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        for day in days:
+            session.execute(
+                text(f"DROP TABLE IF EXISTS {postgresql_partition_table(table, day)}")
+            )
+
+
+def select_ids_in_partition(
+    session: Session, dialect_name: str | None, table: str, day: int, column: str
+) -> set[int]:
+    """Return the distinct ids in a column of the rows of a partition."""
+    if dialect_name == SupportedDialect.MYSQL:
+        source = f"{table} PARTITION ({partition_name(day)})"
+    else:
+        source = postgresql_partition_table(table, day)
+    return {
+        row_id
+        for (row_id,) in session.execute(
+            text(
+                f"SELECT DISTINCT {column} FROM {source}"  # noqa: S608
+                f" WHERE {column} IS NOT NULL"
+            )
+        )
+    }
+
+
+def disconnect_rows_in_partition(
+    session: Session,
+    dialect_name: str | None,
+    partitioned_table: PartitionedTable,
+    day: int,
+    before_day: int,
+) -> None:
+    """Clear the references of remaining rows to the rows of a partition.
+
+    Only rows in partitions of before_day and later remain after the purge.
+    """
+    table = partitioned_table.table
+    id_column = partitioned_table.id_column
+    column = partitioned_table.self_reference_column
+    if dialect_name == SupportedDialect.MYSQL:
+        # MySQL can not select from the table being updated
+        # unless the rows are selected into a derived table
+        partition_ids = (
+            f"SELECT {id_column} FROM (SELECT {id_column} FROM {table}"  # noqa: S608
+            f" PARTITION ({partition_name(day)})) AS partition_ids"
+        )
+        remaining = f"{PARTITION_DAY_COLUMN} >= {before_day}"
+    else:
+        partition_ids = (
+            f"SELECT {id_column} FROM {postgresql_partition_table(table, day)}"  # noqa: S608
+        )
+        remaining = f"{partitioned_table.column} >= {before_day * SECONDS_PER_DAY}"
+    result = session.execute(
+        text(
+            f"UPDATE {table} SET {column} = NULL"  # noqa: S608
+            f" WHERE {remaining} AND {column} IN ({partition_ids})"
+        )
+    )
+    _LOGGER.debug("Updated %s %s to remove %s", result.rowcount, table, column)
+
+
+def add_partitions_ahead(instance: Recorder, session: Session) -> None:
+    """Create the partitions for the next days if they do not exist yet."""
+    dialect_name = instance.dialect_name
+    last_day = partition_day(dt_util.utcnow().timestamp()) + PARTITION_DAYS_AHEAD
+    for partitioned_table in PARTITIONED_TABLES:
+        table = partitioned_table.table
+        days = get_partition_days(session, dialect_name, table)
+        first_day = max(days[-1] + 1 if days else 0, last_day - PARTITION_DAYS_AHEAD)
+        create_partitions(session, dialect_name, table, range(first_day, last_day + 1))
+
+
+def purge_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> tuple[set[int], set[int]]:
+    """Drop the partitions that only hold rows older than purge_before.
+
+    Returns the attributes_ids and data_ids the dropped rows referenced,
+    which may no longer be used by any remaining rows.
+    """
+    dialect_name = instance.dialect_name
+    before_day = partition_day(purge_before.timestamp())
+    referenced_ids: dict[str, set[int]] = {}
+    for partitioned_table in PARTITIONED_TABLES:
+        table = partitioned_table.table
+        days = [
+            day
+            for day in get_partition_days(session, dialect_name, table)
+            if day < before_day
+        ]
+        if not days:
+            continue
+        if column := partitioned_table.referenced_column:
+            ids = referenced_ids.setdefault(column, set())
+            for day in days:
+                ids |= select_ids_in_partition(
+                    session, dialect_name, table, day, column
+                )
+        if partitioned_table.self_reference_column:
+            for day in days:
+                disconnect_rows_in_partition(
+                    session, dialect_name, partitioned_table, day, before_day
+                )
+        drop_partitions(session, dialect_name, table, days)
+    return referenced_ids.get("attributes_id", set()), referenced_ids.get(
+        "data_id", set()
+    )
@@ -11,10 +11,12 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import SECONDS_PER_DAY, partition_day, purge_partitions
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -72,14 +74,30 @@ def purge_old_data(
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
     with session_scope(session=instance.get_session()) as session:
+        legacy_format = instance.use_legacy_events_index and _purging_legacy_format(
+            session
+        )
+        rows_purge_before = purge_before
+        # Partitions are not dropped while states may still be linked
+        # to events, since the link is not enforced by a foreign key
+        if instance.partition_by_day and instance.day_partitioned and not legacy_format:
+            _purge_partitions(instance, session, purge_before)
+            # Rows in the partition of the day of purge_before are dropped
+            # with it on the next day, so only rows that were recorded
+            # before the tables were partitioned are deleted row by row
+            rows_purge_before = dt_util.utc_from_timestamp(
+                partition_day(purge_before.timestamp()) * SECONDS_PER_DAY
+            )
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
+        if legacy_format:
             _LOGGER.debug(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, rows_purge_before
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,17 +105,17 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, rows_purge_before
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, rows_purge_before
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
         short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
+            session, rows_purge_before, instance.max_bind_vars
         )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
@@ -130,6 +148,16 @@ def purge_old_data(
     return True
 
 
+def _purge_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the partitions older than purge_before and unused shared data."""
+    attributes_ids, data_ids = purge_partitions(instance, session, purge_before)
+    instance.states_manager.evict_dropped_state_ids(session, instance.max_bind_vars)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    _purge_unused_data_ids(instance, session, data_ids)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
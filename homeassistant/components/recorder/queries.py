@@ -646,6 +646,13 @@ def find_oldest_state() -> StatementLambdaElement:
     )
 
 
+def find_existing_state_ids(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find the state_ids that are still in the states table."""
+    return lambda_stmt(
+        lambda: select(States.state_id).where(States.state_id.in_(state_ids))
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -0,0 +1,245 @@
+"""Write-ahead spool for events the recorder could not keep in memory."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+import logging
+import os
+import struct
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.file import WriteError, write_utf8_file_atomic
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_FILE = "recorder.spool"
+OFFSET_SUFFIX = ".offset"
+
+_LENGTH = struct.Struct(">I")
+
+
+def _state_to_record(state: State | None) -> list[Any] | None:
+    """Return a state as a JSON serializable list."""
+    if state is None:
+        return None
+    context = state.context
+    return [
+        state.entity_id,
+        state.state,
+        state.attributes,
+        state.last_changed_timestamp,
+        state.last_updated_timestamp,
+        state.last_reported_timestamp,
+        context.id,
+        context.user_id,
+        context.parent_id,
+    ]
+
+
+def _state_from_record(record: list[Any] | None) -> State | None:
+    """Return a state from a list created by _state_to_record."""
+    if record is None:
+        return None
+    (
+        entity_id,
+        state,
+        attributes,
+        last_changed_ts,
+        last_updated_ts,
+        last_reported_ts,
+        context_id,
+        context_user_id,
+        context_parent_id,
+    ) = record
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_ts),
+        last_reported=dt_util.utc_from_timestamp(last_reported_ts),
+        last_updated=dt_util.utc_from_timestamp(last_updated_ts),
+        context=Context(
+            user_id=context_user_id, parent_id=context_parent_id, id=context_id
+        ),
+        validate_entity_id=False,
+        last_updated_timestamp=last_updated_ts,
+    )
+
+
+def event_to_record(event: Event[Any]) -> bytes:
+    """Serialize an event to a spool record."""
+    data: Any = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_to_record(data["old_state"]),
+            "new_state": _state_to_record(data["new_state"]),
+        }
+    context = event.context
+    return json_bytes(
+        [
+            event.event_type,
+            data,
+            event.origin.value,
+            event.time_fired_timestamp,
+            context.id,
+            context.user_id,
+            context.parent_id,
+        ]
+    )
+
+
+def event_from_record(record: bytes) -> Event[Any]:
+    """Deserialize an event from a spool record."""
+    (
+        event_type,
+        data,
+        origin,
+        time_fired_timestamp,
+        context_id,
+        context_user_id,
+        context_parent_id,
+    ) = json_loads(record)  # type: ignore[misc]
+    if event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "old_state": _state_from_record(data["old_state"]),
+            "new_state": _state_from_record(data["new_state"]),
+        }
+    return Event(
+        event_type,
+        data,
+        EventOrigin(origin),
+        time_fired_timestamp,
+        Context(user_id=context_user_id, parent_id=context_parent_id, id=context_id),
+    )
+
+
+class RecorderSpool:
+    """An append-only log of events waiting to be recorded.
+
+    Each record is a big-endian 32-bit length followed by the JSON
+    serialized event. Records are appended from the executor while the
+    database is falling behind and read back in order by the recorder
+    thread once it catches up.
+
+    The offset of the first record that has not been committed to the
+    database yet is persisted next to the spool, so a replay interrupted
+    by a restart resumes where it stopped instead of recording the
+    committed events twice.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.offset_path = f"{path}{OFFSET_SUFFIX}"
+        self.offset = 0
+        self._offset_loaded = False
+
+    def exists(self) -> bool:
+        """Return if there are spooled events."""
+        return os.path.exists(self.path)
+
+    def append(self, events: Iterable[Event[Any]]) -> int:
+        """Append events to the spool and return how many were written.
+
+        Events that cannot be serialized are logged and skipped.
+        """
+        chunks: list[bytes] = []
+        for event in events:
+            try:
+                record = event_to_record(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "Event is not JSON serializable, not spooling: %s", event
+                )
+                continue
+            chunks.append(_LENGTH.pack(len(record)))
+            chunks.append(record)
+        if not chunks:
+            return 0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if not os.path.exists(self.path):
+            # A stale offset must not skip the records of a new spool
+            with suppress(FileNotFoundError):
+                os.unlink(self.offset_path)
+        with open(self.path, "ab") as spool_file:
+            spool_file.write(b"".join(chunks))
+            spool_file.flush()
+            os.fsync(spool_file.fileno())
+        return len(chunks) // 2
+
+    def read(self) -> Iterator[tuple[int, Event[Any]]]:
+        """Yield the spooled events after offset in the order they were written.
+
+        Each event is yielded with the offset of the record after it.
+        A truncated record at the end of the file, which is left behind
+        if Home Assistant stopped while writing, ends the replay.
+        """
+        if not self._offset_loaded:
+            self.offset = self._load_offset()
+            self._offset_loaded = True
+        with open(self.path, "rb") as spool_file:
+            spool_file.seek(self.offset)
+            offset = self.offset
+            while header := spool_file.read(_LENGTH.size):
+                if len(header) < _LENGTH.size:
+                    _LOGGER.warning("Ignoring truncated record in %s", self.path)
+                    return
+                (length,) = _LENGTH.unpack(header)
+                record = spool_file.read(length)
+                if len(record) < length:
+                    _LOGGER.warning("Ignoring truncated record in %s", self.path)
+                    return
+                offset += _LENGTH.size + length
+                try:
+                    event = event_from_record(record)
+                except (KeyError, TypeError, ValueError):
+                    _LOGGER.warning("Ignoring invalid record in %s", self.path)
+                    continue
+                yield offset, event
+
+    def commit(self, offset: int) -> None:
+        """Persist the offset of the first record not committed yet.
+
+        This method does blocking I/O and should be called from the
+        recorder thread once the events before offset are committed.
+        """
+        self.offset = offset
+        # Failures are logged, the events are only recorded
+        # again if the replay is interrupted before the next commit
+        with suppress(WriteError):
+            write_utf8_file_atomic(self.offset_path, str(offset))
+
+    def remove(self) -> None:
+        """Remove the spool once all events have been recorded."""
+        self.offset = 0
+        self._offset_loaded = True
+        # The spool goes first so a stale offset is never
+        # applied to a spool which is written later
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+        with suppress(FileNotFoundError):
+            os.unlink(self.offset_path)
+
+    def _load_offset(self) -> int:
+        """Load the offset persisted by an interrupted replay."""
+        try:
+            with open(self.offset_path, encoding="utf-8") as offset_file:
+                offset = int(offset_file.read())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError):
+            _LOGGER.warning("Ignoring invalid spool offset in %s", self.offset_path)
+            return 0
+        if not 0 <= offset <= os.path.getsize(self.path):
+            _LOGGER.warning("Ignoring invalid spool offset in %s", self.offset_path)
+            return 0
+        _LOGGER.info("Resuming the replay of %s at offset %s", self.path, offset)
+        return offset
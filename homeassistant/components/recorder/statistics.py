@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
@@ -22,7 +23,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
-from homeassistant.core import HomeAssistant, callback, valid_entity_id
+from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
@@ -164,6 +165,7 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_STATES_CACHE = "recorder_statistics_states_cache"
 
 
 def mean(values: list[float]) -> float | None:
@@ -207,6 +209,111 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+def _state_last_updated_timestamp(state: State) -> float:
+    """Return the last updated timestamp of a state."""
+    return state.last_updated_timestamp
+
+
+@dataclasses.dataclass(slots=True)
+class _CachedStates:
+    """Recorded states of an entity."""
+
+    # The states cover every period starting at or after valid_from_ts:
+    # the last state before it and every state recorded since.
+    valid_from_ts: float
+    states: list[State]
+
+
+@dataclasses.dataclass(slots=True)
+class StatisticsStatesCache:
+    """Cache of the recorded states statistics are compiled from.
+
+    An entity is seeded from the database once, after which the recorder
+    adds every state it records for it, so compiling statistics for the
+    following periods does not need to query the states table.
+
+    The cache must only be accessed from the recorder thread.
+    """
+
+    _entries: dict[str, _CachedStates] = dataclasses.field(default_factory=dict)
+
+    def add(self, state: State) -> None:
+        """Add a state the recorder recorded."""
+        if (entry := self._entries.get(state.entity_id)) is not None:
+            entry.states.append(state)
+
+    def discard(self, entity_id: str) -> None:
+        """Stop caching the states of an entity."""
+        self._entries.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Stop caching the states of all entities."""
+        self._entries.clear()
+
+    def seed(self, entity_id: str, valid_from_ts: float, states: list[State]) -> None:
+        """Seed the states of an entity recorded since valid_from_ts.
+
+        states must be sorted by last_updated and include the state at
+        valid_from_ts, if there is one.
+        """
+        self._entries[entity_id] = _CachedStates(valid_from_ts, states)
+
+    def get_states(
+        self,
+        entity_ids: Iterable[str],
+        start_ts: float,
+        end_ts: float,
+        significant_entity_ids: set[str],
+    ) -> dict[str, list[State]]:
+        """Return the states of the entities cached for the period.
+
+        The result matches a history query starting just before start_ts,
+        including the state at start_ts. Only state changes are returned
+        for the entities in significant_entity_ids. Entities the cache
+        does not cover for the period are left out.
+        """
+        result: dict[str, list[State]] = {}
+        for entity_id in entity_ids:
+            if (
+                entry := self._entries.get(entity_id)
+            ) is None or entry.valid_from_ts > start_ts:
+                continue
+            states = entry.states
+            start_idx = bisect_left(states, start_ts, key=_state_last_updated_timestamp)
+            end_idx = bisect_left(
+                states, end_ts, start_idx, key=_state_last_updated_timestamp
+            )
+            period_states = states[max(start_idx - 1, 0) : end_idx]
+            if entity_id in significant_entity_ids:
+                period_states = [
+                    state
+                    for idx, state in enumerate(period_states)
+                    if (idx == 0 and start_idx > 0)
+                    or state.last_changed_timestamp == state.last_updated_timestamp
+                ]
+            result[entity_id] = period_states
+        return result
+
+    def evict(self, entity_ids: Iterable[str], before_ts: float) -> None:
+        """Evict states that are no longer needed.
+
+        Only the entities in entity_ids are kept, and only the states
+        needed to compile periods starting at or after before_ts.
+        """
+        entity_ids = set(entity_ids)
+        for entity_id in [eid for eid in self._entries if eid not in entity_ids]:
+            del self._entries[entity_id]
+        for entry in self._entries.values():
+            if entry.valid_from_ts >= before_ts:
+                continue
+            states = entry.states
+            if (
+                idx := bisect_left(states, before_ts, key=_state_last_updated_timestamp)
+            ) > 1:
+                del states[: idx - 1]
+            entry.valid_from_ts = before_ts
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -2376,6 +2483,12 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_STATES_CACHE)
+def get_statistics_states_cache(hass: HomeAssistant) -> StatisticsStatesCache:
+    """Get the statistics states cache."""
+    return StatisticsStatesCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from functools import cache
 from typing import Any, cast
 
+from sqlalchemy import insert, inspect
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.schema import Table
+
+from homeassistant.util.collection import chunked_or_all
 
 from ..db_schema import States
-from ..queries import find_oldest_state
+from ..queries import find_existing_state_ids, find_oldest_state
 from ..util import execute_stmt_lambda_element
 
 
@@ -19,6 +24,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
@@ -61,6 +67,88 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to insert at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the states added with add_pending_insert.
+
+        The session is flushed first so the ids of pending StatesMeta
+        and StateAttributes rows are known. The states are then written
+        with one INSERT per generation, where a generation holds the
+        states whose old state already has a state_id, so an entity that
+        changed several times in a commit interval only needs one extra
+        statement per change.
+
+        Dialects which can return the ids of an executemany INSERT use
+        one. The others, like MySQL and MariaDB, insert the states of a
+        generation one row at a time, since the ids of a multi-row
+        INSERT are not known.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (remaining := self._pending_inserts):
+            return
+        # A state that was never queued, because its attributes could
+        # not be serialized, may still be the old state of a queued one
+        queued = {id(db_state) for db_state in remaining}
+        for db_state in list(remaining):
+            old_state = db_state.old_state
+            while (
+                old_state is not None
+                and old_state.state_id is None
+                and id(old_state) not in queued
+            ):
+                queued.add(id(old_state))
+                remaining.append(old_state)
+                old_state = old_state.old_state
+        table, columns, relationships = _insert_columns(type(remaining[0]))
+        # Ids handed out by a failed attempt are not valid on retry
+        for db_state in remaining:
+            db_state.state_id = None
+            _readd_rolled_back_relationships(session, db_state, relationships)
+        session.flush()
+        connection = session.connection()
+        bulk_returning = (
+            connection.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        while remaining:
+            ready: list[States] = []
+            deferred: list[States] = []
+            for db_state in remaining:
+                if (
+                    old_state := db_state.old_state
+                ) is not None and old_state.state_id is None:
+                    deferred.append(db_state)
+                else:
+                    ready.append(db_state)
+            params = [
+                _insert_params(db_state, columns, relationships) for db_state in ready
+            ]
+            state_ids: Iterable[int]
+            if bulk_returning:
+                state_ids = connection.execute(
+                    insert(table).returning(
+                        table.c.state_id, sort_by_parameter_order=True
+                    ),
+                    params,
+                ).scalars()
+            else:
+                state_ids = [
+                    connection.execute(insert(table), row).inserted_primary_key[0]
+                    for row in params
+                ]
+            for db_state, state_id in zip(ready, state_ids, strict=True):
+                db_state.state_id = state_id
+            remaining = deferred
+        self._pending_inserts = []
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -80,6 +168,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -90,6 +179,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
         self._oldest_ts = None
 
     def load_from_db(self, session: Session) -> None:
@@ -125,6 +215,23 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_dropped_state_ids(self, session: Session, max_bind_vars: int) -> None:
+        """Evict committed states that are no longer in the database.
+
+        When partitions of the states table are dropped the purged
+        state_ids are not known, so the committed states are looked up.
+        """
+        committed_ids = set(self._last_committed_id.values())
+        existing_ids: set[int] = set()
+        for state_ids_chunk in chunked_or_all(committed_ids, max_bind_vars):
+            existing_ids.update(
+                row[0]
+                for row in execute_stmt_lambda_element(
+                    session, find_existing_state_ids(state_ids_chunk)
+                )
+            )
+        self.evict_purged_state_ids(committed_ids - existing_ids)
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -134,3 +241,62 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+@cache
+def _insert_columns(
+    states_class: type[States],
+) -> tuple[Table, list[tuple[str, str]], list[tuple[str, str, str]]]:
+    """Return the table and the attribute to column mapping to insert states.
+
+    The mapping is derived from the mapper so it also works with the
+    States classes of older schemas.
+    """
+    mapper = inspect(states_class)
+    table = cast(Table, mapper.local_table)
+    primary_keys = {column.key for column in mapper.primary_key}
+    columns = [
+        (prop.key, prop.columns[0].key)
+        for prop in mapper.column_attrs
+        if prop.columns[0].key not in primary_keys
+    ]
+    relationships = [
+        (rel.key, local.key, remote.key)
+        for rel in mapper.relationships
+        for local, remote in rel.local_remote_pairs
+    ]
+    return table, columns, relationships
+
+
+def _insert_params(
+    db_state: States,
+    columns: list[tuple[str, str]],
+    relationships: list[tuple[str, str, str]],
+) -> dict[str, Any]:
+    """Return the insert parameters of a state."""
+    params = {column: getattr(db_state, attr) for attr, column in columns}
+    for rel_key, local_column, remote_column in relationships:
+        if (related := getattr(db_state, rel_key)) is not None:
+            params[local_column] = getattr(related, remote_column)
+    return params
+
+
+def _readd_rolled_back_relationships(
+    session: Session,
+    db_state: States,
+    relationships: list[tuple[str, str, str]],
+) -> None:
+    """Add the related rows of a state expunged by a rollback to the session again.
+
+    A rollback expunges the rows which were flushed in the transaction
+    but keeps the ids the database handed out, so the ids are cleared
+    to have the next flush insert the rows again.
+    """
+    for rel_key, _, _ in relationships:
+        related = getattr(db_state, rel_key)
+        if related is None or type(related) is type(db_state):
+            continue
+        if (related_state := inspect(related)).transient:
+            for column in related_state.mapper.primary_key:
+                setattr(related, column.key, None)
+            session.add(related)
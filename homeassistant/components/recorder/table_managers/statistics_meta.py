@@ -12,7 +12,7 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from ..db_schema import StatisticsMeta
+from ..db_schema import StatisticsMeta, StatisticsShortTerm
 from ..models import StatisticMetaData
 from ..util import execute_stmt_lambda_element
 
@@ -330,6 +330,16 @@ class StatisticsMetaManager:
         recorder thread.
         """
         self._assert_in_recorder_thread()
+        if self.recorder.day_partitioned:
+            # Partitioned MySQL tables have no foreign keys
+            # to cascade the delete to the short term statistics
+            session.query(StatisticsShortTerm).filter(
+                StatisticsShortTerm.metadata_id.in_(
+                    select(StatisticsMeta.id).where(
+                        StatisticsMeta.statistic_id.in_(statistic_ids)
+                    )
+                )
+            ).delete(synchronize_session=False)
         session.query(StatisticsMeta).filter(
             StatisticsMeta.statistic_id.in_(statistic_ids)
         ).delete(synchronize_session=False)
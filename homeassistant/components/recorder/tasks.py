@@ -105,6 +105,7 @@ class UpdateStatesMetadataTask(RecorderTask):
             self.entity_id,
             self.new_entity_id,
         )
+        statistics.get_statistics_states_cache(instance.hass).clear()
 
 
 @dataclass(slots=True)
@@ -140,6 +141,7 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        statistics.get_statistics_states_cache(instance.hass).clear()
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
@@ -295,6 +297,15 @@ class CommitTask(RecorderTask):
         instance._commit_event_session_or_retry()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class SpoolReplayTask(RecorderTask):
+    """Record the events spooled to disk while the database was behind."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spool()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class AddRecorderPlatformTask(RecorderTask):
     """Add a recorder platform."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Generator, Sequence
 import contextlib
 from contextlib import contextmanager
@@ -10,7 +11,7 @@ import functools
 import logging
 import os
 import time
-from typing import TYPE_CHECKING, Any, Concatenate, NoReturn
+from typing import TYPE_CHECKING, Any, Concatenate, NoReturn, cast
 
 from awesomeversion import (
     AwesomeVersion,
@@ -28,6 +29,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, issue_registry as ir
 from homeassistant.helpers.recorder import (  # noqa: F401
     DATA_INSTANCE,
@@ -57,10 +59,13 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .partition import add_partitions_ahead
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
 
+    from homeassistant.components.websocket_api import ActiveConnection
+
     from . import Recorder
 
 _LOGGER = logging.getLogger(__name__)
@@ -622,6 +627,20 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_only_connection_for_dialect(
+    dialect_name: str, dbapi_connection: DBAPIConnection
+) -> None:
+    """Make a connection of the read pool refuse writes."""
+    if dialect_name == SupportedDialect.SQLITE:
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -786,6 +805,9 @@ def periodic_db_cleanups(instance: Recorder) -> None:
         with instance.engine.connect() as connection:
             connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
             connection.execute(text("PRAGMA OPTIMIZE;"))
+    if instance.partition_by_day and instance.day_partitioned:
+        with session_scope(session=instance.get_session()) as session:
+            add_partitions_ahead(instance, session)
 
 
 @contextmanager
@@ -991,3 +1013,89 @@ def filter_unique_constraint_integrity_error(
         return ignore
 
     return _filter_unique_constraint_integrity_error
+
+
+async def async_add_read_job_for_connection[_T](
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    target: Callable[..., _T],
+    *args: Any,
+) -> _T:
+    """Run a read job for a websocket command on the read pool.
+
+    The job is cancelled when the connection is closed, or the client
+    unsubscribes from msg_id, before it finishes. A job which is cancelled
+    or dropped by the read pool raises HomeAssistantError, so the client
+    gets an error instead of no response.
+    """
+    read_job = get_instance(hass).async_add_read_job(target, *args)
+    connection.subscriptions[msg_id] = read_job.cancel
+    try:
+        return await read_job
+    except asyncio.CancelledError as err:
+        _raise_if_read_job_cancelled(read_job, err)
+        raise
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+
+
+def _raise_if_read_job_cancelled(
+    read_job: asyncio.Future[Any], err: asyncio.CancelledError
+) -> None:
+    """Raise HomeAssistantError if a read job was cancelled but not the caller."""
+    if read_job.cancelled() and not (
+        (task := asyncio.current_task()) and task.cancelling()
+    ):
+        raise HomeAssistantError("The database read was cancelled") from err
+
+
+async def async_stream_read_job_to_connection[_T](
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    target: Callable[..., Generator[bytes, None, _T]],
+    *args: Any,
+) -> _T:
+    """Run a generator of messages as read jobs and send the messages.
+
+    Each message is generated in its own read job and the next one is
+    only generated once the client received the previous message. The
+    generator must not keep a database session open between messages,
+    so a slow client holds back neither a worker nor a database
+    connection and the memory used depends neither on the size of the
+    result nor on the speed of the client. A job which is dropped by
+    the read pool raises HomeAssistantError.
+    """
+    instance = get_instance(hass)
+    loop = hass.loop
+    generator = target(*args)
+
+    @functools.wraps(target)
+    def _generate_next() -> tuple[bool, Any]:
+        """Generate the next message, or the return value once done."""
+        try:
+            return False, next(generator)
+        except StopIteration as stop:
+            return True, stop.value
+
+    while True:
+        read_job = instance.async_add_read_job(_generate_next)
+        try:
+            done, value = await read_job
+        except asyncio.CancelledError as err:
+            _raise_if_read_job_cancelled(read_job, err)
+            raise
+        if done:
+            return cast(_T, value)
+        connection.send_message(value)
+        # Hold back the next message until the client received this one
+        drained: asyncio.Future[None] = loop.create_future()
+        connection.call_when_drained(functools.partial(_set_drained, drained))
+        await drained
+
+
+@callback
+def _set_drained(drained: asyncio.Future[None]) -> None:
+    """Release a stream waiting for the client to receive its messages."""
+    if not drained.done():
+        drained.set_result(None)
@@ -49,7 +49,12 @@ from .statistics import (
     update_statistics_issues,
     validate_statistics,
 )
-from .util import PERIOD_SCHEMA, get_instance, resolve_period
+from .util import (
+    PERIOD_SCHEMA,
+    async_add_read_job_for_connection,
+    get_instance,
+    resolve_period,
+)
 
 CLEAR_STATISTICS_TIME_OUT = 10
 UPDATE_STATISTICS_METADATA_TIME_OUT = 10
@@ -90,6 +95,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_read_job_timings)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
@@ -140,7 +146,10 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -208,7 +217,10 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await async_add_read_job_for_connection(
+            hass,
+            connection,
+            msg["id"],
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -263,7 +275,7 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -272,6 +284,20 @@ async def ws_handle_list_statistic_ids(
     )
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/read_job_timings",
+    }
+)
+@websocket_api.require_admin
+@callback
+def ws_read_job_timings(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return how long the database read jobs took."""
+    connection.send_result(msg["id"], get_instance(hass).get_read_job_timings())
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "recorder/list_statistic_ids",
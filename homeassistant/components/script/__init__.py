@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 import asyncio
 from dataclasses import dataclass
 import logging
+import time
 from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
@@ -382,9 +383,19 @@ async def _async_process_config(
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        # Scripts can only match configurations with the same key, bucket
+        # them by key to avoid comparing every pair
+        script_configs_by_key: dict[str, list[tuple[int, ScriptEntityConfig]]] = {}
+
+        for config_idx, script_config in enumerate(script_configs):
+            script_configs_by_key.setdefault(script_config.key, []).append(
+                (config_idx, script_config)
+            )
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
+            for config_idx, script_config in script_configs_by_key.get(
+                cast(str, script.unique_id), ()
+            ):
                 if config_idx in config_matches:
                     # Only allow a script config to match at most once
                     continue
@@ -396,6 +407,7 @@ async def _async_process_config(
 
         return script_matches, config_matches
 
+    start = time.monotonic()
     script_configs = await _prepare_script_config(hass, config)
     scripts: list[BaseScriptEntity] = list(component.entities)
 
@@ -417,6 +429,15 @@ async def _async_process_config(
     entities = await _create_script_entities(hass, updated_script_configs)
     await component.async_add_entities(entities)
 
+    LOGGER.debug(
+        "Processed script config in %.3f seconds: %s unchanged, %s removed, "
+        "%s added",
+        time.monotonic() - start,
+        len(script_matches),
+        len(tasks),
+        len(entities),
+    )
+
 
 class BaseScriptEntity(ToggleEntity, ABC):
     """Base class for script entities."""
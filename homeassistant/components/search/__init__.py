@@ -141,6 +141,7 @@ class Searcher:
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
 
         # Devices in this area
+        device_area_entries = self._entity_registry.entities.get_entries_for_device_area
         for device in dr.async_entries_for_area(self._device_registry, area_id):
             self._add(ItemType.DEVICE, device.id)
 
@@ -157,14 +158,12 @@ class Searcher:
             # Scripts referencing this device
             self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
 
-            # Entities of this device
-            for entity_entry in er.async_entries_for_device(
-                self._entity_registry, device.id
-            ):
-                # Skip the entity if it's in a different area
-                if entity_entry.area_id is not None:
-                    continue
-                entity_entries.append(entity_entry)
+            # Entities of this device which are not in a different area
+            entity_entries.extend(
+                entity_entry
+                for entity_entry in device_area_entries(device.id)
+                if not entity_entry.disabled_by
+            )
 
         # Process entities in this area
         for entity_entry in entity_entries:
@@ -78,6 +78,10 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Periods ending longer ago than this are compiled with a history query
+# per period instead of seeding the statistics states cache, which would
+# load every state recorded since then into memory
+STATES_CACHE_MAX_SEED_AGE = datetime.timedelta(hours=12)
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -402,20 +406,73 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+def _get_history(
     hass: HomeAssistant,
     session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end.
 
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    The history is taken from the statistics states cache. Sensors the
+    cache does not cover yet are seeded with one query for all states
+    recorded since start, which the following periods are compiled from,
+    so catching up after downtime needs a single query for many periods.
+    """
+    entity_ids = [state.entity_id for state in sensor_states]
+    significant_entity_ids = {
+        entity_id
+        for entity_id in entity_ids
+        if "sum" not in wanted_statistics[entity_id]
+    }
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    states_cache = statistics.get_statistics_states_cache(hass)
+    history_list = states_cache.get_states(
+        entity_ids, start_ts, end_ts, significant_entity_ids
+    )
+    if uncached := [
+        entity_id for entity_id in entity_ids if entity_id not in history_list
+    ]:
+        if dt_util.utcnow() - end < STATES_CACHE_MAX_SEED_AGE:
+            for entity_id, states in history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                None,
+                entity_ids=uncached,
+                significant_changes_only=False,
+            ).items():
+                states_cache.seed(entity_id, start_ts, states)
+            history_list.update(
+                states_cache.get_states(
+                    uncached, start_ts, end_ts, significant_entity_ids
+                )
+            )
+        else:
+            history_list.update(
+                _get_history_from_database(
+                    hass, session, uncached, significant_entity_ids, start, end
+                )
+            )
+    states_cache.evict(entity_ids, end_ts)
+    # Match the history queries, which leave out entities without states
+    return {entity_id: states for entity_id, states in history_list.items() if states}
+
+
+def _get_history_from_database(
+    hass: HomeAssistant,
+    session: Session,
+    entity_ids: list[str],
+    significant_entity_ids: set[str],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end from the database."""
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        entity_id for entity_id in entity_ids if entity_id not in significant_entity_ids
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
@@ -428,9 +485,7 @@ def compile_statistics(  # noqa: C901
             significant_changes_only=False,
         )
     entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        entity_id for entity_id in entity_ids if entity_id in significant_entity_ids
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -441,6 +496,23 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    history_list = _get_history(
+        hass, session, sensor_states, wanted_statistics, start, end
+    )
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
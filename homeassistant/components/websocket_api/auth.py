@@ -57,9 +57,11 @@ class AuthPhase:
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        call_when_drained: Callable[[Callable[[], None]], Any] | None = None,
     ) -> None:
         """Initialize the authenticated connection."""
         self._hass = hass
+        self._call_when_drained = call_when_drained
         # send_message will send a message to the client via the queue.
         self._send_message = send_message
         self._cancel_ws = cancel_ws
@@ -89,6 +91,7 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._call_when_drained,
             )
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
@@ -53,6 +53,7 @@ from homeassistant.helpers.json import (
     json_fragment,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.startup_trace import async_get_startup_trace
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -86,6 +87,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -367,6 +369,86 @@ def _send_handle_get_states_response(
     )
 
 
+@lru_cache(maxsize=1024)
+def _merge_state_changed_events(
+    first_event: Event[EventStateChangedData],
+    last_event: Event[EventStateChangedData],
+) -> Event[EventStateChangedData]:
+    """Merge two state changed events of an entity into one.
+
+    The merged event is cached so subscribers holding back the same
+    changes share it together with its serialized messages.
+    """
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": last_event.data["entity_id"],
+            "old_state": first_event.data["old_state"],
+            "new_state": last_event.data["new_state"],
+        },
+        last_event.origin,
+        last_event.time_fired_timestamp,
+        last_event.context,
+    )
+
+
+class _LatestEntityChanges:
+    """Hold back the changes of entities until the client has caught up.
+
+    The changes of an entity that happen while earlier messages are still
+    waiting to be written are merged into a single change, so a client
+    that can not keep up receives fewer updates instead of falling behind.
+    """
+
+    __slots__ = ("_cancelled", "_connection", "_message_id_as_bytes", "_pending")
+
+    def __init__(
+        self, connection: ActiveConnection, message_id_as_bytes: bytes
+    ) -> None:
+        """Initialize the pending changes."""
+        self._connection = connection
+        self._message_id_as_bytes = message_id_as_bytes
+        self._pending: dict[str, Event[EventStateChangedData]] = {}
+        self._cancelled = False
+
+    @callback
+    def async_add(self, events: list[Event[EventStateChangedData]]) -> None:
+        """Merge state changed events into the pending changes."""
+        pending = self._pending
+        if not pending:
+            self._connection.call_when_drained(self._async_send)
+        for event in events:
+            entity_id = event.data["entity_id"]
+            if (pending_event := pending.get(entity_id)) is None:
+                pending[entity_id] = event
+                continue
+            if (
+                pending_event.data["old_state"] is None
+                and event.data["new_state"] is None
+            ):
+                # The client never saw the entity
+                del pending[entity_id]
+                continue
+            pending[entity_id] = _merge_state_changed_events(pending_event, event)
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the pending changes."""
+        if self._cancelled or not (pending := self._pending):
+            return
+        self._pending = {}
+        for message in messages.cached_state_diff_batch_message(
+            self._message_id_as_bytes, list(pending.values())
+        ):
+            self._connection.send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending changes."""
+        self._cancelled = True
+        self._pending.clear()
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
@@ -374,24 +456,44 @@ def _forward_entity_changes(
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
+    latest_changes: _LatestEntityChanges | None,
+    events: list[Event[EventStateChangedData]],
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
+    check_permissions = not user.is_admin and not permissions.access_all_entities(
+        POLICY_READ
+    )
+    allowed_events: list[Event[EventStateChangedData]] = []
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if (entity_ids and entity_id not in entity_ids) or (
+            entity_filter and not entity_filter(entity_id)
+        ):
+            continue
+        if check_permissions and not permissions.check_entity(entity_id, POLICY_READ):
+            continue
+        allowed_events.append(event)
+    if not allowed_events:
+        return
+    if latest_changes is not None:
+        latest_changes.async_add(allowed_events)
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    for message in messages.cached_state_diff_batch_message(
+        message_id_as_bytes, allowed_events
+    ):
+        send_message(message)
+
+
+@callback
+def _async_unsubscribe_latest_changes(
+    unsub: Callable[[], None], latest_changes: _LatestEntityChanges
+) -> None:
+    """Stop forwarding the latest entity changes."""
+    unsub()
+    latest_changes.async_cancel()
 
 
 @callback
@@ -399,6 +501,7 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("latest_only", default=False): bool,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,7 +518,13 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
+    # Slow clients get only the latest changes instead of every change
+    latest_changes = (
+        _LatestEntityChanges(connection, message_id_as_bytes)
+        if msg["latest_only"]
+        else None
+    )
+    unsub = hass.bus.async_listen_batch(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
@@ -424,8 +533,15 @@ def handle_subscribe_entities(
             entity_filter,
             connection.user,
             message_id_as_bytes,
+            latest_changes,
         ),
     )
+    if latest_changes is None:
+        connection.subscriptions[msg_id] = unsub
+    else:
+        connection.subscriptions[msg_id] = partial(
+            _async_unsubscribe_latest_changes, unsub, latest_changes
+        )
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -570,6 +686,18 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    if (trace := async_get_startup_trace(hass)) is None:
+        connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Startup was not traced")
+        return
+    connection.send_result(msg["id"], trace.as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -43,6 +43,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "call_when_drained",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -60,11 +61,14 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        call_when_drained: Callable[[Callable[[], None]], Any] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Calls back once the messages queued so far are written to the client
+        self.call_when_drained = call_when_drained or hass.loop.call_soon
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
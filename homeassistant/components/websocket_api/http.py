@@ -82,6 +82,7 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_drained_callbacks",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -105,6 +106,7 @@ class WebSocketHandler:
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
         self._message_queue: deque[bytes] = deque()
+        self._drained_callbacks: list[Callable[[], None]] = []
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
 
@@ -144,6 +146,12 @@ class WebSocketHandler:
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
+                if not message_queue and (drained_callbacks := self._drained_callbacks):
+                    self._drained_callbacks = []
+                    for drained_callback in drained_callbacks:
+                        drained_callback()
+                    ready_message_count = len(message_queue)
+
                 if not message_queue:
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
@@ -236,6 +244,14 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _call_when_drained(self, drained_callback: Callable[[], None]) -> None:
+        """Call back once the queued messages are written to the client."""
+        if self._closing or not self._message_queue:
+            self._loop.call_soon(drained_callback)
+            return
+        self._drained_callbacks.append(drained_callback)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -332,7 +348,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._call_when_drained,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -364,6 +386,11 @@ class WebSocketHandler:
             self._closing = True
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
+            # Nothing is written anymore, do not keep anyone waiting
+            drained_callbacks = self._drained_callbacks
+            self._drained_callbacks = []
+            for drained_callback in drained_callbacks:
+                drained_callback()
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
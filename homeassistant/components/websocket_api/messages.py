@@ -177,6 +177,74 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_diff_batch_message(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> list[bytes]:
+    """Return the event messages for a batch of state changed events.
+
+    The diffs of the events are merged into a single message when every
+    event is for a different entity, otherwise one message per event is
+    returned since later diffs of an entity build on earlier ones.
+
+    The messages are serialized once per batch and shared by every
+    connection that receives the same events, only the id is appended
+    for each connection.
+    """
+    if len(events) == 1:
+        return [cached_state_diff_message(message_id_as_bytes, events[0])]
+    return [
+        b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+        for partial_message in _partial_cached_state_diff_batch_message(tuple(events))
+    ]
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_diff_batch_message(
+    events: tuple[Event[EventStateChangedData], ...],
+) -> tuple[bytes, ...]:
+    """Cache and serialize the messages for a batch of events.
+
+    The messages are constructed without the id which
+    will be appended in cached_state_diff_batch_message
+    """
+    if len({event.data["entity_id"] for event in events}) != len(events):
+        return tuple(_partial_cached_state_diff_message(event) for event in events)
+    fragments: dict[str, list[bytes]] = {
+        ENTITY_EVENT_ADD: [],
+        ENTITY_EVENT_REMOVE: [],
+        ENTITY_EVENT_CHANGE: [],
+    }
+    for event in events:
+        if (fragment := _cached_state_diff_fragment(event)) is None:
+            return tuple(_partial_cached_state_diff_message(event) for event in events)
+        fragments[fragment[0]].append(fragment[1])
+    parts = [
+        b"".join((b'"', kind.encode(), b'":', open_, b",".join(kind_fragments), close))
+        for kind, open_, close in (
+            (ENTITY_EVENT_ADD, b"{", b"}"),
+            (ENTITY_EVENT_REMOVE, b"[", b"]"),
+            (ENTITY_EVENT_CHANGE, b"{", b"}"),
+        )
+        if (kind_fragments := fragments[kind])
+    ]
+    return (b"".join((b'{"type":"event","event":{', b",".join(parts), b"}}")),)
+
+
+@lru_cache(maxsize=2048)
+def _cached_state_diff_fragment(
+    event: Event[EventStateChangedData],
+) -> tuple[str, bytes] | None:
+    """Cache and serialize the diff of an event without its enclosing container.
+
+    Returns the kind of the diff and the JSON of its contents, or None
+    if the diff can not be serialized.
+    """
+    ((kind, diff),) = _state_diff_event(event).items()
+    if (diff_json := _message_to_json_bytes_or_none(diff)) is None:  # type: ignore[arg-type]
+        return None
+    return kind, diff_json[1:-1]
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
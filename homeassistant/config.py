@@ -28,13 +28,21 @@ from .core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant, callback
 from .core_config import _PACKAGE_DEFINITION_SCHEMA, _PACKAGES_CONFIG_SCHEMA
 from .exceptions import ConfigValidationError, HomeAssistantError
 from .helpers import config_validation as cv
+from .helpers.storage import STORAGE_DIR
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.async_ import create_eager_task
+from .util.hass_dict import HassKey
 from .util.package import is_docker_env
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlParseCache,
+    YamlTypeError,
+    load_yaml_dict,
+)
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +51,7 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_PARSE_CACHE_FILE = "core.yaml_parse_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -54,6 +63,8 @@ INTEGRATION_LOAD_EXCEPTIONS = (IntegrationNotFound, RequirementsNotFound)
 
 SAFE_MODE_FILENAME = "safe-mode"
 
+DATA_YAML_PARSE_CACHE: HassKey[YamlParseCache] = HassKey("yaml_parse_cache")
+
 DEFAULT_CONFIG = f"""
 # Loads default set of integrations. Do not remove.
 default_config:
@@ -206,6 +217,16 @@ def _write_default_config(config_dir: str) -> bool:
     return True
 
 
+async def async_load_yaml_parse_cache(hass: HomeAssistant) -> None:
+    """Load the cache of parsed YAML files persisted by the last run.
+
+    Once loaded, async_hass_config_yaml loads unchanged files from the cache.
+    """
+    parse_cache = YamlParseCache(hass.config.path(STORAGE_DIR, YAML_PARSE_CACHE_FILE))
+    await hass.async_add_executor_job(parse_cache.load)
+    hass.data[DATA_YAML_PARSE_CACHE] = parse_cache
+
+
 async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
@@ -213,6 +234,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    parse_cache = hass.data.get(DATA_YAML_PARSE_CACHE)
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -221,6 +243,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            parse_cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -233,6 +256,10 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             base_exc.problem_mark.name = _relpath(hass, base_exc.problem_mark.name)
         raise
 
+    # Files which were not loaded have been removed from the configuration
+    if parse_cache is not None and (parse_cache.dirty or parse_cache.has_unused):
+        await hass.loop.run_in_executor(None, parse_cache.save)
+
     invalid_domains = []
     for key in config:
         try:
@@ -264,7 +291,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    parse_cache: YamlParseCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -273,7 +302,7 @@ def load_yaml_config_file(
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        conf_dict = load_yaml_dict(config_path, secrets, parse_cache)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
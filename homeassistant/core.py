@@ -12,9 +12,11 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
@@ -39,6 +41,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -1421,6 +1424,15 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+# event_type -> key_fn -> key -> filterable jobs
+_KeyedListenersType = dict[
+    EventType[Any] | str,
+    dict[
+        Callable[[Any], Hashable | None],
+        dict[Hashable, list[_FilterableJobType[Any]]],
+    ],
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1460,13 +1472,25 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._keyed_listeners: _KeyedListenersType = {}
+        self._batch_listeners: dict[
+            EventType[Any] | str,
+            list[HassJob[[list[Event[Any]]], Coroutine[Any, Any, None] | None]],
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1484,7 +1508,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(jobs)
+                for listeners_by_key in keyed_listeners.values()
+                for jobs in listeners_by_key.values()
+            )
+        for event_type, batch_jobs in self._batch_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + len(batch_jobs)
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1549,7 +1582,75 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
+        event = self._async_dispatch(
+            event_type, event_data, origin, context, time_fired
+        )
+
+        if batch_jobs := self._batch_listeners.get(event_type):
+            if not event:
+                event = Event(event_type, event_data, origin, time_fired, context)
+            self._async_run_batch_jobs(batch_jobs, [event])
+
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        batch: Sequence[tuple[_DataT, Context | None, float | None]],
+        origin: EventOrigin = EventOrigin.local,
+    ) -> None:
+        """Fire a batch of events of the same type, for internal use only.
+
+        Each item of the batch is a tuple of event data, context and
+        time fired. Listeners registered with async_listen and
+        async_listen_keyed receive the events one by one, listeners
+        registered with async_listen_batch receive all events in a
+        single call after every event has been dispatched.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        batch_jobs = self._batch_listeners.get(event_type)
+        events: list[Event[_DataT]] = []
+        for event_data, context, time_fired in batch:
+            if self._debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+            event = self._async_dispatch(
+                event_type, event_data, origin, context, time_fired
+            )
+            if batch_jobs:
+                events.append(
+                    event or Event(event_type, event_data, origin, time_fired, context)
+                )
+
+        if batch_jobs and events:
+            self._async_run_batch_jobs(batch_jobs, events)
+
+    @callback
+    def _async_dispatch(
+        self,
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: float | None,
+    ) -> Event[_DataT] | None:
+        """Dispatch an event to its listeners.
+
+        Returns the event if any listener needed it to be created.
+        """
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            listeners = listeners + _async_match_keyed_listeners(
+                keyed_listeners, event_data
+            )
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1579,6 +1680,23 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        return event
+
+    @callback
+    def _async_run_batch_jobs(
+        self,
+        batch_jobs: list[
+            HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None]
+        ],
+        events: list[Event[_DataT]],
+    ) -> None:
+        """Run batch listeners with a list of events."""
+        for job in batch_jobs.copy():
+            try:
+                self._hass.async_run_hass_job(job, events)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1654,6 +1772,80 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_fn: Callable[[_DataT], Hashable | None],
+        key: Hashable,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type that match a key.
+
+        The key_fn, which must be a callable decorated with @callback,
+        derives the key from the event data. It is called once per fired
+        event for each distinct key_fn, and only the listeners registered
+        for the returned key run, so dispatch costs O(matching listeners)
+        instead of O(all listeners). Returning None matches no listeners.
+
+        Listeners that share a key_fn must pass the same callable so
+        the key is only derived once per event.
+
+        To listen to every key key_fn returns, specify the constant
+        ``MATCH_ALL`` as key.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the listener
+        runs for an event with a matching key.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require a specific event type")
+        if not is_callback_check_partial(key_fn):
+            raise HomeAssistantError(f"Event key function {key_fn} is not a callback")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {key}"),
+            event_filter,
+        )
+        listeners_by_key = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            key_fn, {}
+        )
+        if (jobs := listeners_by_key.get(key)) is None:
+            listeners_by_key[key] = [filterable_job]
+        else:
+            jobs.append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, key_fn, key, filterable_job
+        )
+
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type in batches.
+
+        The listener is called with a list of events. Events fired with
+        async_fire are delivered as a list with a single event, events
+        fired with async_fire_batch_internal, such as the state changes
+        written by StateMachine.async_set_many, are delivered in a
+        single call so the listener can handle them in one pass.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Batch listeners require a specific event type")
+        job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None] = HassJob(
+            listener, f"listen batch {event_type}"
+        )
+        self._batch_listeners.setdefault(event_type, []).append(job)
+        return functools.partial(self._async_remove_batch_listener, event_type, job)
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1742,6 +1934,81 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_batch_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a batch listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            batch_jobs = self._batch_listeners[event_type]
+            batch_jobs.remove(job)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown batch job listener %s", job)
+            return
+        if not batch_jobs:
+            del self._batch_listeners[event_type]
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key_fn: Callable[[_DataT], Hashable | None],
+        key: Hashable,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            listeners_by_key = keyed_listeners[key_fn]
+            jobs = listeners_by_key[key]
+            jobs.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        # prune empty containers so dispatch never calls unused key functions
+        if not jobs:
+            del listeners_by_key[key]
+            if not listeners_by_key:
+                del keyed_listeners[key_fn]
+                if not keyed_listeners:
+                    del self._keyed_listeners[event_type]
+
+
+@callback
+def _async_match_keyed_listeners(
+    keyed_listeners: dict[
+        Callable[[Any], Hashable | None],
+        dict[Hashable, list[_FilterableJobType[Any]]],
+    ],
+    event_data: Any,
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listeners that match the event data."""
+    matched: list[_FilterableJobType[Any]] = []
+    for key_fn, listeners_by_key in keyed_listeners.items():
+        try:
+            key = key_fn(event_data)
+        except Exception:
+            _LOGGER.exception("Error in event key function")
+            continue
+        if key is None:
+            continue
+        if jobs := listeners_by_key.get(key):
+            matched += jobs
+        if key != MATCH_ALL and (jobs := listeners_by_key.get(MATCH_ALL)):
+            matched += jobs
+    return matched
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -2064,10 +2331,76 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# Values of these types are equal only when they serialize identically
+_SIMPLE_ATTRIBUTE_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _attribute_intern_key(value: Any) -> Hashable:
+    """Return a key which is only equal for values serializing identically.
+
+    Only scalars and tuples of them are supported since values of other types
+    can be mutable or compare equal while having a different type.
+    """
+    if value is None or isinstance(value, (str, int)):
+        return (type(value), value)
+    if isinstance(value, float):
+        # hex tells 0.0 and -0.0 apart and makes nan equal to itself
+        return (type(value), value.hex())
+    if type(value) is tuple:
+        return (tuple, tuple(_attribute_intern_key(item) for item in value))
+    raise TypeError(f"Attribute values of type {type(value)} are not interned")
+
+
+class _StateAttributesInterner:
+    """Share identical attribute mappings between states.
+
+    Mappings are looked up by their keys in order and the type and value
+    of each of their values, so a shared mapping always serializes the same
+    as the mapping it replaces. Mappings with values other than scalars or
+    tuples of scalars are never shared.
+    """
+
+    __slots__ = ("_attributes",)
+
+    def __init__(self) -> None:
+        """Initialize the interner."""
+        self._attributes: weakref.WeakValueDictionary[
+            Hashable, ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
+
+    def intern(self, attributes: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return a shared mapping equal to attributes."""
+        value_types = tuple(map(type, attributes.values()))
+        key: Hashable
+        if _SIMPLE_ATTRIBUTE_TYPES.issuperset(value_types):
+            key = (tuple(attributes.items()), value_types)
+        else:
+            try:
+                key = tuple(
+                    (name, _attribute_intern_key(value))
+                    for name, value in attributes.items()
+                )
+            except TypeError:
+                return attributes
+        if (interned := self._attributes.get(key)) is not None:
+            return interned
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        self._attributes[key] = attributes
+        return attributes
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_attributes_interner",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2411,7 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._attributes_interner: _StateAttributesInterner | None = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2253,6 +2587,21 @@ class StateMachine:
             entity_id not in self._states_data and entity_id not in self._reservations
         )
 
+    @callback
+    def async_set_attribute_interning(self, enabled: bool) -> None:
+        """Enable or disable sharing identical attribute mappings.
+
+        When enabled, new states with attributes equal to those of
+        another live state reference the same ReadOnlyDict, which
+        reduces memory use on systems with many similar entities.
+
+        This method must be run in the event loop.
+        """
+        if not enabled:
+            self._attributes_interner = None
+        elif self._attributes_interner is None:
+            self._attributes_interner = _StateAttributesInterner()
+
     @callback
     def async_set(
         self,
@@ -2312,6 +2661,163 @@ class StateMachine:
             old_state = self._states_data[entity_id]
         except KeyError:
             old_state = None
+
+        if (
+            state := self._async_new_state(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                timestamp,
+                old_state,
+            )
+        ) is None:
+            return
+
+        if old_state is not None:
+            old_state.expire()
+        self._states[entity_id] = state
+        state_changed_data: EventStateChangedData = {
+            "entity_id": entity_id,
+            "old_state": old_state,
+            "new_state": state,
+        }
+        self._bus.async_fire_internal(
+            EVENT_STATE_CHANGED,
+            state_changed_data,
+            context=state.context,
+            time_fired=timestamp,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities at once.
+
+        Each item is a tuple of entity_id, state and attributes.
+
+        All new states are committed to the state machine before any
+        state_changed event is fired, and the events are fired as a
+        single batch on the bus.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        self.async_set_many_internal(
+            [
+                (
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+                for entity_id, new_state, attributes in states
+            ]
+        )
+
+    @callback
+    def async_set_many_internal(
+        self,
+        states: Iterable[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+                float,
+            ]
+        ],
+    ) -> None:
+        """Set the state of multiple entities at once.
+
+        Each item is a tuple of the arguments of async_set_internal.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        states_data = self._states_data
+        pending: dict[str, State] = {}
+        batch: list[tuple[EventStateChangedData, Context | None, float | None]] = []
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+        ) in states:
+            old_state = pending.get(entity_id) or states_data.get(entity_id)
+            if (
+                state := self._async_new_state(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    state_info,
+                    timestamp,
+                    old_state,
+                )
+            ) is None:
+                continue
+            pending[entity_id] = state
+            batch.append(
+                (
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": state,
+                    },
+                    state.context,
+                    timestamp,
+                )
+            )
+
+        if not batch:
+            return
+        # Only commit once every state has been created so an invalid
+        # state does not leave the batch partially applied.
+        for state_changed_data, _, _ in batch:
+            if (old_state := state_changed_data["old_state"]) is not None:
+                old_state.expire()
+        for entity_id, state in pending.items():
+            self._states[entity_id] = state
+        self._bus.async_fire_batch_internal(EVENT_STATE_CHANGED, batch)
+
+    @callback
+    def _async_new_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        state_info: StateInfo | None,
+        timestamp: float,
+        old_state: State | None,
+    ) -> State | None:
+        """Create the new state of an entity.
+
+        Returns None and fires EVENT_STATE_REPORTED instead if neither
+        the state nor the attributes changed.
+        """
+        if old_state is None:
             same_state = False
             same_attr = False
             last_changed = None
@@ -2352,16 +2858,18 @@ class StateMachine:
                 context=context,
                 time_fired=timestamp,
             )
-            return
+            return None
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif self._attributes_interner is not None and attributes:
+            attributes = self._attributes_interner.intern(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
-        state = State(
+        return State(
             entity_id,
             new_state,
             attributes,
@@ -2373,20 +2881,6 @@ class StateMachine:
             state_info,
             timestamp,
         )
-        if old_state is not None:
-            old_state.expire()
-        self._states[entity_id] = state
-        state_changed_data: EventStateChangedData = {
-            "entity_id": entity_id,
-            "old_state": old_state,
-            "new_state": state,
-        }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
 
 
 class SupportsResponse(enum.StrEnum):
@@ -568,16 +568,18 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
     def __init__(self) -> None:
         """Initialize the container.
 
-        Maintains three additional indexes:
+        Maintains four additional indexes:
 
         - area_id -> dict[key, True]
         - config_entry_id -> dict[key, True]
         - label -> dict[key, True]
+        - name -> dict[key, True], using name_by_user when it's set
         """
         super().__init__()
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._name_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: DeviceEntry) -> None:
         """Index an entry."""
@@ -588,6 +590,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
             self._labels_index[label][key] = True
         for config_entry_id in entry.config_entries:
             self._config_entry_id_index[config_entry_id][key] = True
+        if name := entry.name_by_user or entry.name:
+            self._index_entry_value(key, name, self._name_index)
 
     def _unindex_entry(
         self, key: str, replacement_entry: DeviceEntry | None = None
@@ -601,6 +605,8 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
                 self._unindex_entry_value(key, label, self._labels_index)
         for config_entry_id in entry.config_entries:
             self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
+        if name := entry.name_by_user or entry.name:
+            self._unindex_entry_value(key, name, self._name_index)
         super()._unindex_entry(key, replacement_entry)
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
@@ -622,6 +628,10 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
             data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
+    def get_devices_for_name(self, name: str) -> list[DeviceEntry]:
+        """Get devices for name, using name_by_user when it's set."""
+        return self._get_entries_for_value(name, self._name_index)
+
 
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
@@ -639,6 +649,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABCMeta
 import asyncio
-from collections import deque
+from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine, Iterable, Mapping
 import dataclasses
 from enum import Enum, auto
@@ -75,6 +75,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_ENTITY_SOURCE_DOMAINS = "entity_info_domains"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +101,20 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@singleton.singleton(DATA_ENTITY_SOURCE_DOMAINS)
+def _entity_sources_domain_index(
+    hass: HomeAssistant,
+) -> defaultdict[str, dict[str, Literal[True]]]:
+    """Get the index of entity sources by integration domain."""
+    return defaultdict(dict)
+
+
+@callback
+def entity_sources_for_domain(hass: HomeAssistant, domain: str) -> list[str]:
+    """Get the entity ids of the entity sources of an integration domain."""
+    return list(_entity_sources_domain_index(hass).get(domain, ()))
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -1473,6 +1488,9 @@ class Entity(
             entity_info["config_entry"] = self.platform.config_entry.entry_id
 
         entity_sources(self.hass)[self.entity_id] = entity_info
+        _entity_sources_domain_index(self.hass)[entity_info["domain"]][
+            self.entity_id
+        ] = True
 
         self._state_info = {
             "unrecorded_attributes": self.__combined_unrecorded_attributes
@@ -1502,7 +1520,12 @@ class Entity(
         # The check for self.platform guards against integrations not using an
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
-            del entity_sources(self.hass)[self.entity_id]
+            entity_info = entity_sources(self.hass).pop(self.entity_id)
+            domain_index = _entity_sources_domain_index(self.hass)
+            entity_ids = domain_index[entity_info["domain"]]
+            del entity_ids[self.entity_id]
+            if not entity_ids:
+                del domain_index[entity_info["domain"]]
 
     @callback
     def _async_registry_updated(
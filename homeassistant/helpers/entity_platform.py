@@ -548,9 +548,9 @@ class EntityPlatform:
 
     async def _async_add_and_update_entities(
         self,
-        coros: list[Coroutine[Any, Any, None]],
         entities: list[Entity],
         timeout: float,
+        entity_registry: EntityRegistry,
     ) -> None:
         """Add entities for a single platform and update them.
 
@@ -560,7 +560,13 @@ class EntityPlatform:
         event loop and will finish faster if we run them concurrently.
         """
         results: list[BaseException | None] | None = None
-        tasks = [create_eager_task(coro, loop=self.hass.loop) for coro in coros]
+        tasks = [
+            create_eager_task(
+                self._async_add_entity(entity, True, entity_registry),
+                loop=self.hass.loop,
+            )
+            for entity in entities
+        ]
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
                 results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -577,44 +583,45 @@ class EntityPlatform:
 
         for idx, result in enumerate(results):
             if isinstance(result, Exception):
-                entity = entities[idx]
-                self.logger.exception(
-                    "Error adding entity %s for domain %s with platform %s",
-                    entity.entity_id,
-                    self.domain,
-                    self.platform_name,
-                    exc_info=result,
-                )
+                self._log_add_entity_error(entities[idx], result)
             elif isinstance(result, BaseException):
                 raise result
 
     async def _async_add_entities(
         self,
-        coros: list[Coroutine[Any, Any, None]],
         entities: list[Entity],
         timeout: float,
+        entity_registry: EntityRegistry,
     ) -> None:
         """Add entities for a single platform without updating.
 
-        In this case we are not updating the entities before adding them
-        which means it is likely that we will not have to yield control
-        to the event loop so we can await the coros directly without
-        scheduling them as tasks.
+        The registry entries of all entities are resolved first, in a single
+        pass which does not yield to the event loop and schedules at most one
+        save of the registries. In this case we are not updating the entities
+        before adding them which means it is likely that we will not have to
+        yield control to the event loop while finishing the add so we can
+        await the entities directly without scheduling them as tasks.
         """
+        registered: list[Entity] = []
+        with (
+            entity_registry.async_defer_save(),
+            dev_reg.async_get(self.hass).async_defer_save(),
+        ):
+            for entity in entities:
+                try:
+                    self._async_start_add_entity(entity)
+                    if self._async_register_entity(entity, entity_registry):
+                        registered.append(entity)
+                except Exception as ex:  # noqa: BLE001
+                    self._log_add_entity_error(entity, ex)
+
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                for idx, coro in enumerate(coros):
+                for entity in registered:
                     try:
-                        await coro
-                    except Exception as ex:
-                        entity = entities[idx]
-                        self.logger.exception(
-                            "Error adding entity %s for domain %s with platform %s",
-                            entity.entity_id,
-                            self.domain,
-                            self.platform_name,
-                            exc_info=ex,
-                        )
+                        await entity.add_to_platform_finish()
+                    except Exception as ex:  # noqa: BLE001
+                        self._log_add_entity_error(entity, ex)
         except TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -623,6 +630,16 @@ class EntityPlatform:
                 timeout,
             )
 
+    def _log_add_entity_error(self, entity: Entity, ex: Exception) -> None:
+        """Log an error adding an entity."""
+        self.logger.exception(
+            "Error adding entity %s for domain %s with platform %s",
+            entity.entity_id,
+            self.domain,
+            self.platform_name,
+            exc_info=ex,
+        )
+
     async def async_add_entities(
         self, new_entities: Iterable[Entity], update_before_add: bool = False
     ) -> None:
@@ -634,27 +651,20 @@ class EntityPlatform:
         if not new_entities:  # type: ignore[truthy-iterable]
             return
 
-        hass = self.hass
-        entity_registry = ent_reg.async_get(hass)
-        coros: list[Coroutine[Any, Any, None]] = []
-        entities: list[Entity] = []
-        for entity in new_entities:
-            coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
-            )
-            entities.append(entity)
+        entities = list(new_entities)
 
         # No entities for processing
-        if not coros:
+        if not entities:
             return
 
-        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(coros), SLOW_ADD_MIN_TIMEOUT)
+        entity_registry = ent_reg.async_get(self.hass)
+        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(entities), SLOW_ADD_MIN_TIMEOUT)
         if update_before_add:
             add_func = self._async_add_and_update_entities
         else:
             add_func = self._async_add_entities
 
-        await add_func(coros, entities, timeout)
+        await add_func(entities, timeout, entity_registry)
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
@@ -714,21 +724,14 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
-    async def _async_add_entity(  # noqa: C901
+    async def _async_add_entity(
         self,
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
     ) -> None:
         """Add an entity to the platform."""
-        if entity is None:
-            raise ValueError("Entity cannot be None")
-
-        entity.add_to_platform_start(
-            self.hass,
-            self,
-            self._get_parallel_updates_semaphore(hasattr(entity, "update")),
-        )
+        self._async_start_add_entity(entity)
 
         # Update properties before we generate the entity_id. This will happen
         # also for disabled entities.
@@ -740,6 +743,29 @@ class EntityPlatform:
                 entity.add_to_platform_abort()
                 return
 
+        if self._async_register_entity(entity, entity_registry):
+            await entity.add_to_platform_finish()
+
+    @callback
+    def _async_start_add_entity(self, entity: Entity) -> None:
+        """Start adding an entity to the platform."""
+        if entity is None:
+            raise ValueError("Entity cannot be None")
+
+        entity.add_to_platform_start(
+            self.hass,
+            self,
+            self._get_parallel_updates_semaphore(hasattr(entity, "update")),
+        )
+
+    @callback
+    def _async_register_entity(  # noqa: C901
+        self, entity: Entity, entity_registry: EntityRegistry
+    ) -> bool:
+        """Register an entity and reserve its entity_id.
+
+        Returns False if adding the entity was aborted.
+        """
         suggested_object_id: str | None = None
 
         entity_name = entity.name
@@ -772,7 +798,7 @@ class EntityPlatform:
                         )
                     self.logger.error(msg)
                     entity.add_to_platform_abort()
-                    return
+                    return False
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
@@ -787,7 +813,7 @@ class EntityPlatform:
                         str(exc),
                     )
                     entity.add_to_platform_abort()
-                    return
+                    return False
             else:
                 device = None
 
@@ -891,7 +917,7 @@ class EntityPlatform:
                 "Entity id already exists - ignoring: %s", entity.entity_id
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         if entity.registry_entry and entity.registry_entry.disabled:
             self.logger.debug(
@@ -901,7 +927,7 @@ class EntityPlatform:
                 or f'"{self.platform_name} {entity.unique_id}"',
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
@@ -923,8 +949,7 @@ class EntityPlatform:
             del self.domain_platform_entities[entity_id]
 
         entity.async_on_remove(remove_entity_cb)
-
-        await entity.add_to_platform_finish()
+        return True
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
@@ -549,13 +549,18 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains eleven additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+    - domain -> dict[key, True]
+    - platform -> dict[key, True]
+    - device_id -> dict[key, True] for entries inheriting the area of their device
+    - disabled_by -> dict[key, True]
+    - hidden_by -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -567,21 +572,32 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._domain_index: RegistryIndexType = defaultdict(dict)
+        self._platform_index: RegistryIndexType = defaultdict(dict)
+        self._device_area_index: RegistryIndexType = defaultdict(dict)
+        self._disabled_by_index: RegistryIndexType = defaultdict(dict)
+        self._hidden_by_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
-        # python has no ordered set, so we use a dict with True values
-        # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
+        self._index_entry_value(key, entry.domain, self._domain_index)
+        self._index_entry_value(key, entry.platform, self._platform_index)
         if (config_entry_id := entry.config_entry_id) is not None:
-            self._config_entry_id_index[config_entry_id][key] = True
+            self._index_entry_value(key, config_entry_id, self._config_entry_id_index)
         if (device_id := entry.device_id) is not None:
-            self._device_id_index[device_id][key] = True
+            self._index_entry_value(key, device_id, self._device_id_index)
+            if entry.area_id is None:
+                self._index_entry_value(key, device_id, self._device_area_index)
         if (area_id := entry.area_id) is not None:
-            self._area_id_index[area_id][key] = True
+            self._index_entry_value(key, area_id, self._area_id_index)
         for label in entry.labels:
-            self._labels_index[label][key] = True
+            self._index_entry_value(key, label, self._labels_index)
+        if (disabled_by := entry.disabled_by) is not None:
+            self._index_entry_value(key, disabled_by, self._disabled_by_index)
+        if (hidden_by := entry.hidden_by) is not None:
+            self._index_entry_value(key, hidden_by, self._hidden_by_index)
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -590,15 +606,23 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         entry = self.data[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._unindex_entry_value(key, entry.domain, self._domain_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
         if config_entry_id := entry.config_entry_id:
             self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
         if device_id := entry.device_id:
             self._unindex_entry_value(key, device_id, self._device_id_index)
+            if entry.area_id is None:
+                self._unindex_entry_value(key, device_id, self._device_area_index)
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
+        if disabled_by := entry.disabled_by:
+            self._unindex_entry_value(key, disabled_by, self._disabled_by_index)
+        if hidden_by := entry.hidden_by:
+            self._unindex_entry_value(key, hidden_by, self._hidden_by_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -623,24 +647,47 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             if not (entry := data[key]).disabled_by or include_disabled_entities
         ]
 
+    def get_entries_for_device_area(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries of a device which inherit the area of the device.
+
+        These are the entries of the device which have no area set themselves.
+        Disabled entries are included.
+        """
+        return self._get_entries_for_value(device_id, self._device_area_index)
+
     def get_entries_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
-        data = self.data
-        return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
-        ]
+        return self._get_entries_for_value(config_entry_id, self._config_entry_id_index)
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return self._get_entries_for_value(area_id, self._area_id_index)
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return self._get_entries_for_value(label, self._labels_index)
+
+    def get_entries_for_domain(self, domain: str) -> list[RegistryEntry]:
+        """Get entries for entity domain."""
+        return self._get_entries_for_value(domain, self._domain_index)
+
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        return self._get_entries_for_value(platform, self._platform_index)
+
+    def get_entries_for_disabled_by(
+        self, disabled_by: RegistryEntryDisabler
+    ) -> list[RegistryEntry]:
+        """Get entries disabled by a disabler."""
+        return self._get_entries_for_value(disabled_by, self._disabled_by_index)
+
+    def get_entries_for_hidden_by(
+        self, hidden_by: RegistryEntryHider
+    ) -> list[RegistryEntry]:
+        """Get entries hidden by a hider."""
+        return self._get_entries_for_value(hidden_by, self._hidden_by_index)
 
 
 def _validate_item(
@@ -713,6 +760,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial, wraps
 import logging
@@ -101,27 +100,20 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
     dispatcher_callable: Callable[
         [
             HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+            list[HassJob[[Event[_TypedDictT]], Any]],
             Event[_TypedDictT],
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    key_callable: Callable[[_TypedDictT], str | None]
 
 
 @dataclass(slots=True, frozen=True)
 class _KeyedEventData(Generic[_TypedDictT]):
     """Class to track data for events by key."""
 
-    listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    listeners: dict[str, CALLBACK_TYPE]
+    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
 
 
 @dataclass(slots=True)
@@ -131,11 +123,15 @@ class TrackStates:
     all_states: All states on the system are being tracked
     entities: Lowercased entities to track
     domains: Lowercased domains to track
+    entity_attributes: Entities of which only changes of the state or of
+      the given attributes are tracked, ignored for entities in tracked
+      domains or when all states are tracked
     """
 
     all_states: bool
     entities: set[str]
     domains: set[str]
+    entity_attributes: dict[str, frozenset[str]] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -310,6 +306,7 @@ def async_track_state_change_event(
     entity_ids: str | Iterable[str],
     action: Callable[[Event[EventStateChangedData]], Any],
     job_type: HassJobType | None = None,
+    attributes: Iterable[str] | None = None,
 ) -> CALLBACK_TYPE:
     """Track specific state change events indexed by entity_id.
 
@@ -323,34 +320,38 @@ def async_track_state_change_event(
     do a fast dict lookup to route events.
     The passed in entity_ids will be automatically lower cased.
 
+    If attributes is passed, the action is only called when the entity
+    is added or removed, or when its state or one of the attributes
+    changed. Pass an empty iterable to only track changes of the state.
+
     EVENT_STATE_CHANGED is fired on each occasion the state is updated
     and changed, opposite of EVENT_STATE_REPORTED.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
-    return _async_track_state_change_event(hass, entity_ids, action, job_type)
+    return _async_track_state_change_event(
+        hass, entity_ids, action, job_type, attributes
+    )
 
 
 @callback
 def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    jobs: list[HassJob[[Event[_StateEventDataT]], Any]],
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
+    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, jobs, event)
 
 
 @callback
 def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    jobs: list[HassJob[[Event[_StateEventDataT]], Any]],
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
+    for job in jobs.copy():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -362,20 +363,37 @@ def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
 
 
 @callback
-def _async_state_filter[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+def _async_entity_id_key[_StateEventDataT: EventStateEventData](
     event_data: _StateEventDataT,
+) -> str:
+    """Key state events by entity_id."""
+    return event_data["entity_id"]
+
+
+@callback
+def _async_state_or_attributes_changed(
+    attributes: frozenset[str], event_data: EventStateChangedData
 ) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
+    """Return if the state or one of the attributes changed."""
+    if (old_state := event_data["old_state"]) is None or (
+        new_state := event_data["new_state"]
+    ) is None:
+        return True
+    if old_state.state != new_state.state:
+        return True
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    return any(
+        old_attributes.get(attribute) != new_attributes.get(attribute)
+        for attribute in attributes
+    )
 
 
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    key_callable=_async_entity_id_key,
 )
 
 
@@ -385,13 +403,21 @@ def _async_track_state_change_event(
     entity_ids: str | Iterable[str],
     action: Callable[[Event[EventStateChangedData]], Any],
     job_type: HassJobType | None,
+    attributes: Iterable[str] | None = None,
 ) -> CALLBACK_TYPE:
     """Faster version of async_track_state_change_event.
 
     The passed in entity_ids will not be automatically lower cased.
     """
     return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
+        _KEYED_TRACK_STATE_CHANGE,
+        hass,
+        entity_ids,
+        action,
+        job_type,
+        None
+        if attributes is None
+        else partial(_async_state_or_attributes_changed, frozenset(attributes)),
     )
 
 
@@ -399,7 +425,7 @@ _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
     key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    key_callable=_async_entity_id_key,
 )
 
 
@@ -430,16 +456,76 @@ def _remove_listener(
     tracker: _KeyedEventTracker[_TypedDictT],
     keys: Iterable[str],
     job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+    keyed_data: _KeyedEventData[_TypedDictT],
 ) -> None:
     """Remove listener."""
+    callbacks = keyed_data.callbacks
     for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
+        key_callbacks = callbacks[key]
+        key_callbacks.remove(job)
+        if not key_callbacks:
             del callbacks[key]
+            keyed_data.listeners.pop(key)()
 
     if not callbacks:
-        hass.data.pop(tracker.key).listener()
+        del hass.data[tracker.key]
+
+
+@callback
+def _async_add_keyed_job(
+    hass: HomeAssistant,
+    tracker: _KeyedEventTracker[_TypedDictT],
+    keyed_data: _KeyedEventData[_TypedDictT],
+    key: str,
+    job: HassJob[[Event[_TypedDictT]], Any],
+) -> None:
+    """Add a job for a key, listening on the bus for the first job of a key."""
+    if (key_callbacks := keyed_data.callbacks.get(key)) is not None:
+        key_callbacks.append(job)
+        return
+    keyed_data.callbacks[key] = key_callbacks = [job]
+    keyed_data.listeners[key] = hass.bus.async_listen_keyed(
+        tracker.event_type,
+        tracker.key_callable,
+        key,
+        partial(tracker.dispatcher_callable, hass, key_callbacks),
+    )
+
+
+@callback
+def _async_track_filtered_event(
+    tracker: _KeyedEventTracker[_TypedDictT],
+    hass: HomeAssistant,
+    keys: str | Iterable[str],
+    action: Callable[[Event[_TypedDictT]], None],
+    job_type: HassJobType | None,
+    event_filter: Callable[[_TypedDictT], bool],
+) -> CALLBACK_TYPE:
+    """Track an event by a specific key with an event filter."""
+    job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
+    dispatcher = partial(tracker.dispatcher_callable, hass, [job])
+    if isinstance(keys, str):
+        keys = (keys,)
+    return partial(
+        _remove_filtered_listeners,
+        [
+            hass.bus.async_listen_keyed(
+                tracker.event_type,
+                tracker.key_callable,
+                key,
+                dispatcher,
+                event_filter=event_filter,
+            )
+            for key in keys
+        ],
+    )
+
+
+@callback
+def _remove_filtered_listeners(listeners: list[CALLBACK_TYPE]) -> None:
+    """Remove the keyed listeners of a filtered job."""
+    for listener in listeners:
+        listener()
 
 
 # tracker, not hass is intentionally the first argument here since its
@@ -450,60 +536,56 @@ def _async_track_event(
     keys: str | Iterable[str],
     action: Callable[[Event[_TypedDictT]], None],
     job_type: HassJobType | None,
+    event_filter: Callable[[_TypedDictT], bool] | None = None,
 ) -> CALLBACK_TYPE:
     """Track an event by a specific key.
 
+    Each key gets its own keyed listener on the bus so firing an
+    event only reaches the jobs tracking its key.
+
+    Jobs with an event_filter get keyed listeners of their own, so the
+    bus filters the events before they are dispatched.
+
     This function is intended for internal use only.
     """
     if not keys:
         return _remove_empty_listener
 
+    if event_filter is not None:
+        return _async_track_filtered_event(
+            tracker, hass, keys, action, job_type, event_filter
+        )
+
     hass_data = hass.data
     tracker_key = tracker.key
     if tracker_key in hass_data:
-        event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
+        keyed_data = hass_data[tracker_key]
     else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
-        hass_data[tracker_key] = event_data
+        keyed_data = _KeyedEventData({}, {})
+        hass_data[tracker_key] = keyed_data
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
 
     if isinstance(keys, str):
         # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
+        # so we optimize for that case.
+        _async_add_keyed_job(hass, tracker, keyed_data, keys, job)
         keys = (keys,)
     else:
         for key in keys:
-            callbacks[key].append(job)
+            _async_add_keyed_job(hass, tracker, keyed_data, key, job)
 
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
+    return partial(_remove_listener, hass, tracker, keys, job, keyed_data)
 
 
 @callback
 def _async_dispatch_old_entity_id_or_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+    jobs: list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]],
     event: Event[EventEntityRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
+    for job in jobs.copy():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -515,20 +597,18 @@ def _async_dispatch_old_entity_id_or_entity_id_event(
 
 
 @callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+def _async_entity_registry_updated_key(
     event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
+) -> str:
+    """Key entity registry updates by old_entity_id or entity_id."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]
 
 
 _KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
     key=_TRACK_ENTITY_REGISTRY_UPDATED_DATA,
     event_type=EVENT_ENTITY_REGISTRY_UPDATED,
     dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
+    key_callable=_async_entity_registry_updated_key,
 )
 
 
@@ -552,25 +632,19 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
+def _async_device_id_key(event_data: EventDeviceRegistryUpdatedData) -> str:
+    """Key device registry updates by device_id."""
+    return event_data["device_id"]
 
 
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
+    jobs: list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]],
     event: Event[EventDeviceRegistryUpdatedData],
 ) -> None:
     """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
+    for job in jobs.copy():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -585,7 +659,7 @@ _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
     key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
     dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    key_callable=_async_device_id_key,
 )
 
 
@@ -608,34 +682,29 @@ def async_track_device_registry_updated_event(
 @callback
 def _async_dispatch_domain_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    jobs: list[HassJob[[Event[EventStateChangedData]], Any]],
     event: Event[EventStateChangedData],
 ) -> None:
     """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
+    for job in jobs.copy():
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
             _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
+                "Error while processing event %s for domain %s",
+                event,
+                split_entity_id(event.data["entity_id"])[0],
             )
 
 
 @callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_key(event_data: EventStateChangedData) -> str | None:
+    """Key state changes that add an entity by domain."""
+    if event_data["old_state"] is not None:
+        return None
+    # If old_state is None, new_state must be set but
+    # mypy doesn't know that
+    return event_data["new_state"].domain  # type: ignore[union-attr]
 
 
 @bind_hass
@@ -655,7 +724,7 @@ _KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
     key=_TRACK_STATE_ADDED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
+    key_callable=_async_domain_added_key,
 )
 
 
@@ -673,26 +742,20 @@ def _async_track_state_added_domain(
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_key(event_data: EventStateChangedData) -> str | None:
+    """Key state changes that remove an entity by domain."""
+    if event_data["new_state"] is not None:
+        return None
+    # If new_state is None, old_state must be set but
+    # mypy doesn't know that
+    return event_data["old_state"].domain  # type: ignore[union-attr]
 
 
 _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
     key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+    key_callable=_async_domain_removed_key,
 )
 
 
@@ -752,7 +815,11 @@ class _TrackStateChangeFiltered:
             return
 
         self._setup_domains_listener(track_states.domains)
-        self._setup_entities_listener(track_states.domains, track_states.entities)
+        self._setup_entities_listener(
+            track_states.domains,
+            track_states.entities,
+            track_states.entity_attributes,
+        )
 
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
@@ -794,10 +861,13 @@ class _TrackStateChangeFiltered:
             had_all_listener
             or domains_changed
             or new_track_states.entities != last_track_states.entities
+            or new_track_states.entity_attributes != last_track_states.entity_attributes
         ):
             self._cancel_listener(_ENTITIES_LISTENER)
             self._setup_entities_listener(
-                new_track_states.domains, new_track_states.entities
+                new_track_states.domains,
+                new_track_states.entities,
+                new_track_states.entity_attributes,
             )
 
     @callback
@@ -814,7 +884,12 @@ class _TrackStateChangeFiltered:
         self._listeners.pop(listener_name)()
 
     @callback
-    def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
+    def _setup_entities_listener(
+        self,
+        domains: set[str],
+        entities: set[str],
+        entity_attributes: dict[str, frozenset[str]],
+    ) -> None:
         if domains:
             entities = entities.copy()
             entities.update(self.hass.states.async_entity_ids(domains))
@@ -823,15 +898,40 @@ class _TrackStateChangeFiltered:
         if not entities:
             return
 
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
-            self.hass, entities, self._action, self._action_as_hassjob.job_type
+        # Entities of which only some attributes are used get listeners
+        # filtering out changes of other attributes, any change of an
+        # entity in a tracked domain is relevant
+        by_attributes: dict[frozenset[str] | None, list[str]] = {}
+        for entity_id in entities:
+            attributes = entity_attributes.get(entity_id)
+            if attributes is not None and split_entity_id(entity_id)[0] in domains:
+                attributes = None
+            by_attributes.setdefault(attributes, []).append(entity_id)
+
+        job_type = self._action_as_hassjob.job_type
+        if len(by_attributes) == 1 and None in by_attributes:
+            self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
+                self.hass, entities, self._action, job_type, None
+            )
+            return
+
+        self._listeners[_ENTITIES_LISTENER] = partial(
+            _remove_filtered_listeners,
+            [
+                _async_track_state_change_event(
+                    self.hass, entity_ids, self._action, job_type, attributes
+                )
+                for attributes, entity_ids in by_attributes.items()
+            ],
         )
 
     @callback
     def _state_added(self, event: Event[EventStateChangedData]) -> None:
         self._cancel_listener(_ENTITIES_LISTENER)
         self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
+            self._last_track_states.domains,
+            self._last_track_states.entities,
+            self._last_track_states.entity_attributes,
         )
         self.hass.async_run_hass_job(self._action_as_hassjob, event)
 
@@ -1007,6 +1107,21 @@ class TrackTemplateResultInfo:
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
+        # Positions of the templates a state change may re-render
+        self._entity_dependents: dict[str, list[int]] = {}
+        self._domain_dependents: dict[str, list[int]] = {}
+        self._lifecycle_dependents: dict[str, list[int]] = {}
+        self._always_dependents: list[int] = []
+
+        # Ids of the track templates rendered for an event in the current
+        # loop iteration and the track templates to render again with their
+        # last event once it ends
+        self._rendered_for_event: set[int] = set()
+        self._coalesced: dict[
+            int, tuple[TrackTemplate, Event[EventStateChangedData]]
+        ] = {}
+        self._iteration_task: asyncio.Task[None] | None = None
+
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<TrackTemplateResultInfo {self._info}>"
@@ -1062,6 +1177,7 @@ class TrackTemplateResultInfo:
         self._track_state_changes = async_track_state_change_filtered(
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
+        self._update_dependencies()
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1107,6 +1223,69 @@ class TrackTemplateResultInfo:
             self.hass, _refresh_from_time, second=0
         )
 
+    @callback
+    def _update_dependencies(self) -> None:
+        """Index the templates by the entities and domains they depend on."""
+        entity_dependents: dict[str, list[int]] = {}
+        domain_dependents: dict[str, list[int]] = {}
+        lifecycle_dependents: dict[str, list[int]] = {}
+        always_dependents: list[int] = []
+        for idx, track_template_ in enumerate(self._track_templates):
+            info = self._info.get(track_template_.template)
+            if (
+                info is None
+                or info.is_static
+                or info.exception
+                or info.all_states
+                or info.all_states_lifecycle
+            ):
+                always_dependents.append(idx)
+                continue
+            for entity_id in info.entities:
+                entity_dependents.setdefault(entity_id, []).append(idx)
+            for domain in info.domains:
+                domain_dependents.setdefault(domain, []).append(idx)
+            for domain in info.domains_lifecycle:
+                lifecycle_dependents.setdefault(domain, []).append(idx)
+        self._entity_dependents = entity_dependents
+        self._domain_dependents = domain_dependents
+        self._lifecycle_dependents = lifecycle_dependents
+        self._always_dependents = always_dependents
+
+    @callback
+    def _templates_for_event(
+        self, event: Event[EventStateChangedData]
+    ) -> list[TrackTemplate]:
+        """Return the templates a state change may re-render."""
+        entity_id = event.data["entity_id"]
+        domain = split_entity_id(entity_id)[0]
+        indexes = {
+            *self._always_dependents,
+            *self._entity_dependents.get(entity_id, ()),
+            *self._domain_dependents.get(domain, ()),
+        }
+        if event.data["old_state"] is None or event.data["new_state"] is None:
+            indexes.update(self._lifecycle_dependents.get(domain, ()))
+        track_templates = self._track_templates
+        return [track_templates[idx] for idx in sorted(indexes)]
+
+    async def _async_end_iteration(self) -> None:
+        """Render the coalesced templates again with their last event."""
+        self._iteration_task = None
+        self._rendered_for_event.clear()
+        if not (coalesced := self._coalesced):
+            return
+        self._coalesced = {}
+        by_event: dict[
+            int, tuple[Event[EventStateChangedData], list[TrackTemplate]]
+        ] = {}
+        for track_template_, event in coalesced.values():
+            by_event.setdefault(id(event), (event, []))[1].append(track_template_)
+        for event, track_templates in sorted(
+            by_event.values(), key=lambda item: item[0].time_fired_timestamp
+        ):
+            self._refresh(event, track_templates=track_templates)
+
     @callback
     def _update_time_listeners(self) -> None:
         for template, info in self._info.items():
@@ -1120,6 +1299,10 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        if self._iteration_task is not None:
+            self._iteration_task.cancel()
+            self._iteration_task = None
+        self._coalesced.clear()
 
     @callback
     def async_refresh(self) -> None:
@@ -1163,6 +1346,19 @@ class TrackTemplateResultInfo:
             ):
                 return not had_timer
 
+            if id(track_template_) in self._rendered_for_event:
+                # Render once more when the loop iteration ends
+                # instead of once for every event
+                self._coalesced[id(track_template_)] = (track_template_, event)
+                return False
+
+            self._rendered_for_event.add(id(track_template_))
+            if self._iteration_task is None:
+                # A task so async_block_till_done waits for the coalesced render
+                self._iteration_task = self.hass.async_create_task(
+                    self._async_end_iteration(), eager_start=False
+                )
+
             _LOGGER.debug(
                 "Template update %s triggered by event: %s",
                 template.template,
@@ -1242,7 +1438,12 @@ class TrackTemplateResultInfo:
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
 
-        track_templates = track_templates or self._track_templates
+        if not track_templates:
+            track_templates = (
+                self._track_templates
+                if event is None
+                else self._templates_for_event(event)
+            )
 
         # Update the super template first
         if super_template is not None:
@@ -1283,6 +1484,7 @@ class TrackTemplateResultInfo:
                 )
 
         if info_changed:
+            self._update_dependencies()
             assert self._track_state_changes
             self._track_state_changes.async_update_listeners(
                 _render_infos_to_track_states(
@@ -1943,6 +2145,31 @@ def _entities_domains_from_render_infos(
     return entities, domains
 
 
+@callback
+def _entity_attributes_from_render_infos(
+    render_infos: Iterable[RenderInfo],
+) -> dict[str, frozenset[str]]:
+    """Combine the entities of which only some attributes are used."""
+    entity_attributes: dict[str, set[str]] = {}
+    used_in_full: set[str] = set()
+
+    for render_info in render_infos:
+        attributes_by_entity = render_info.entity_attributes
+        for entity_id in render_info.entities:
+            if (attributes := attributes_by_entity.get(entity_id)) is None:
+                used_in_full.add(entity_id)
+            elif (combined := entity_attributes.get(entity_id)) is None:
+                entity_attributes[entity_id] = set(attributes)
+            else:
+                combined.update(attributes)
+
+    return {
+        entity_id: frozenset(attributes)
+        for entity_id, attributes in entity_attributes.items()
+        if entity_id not in used_in_full
+    }
+
+
 @callback
 def _render_infos_needs_all_listener(render_infos: Iterable[RenderInfo]) -> bool:
     """Determine if an all listener is needed from RenderInfo."""
@@ -1960,7 +2187,10 @@ def _render_infos_to_track_states(render_infos: Iterable[RenderInfo]) -> TrackSt
     if _render_infos_needs_all_listener(render_infos):
         return TrackStates(True, set(), set())
 
-    return TrackStates(False, *_entities_domains_from_render_infos(render_infos))
+    entities, domains = _entities_domains_from_render_infos(render_infos)
+    return TrackStates(
+        False, entities, domains, _entity_attributes_from_render_infos(render_infos)
+    )
 
 
 @callback
@@ -1969,11 +2199,25 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        if (
+            (attributes := info.entity_attributes.get(entity_id)) is None
+            or new_state is None
+            or old_state is None
+        ):
+            return True
+        # Only specific attributes of the entity were read
+        new_attributes = new_state.attributes
+        old_attributes = old_state.attributes
+        return any(
+            new_attributes.get(attribute) != old_attributes.get(attribute)
+            for attribute in attributes
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
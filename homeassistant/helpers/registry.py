@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Generator, Mapping, Sequence, ValuesView
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -43,6 +44,19 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         data[key] = entry
         self._index_entry(key, entry)
 
+    def _index_entry_value(
+        self, key: str, value: str, index: RegistryIndexType
+    ) -> None:
+        """Index an entry value.
+
+        key is the entry key
+        value is the value to index such as config_entry_id or device_id.
+        index is the index to add the entry to.
+        """
+        # python has no ordered set, so we use a dict with True values
+        # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
+        index[value][key] = True
+
     def _unindex_entry_value(
         self, key: str, value: str, index: RegistryIndexType
     ) -> None:
@@ -57,6 +71,13 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         if not entries:
             del index[value]
 
+    def _get_entries_for_value(
+        self, value: str, index: RegistryIndexType
+    ) -> list[_DataT]:
+        """Return the entries indexed under a value, in indexing order."""
+        data = self.data
+        return [data[key] for key in index.get(value, ())]
+
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         self._unindex_entry(key)
@@ -68,15 +89,38 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
 
     hass: HomeAssistant
     _store: Store[_StoreDataT]
+    _save_deferred = False
+    _save_pending = False
 
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the registry."""
+        if self._save_deferred:
+            self._save_pending = True
+            return
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
         self._store.async_delay_save(self._data_to_save, delay)
 
+    @contextmanager
+    def async_defer_save(self) -> Generator[None]:
+        """Schedule saving the registry once for all changes made in the context.
+
+        This must only be used around code which does not yield to the event loop.
+        """
+        if self._save_deferred:
+            yield
+            return
+        self._save_deferred = True
+        try:
+            yield
+        finally:
+            self._save_deferred = False
+            if self._save_pending:
+                self._save_pending = False
+                self.async_schedule_save()
+
     @callback
     @abstractmethod
     def _data_to_save(self) -> _StoreDataT:
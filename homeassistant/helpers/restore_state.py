@@ -17,7 +17,7 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -34,6 +34,9 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of an unchanged state may lag behind when dumping
+LAST_SEEN_REFRESH_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -119,10 +122,19 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journal_keys={None: "state.entity_id"},
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The dumped item of each entity, with the state, extra data and
+        # last seen time it was created from
+        self._dumped: dict[
+            str, tuple[State, bytes | None, datetime, dict[str, Any]]
+        ] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -198,17 +210,60 @@ class RestoreStateData:
 
         return stored_states
 
+    def _get_dump_items(
+        self,
+        stored_states: list[tuple[State, dict[str, Any] | None, datetime]],
+        dumped: dict[str, tuple[State, bytes | None, datetime, dict[str, Any]]],
+    ) -> dict[str, tuple[State, bytes | None, datetime, dict[str, Any]]]:
+        """Return the items to dump with the data they were created from.
+
+        The item of a stored state is reused if its state and extra data did
+        not change since the last dump, so only changed items are written.
+
+        Runs in the executor since the extra data of every stored state is
+        serialized to find out if it changed.
+        """
+        items: dict[str, tuple[State, bytes | None, datetime, dict[str, Any]]] = {}
+        for state, extra_data, last_seen in stored_states:
+            extra_data_json = json_bytes(extra_data) if extra_data is not None else None
+            if (
+                (item := dumped.get(state.entity_id)) is None
+                or item[0] is not state
+                or item[1] != extra_data_json
+                or last_seen - item[2] >= LAST_SEEN_REFRESH_INTERVAL
+            ):
+                item = (
+                    state,
+                    extra_data_json,
+                    last_seen,
+                    {
+                        "state": state.json_fragment,
+                        "extra_data": json_fragment(extra_data_json)
+                        if extra_data_json is not None
+                        else None,
+                        "last_seen": last_seen,
+                    },
+                )
+            items[state.entity_id] = item
+        return items
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = [
+            (
+                stored_state.state,
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None,
+                stored_state.last_seen,
+            )
+            for stored_state in self.async_get_stored_states()
+        ]
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+            self._dumped = await self.hass.async_add_executor_job(
+                self._get_dump_items, stored_states, self._dumped
             )
-        except HomeAssistantError as exc:
+            await self.store.async_save([item[3] for item in self._dumped.values()])
+        except (HomeAssistantError, TypeError) as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
     @callback
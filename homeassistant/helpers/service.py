@@ -11,6 +11,7 @@ import logging
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
@@ -32,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -80,6 +82,25 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[TargetResolutionCache] = HassKey(
+    "service_target_resolution_cache"
+)
+
+TARGET_RESOLUTION_CACHE_SIZE = 256
+
+# Changes of registry entries which can change the resolved targets
+_ENTITY_TARGET_CHANGES = {
+    "area_id",
+    "device_id",
+    "disabled_by",
+    "entity_category",
+    "entity_id",
+    "hidden_by",
+    "labels",
+}
+_DEVICE_TARGET_CHANGES = {"area_id", "labels"}
+
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
 
 
 @cache
@@ -306,6 +327,102 @@ class SelectedEntities:
         )
 
 
+class TargetResolutionCache:
+    """Cache the entities resolved from device, area, floor and label targets.
+
+    The cache is cleared when a registry changes in a way which can change
+    the resolved entities.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache and listen for registry changes."""
+        self.hits = 0
+        self.misses = 0
+        self._resolved: LRU[_TargetKey, SelectedEntities] = LRU(
+            TARGET_RESOLUTION_CACHE_SIZE
+        )
+        bus = hass.bus
+        bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_invalidate,
+            event_filter=self._async_entity_registry_filter,
+        )
+        bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_invalidate,
+            event_filter=self._async_device_registry_filter,
+        )
+        bus.async_listen(
+            area_registry.EVENT_AREA_REGISTRY_UPDATED, self._async_invalidate
+        )
+        bus.async_listen(
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            self._async_invalidate,
+            event_filter=self._async_floor_or_label_registry_filter,
+        )
+        bus.async_listen(
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+            self._async_invalidate,
+            event_filter=self._async_floor_or_label_registry_filter,
+        )
+
+    @callback
+    def async_get(self, key: _TargetKey) -> SelectedEntities | None:
+        """Return the cached resolved targets."""
+        if (resolved := self._resolved.get(key)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resolved
+
+    @callback
+    def async_set(self, key: _TargetKey, resolved: SelectedEntities) -> None:
+        """Cache resolved targets."""
+        self._resolved[key] = resolved
+
+    @callback
+    def _async_invalidate(self, event: Event[Any]) -> None:
+        """Clear the cache."""
+        self._resolved.clear()
+
+    @callback
+    def _async_entity_registry_filter(
+        self, event_data: entity_registry.EventEntityRegistryUpdatedData
+    ) -> bool:
+        """Filter entity registry events which can't change resolved targets."""
+        if event_data["action"] != "update":
+            return True
+        return not _ENTITY_TARGET_CHANGES.isdisjoint(event_data["changes"])
+
+    @callback
+    def _async_device_registry_filter(
+        self, event_data: device_registry.EventDeviceRegistryUpdatedData
+    ) -> bool:
+        """Filter device registry events which can't change resolved targets."""
+        if event_data["action"] != "update":
+            return True
+        return not _DEVICE_TARGET_CHANGES.isdisjoint(event_data["changes"])
+
+    @callback
+    def _async_floor_or_label_registry_filter(
+        self,
+        event_data: floor_registry.EventFloorRegistryUpdatedData
+        | label_registry.EventLabelRegistryUpdatedData,
+    ) -> bool:
+        """Filter renames of floors and labels, which can't change targets."""
+        return event_data["action"] != "update"
+
+
+@callback
+def async_get_target_resolution_cache(hass: HomeAssistant) -> TargetResolutionCache:
+    """Return the cache of resolved service call targets."""
+    if (resolution_cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        resolution_cache = hass.data[TARGET_RESOLUTION_CACHE] = TargetResolutionCache(
+            hass
+        )
+    return resolution_cache
+
+
 @bind_hass
 def call_from_config(
     hass: HomeAssistant,
@@ -503,7 +620,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -527,6 +644,37 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    if not selector.area_ids and not selector.floor_ids and not selector.label_ids:
+        _async_resolve_registry_targets(hass, selector, selected)
+        return selected
+
+    resolution_cache = async_get_target_resolution_cache(hass)
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := resolution_cache.async_get(key)) is None:
+        resolved = SelectedEntities()
+        _async_resolve_registry_targets(hass, selector, resolved)
+        resolution_cache.async_set(key, resolved)
+
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector, selected: SelectedEntities
+) -> None:
+    """Resolve device, area, floor and label targets through the registries."""
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -576,7 +724,7 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     selected.referenced_devices.update(selector.device_ids)
 
     if not selected.referenced_areas and not selected.referenced_devices:
-        return selected
+        return
 
     # Add indirectly referenced by device
     selected.indirectly_referenced.update(
@@ -612,23 +760,18 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     selected.indirectly_referenced.update(
         entry.entity_id
         for device_id in referenced_devices_by_area
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
+        # The entity's device matches a device referenced by an area
+        # and the entity has no explicitly set area
+        for entry in entities.get_entries_for_device_area(device_id)
+        # Do not add entities which are disabled, hidden or which are
+        # config or diagnostic entities.
         if (
-            entry.entity_category is None
+            entry.disabled_by is None
+            and entry.entity_category is None
             and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-            )
         )
     )
 
-    return selected
-
 
 @bind_hass
 async def async_extract_config_entry_ids(
@@ -1163,10 +1306,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in reg.entities.get_entries_for_platform(domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
@@ -0,0 +1,169 @@
+"""Trace where time is spent while Home Assistant is starting up."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+SPAN_INTEGRATION = "integration"
+"""Time from requesting the set up of an integration until it is done."""
+SPAN_IMPORT = "import"
+"""Import of the integration, including the wait for the import executor."""
+SPAN_IMPORT_PLATFORMS = "import_platforms"
+"""Import of platforms of the integration."""
+SPAN_WAIT_DEPENDENCIES = "wait_dependencies"
+"""Wait for the dependencies of the integration to be set up."""
+SPAN_STAGE = "stage"
+"""A bootstrap stage, the domain of the span is the name of the stage."""
+
+
+@dataclass(slots=True)
+class StartupSpan:
+    """A timed part of the startup."""
+
+    domain: str
+    kind: str
+    group: str | None
+    start: float
+    end: float
+    queue_wait: float = 0
+
+    def as_dict(self, offset: float) -> dict[str, Any]:
+        """Return a dictionary with times relative to the given offset."""
+        return {
+            "domain": self.domain,
+            "kind": self.kind,
+            "group": self.group,
+            "start": round(self.start - offset, 3),
+            "end": round(self.end - offset, 3),
+            "queue_wait": round(self.queue_wait, 3),
+        }
+
+
+class StartupTrace:
+    """Record the spans of the startup and the dependencies waited on."""
+
+    def __init__(self) -> None:
+        """Initialize the startup trace."""
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self.spans: list[StartupSpan] = []
+        self.dependencies: defaultdict[str, set[str]] = defaultdict(set)
+
+    @callback
+    def async_add_span(
+        self,
+        domain: str,
+        kind: str,
+        start: float,
+        end: float,
+        group: str | None = None,
+        queue_wait: float = 0,
+    ) -> None:
+        """Add a span to the trace."""
+        self.spans.append(StartupSpan(domain, kind, group, start, end, queue_wait))
+
+    @callback
+    def async_add_dependencies(self, domain: str, dependencies: Iterable[str]) -> None:
+        """Add the dependencies an integration waited on."""
+        self.dependencies[domain].update(dependencies)
+
+    @callback
+    def async_finish(self) -> None:
+        """Stop recording."""
+        self.finished = time.monotonic()
+
+    @callback
+    def async_critical_path(self) -> list[dict[str, Any]]:
+        """Return the chain of integrations which finished setting up last.
+
+        The path starts with the integration which finished last and follows
+        the dependency each integration waited on the longest. The self time
+        of an integration is the time spent after its last dependency was done.
+        """
+        integrations = {
+            span.domain: span for span in self.spans if span.kind == SPAN_INTEGRATION
+        }
+        if not integrations:
+            return []
+        path: list[dict[str, Any]] = []
+        span = max(integrations.values(), key=lambda span: span.end)
+        seen: set[str] = set()
+        while span.domain not in seen:
+            seen.add(span.domain)
+            waited_on = max(
+                (
+                    integrations[dep]
+                    for dep in self.dependencies.get(span.domain, ())
+                    if dep in integrations
+                ),
+                key=lambda span: span.end,
+                default=None,
+            )
+            ready = span.start if waited_on is None else max(span.start, waited_on.end)
+            path.append(
+                {
+                    "domain": span.domain,
+                    "start": round(span.start - self.started, 3),
+                    "end": round(span.end - self.started, 3),
+                    "self_time": round(span.end - ready, 3),
+                }
+            )
+            if waited_on is None:
+                break
+            span = waited_on
+        path.reverse()
+        return path
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary with the spans and the critical path."""
+        started = self.started
+        return {
+            "duration": round((self.finished or time.monotonic()) - started, 3),
+            "finished": self.finished is not None,
+            "spans": [span.as_dict(started) for span in self.spans],
+            "dependencies": {
+                domain: sorted(dependencies)
+                for domain, dependencies in self.dependencies.items()
+            },
+            "critical_path": self.async_critical_path(),
+        }
+
+
+@callback
+def async_start_startup_trace(hass: HomeAssistant) -> StartupTrace:
+    """Start tracing the startup."""
+    trace = hass.data[DATA_STARTUP_TRACE] = StartupTrace()
+    return trace
+
+
+@callback
+def async_get_startup_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace if the startup was traced."""
+    return hass.data.get(DATA_STARTUP_TRACE)
+
+
+@callback
+def async_get_active_startup_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace while the startup is still being traced."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) and trace.finished is None:
+        return trace
+    return None
+
+
+def run_timed[*_Ts, _R](target: Callable[[*_Ts], _R], *args: *_Ts) -> tuple[float, _R]:
+    """Run a function and return the time it started with its result.
+
+    This is used to measure how long jobs waited in the executor queue.
+    """
+    started = time.monotonic()
+    return started, target(*args)
@@ -11,7 +11,7 @@ from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from propcache import cached_property
 
@@ -49,6 +49,9 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_MIN_COMPACT_ENTRIES = 500
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -242,8 +245,21 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_keys: Mapping[str | None, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        journal_keys enables the journaled mode. It maps the lists of items in
+        the stored data, or None if the stored data is a list itself, to the
+        field which uniquely identifies an item. Dots in the field name look up
+        nested fields. After a
+        full snapshot has been written, only the items which were added,
+        changed or removed are appended to a journal until it is compacted
+        into the next snapshot. Items are compared by identity, so the data
+        function must return a new object for a changed item and should return
+        the same object for an unchanged item, like the storage fragments of
+        the registries.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +275,18 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _StoreJournal(journal_keys) if journal_keys else None
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -326,6 +348,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal is not None:
+                await self.hass.async_add_executor_job(
+                    self._journal.load, self.journal_path, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -388,6 +414,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal is not None:
+                await self.hass.async_add_executor_job(
+                    self._journal.load, self.journal_path, data
+                )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -552,6 +583,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if (journal := self._journal) is not None:
+            if journal.write_changes(
+                self.journal_path, data["data"], self._private, self._atomic_writes
+            ):
+                _LOGGER.debug("Appended changes for %s to journal", self.key)
+                return
+            generation = data["journal_generation"] = journal.generation + 1
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +600,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if journal is not None:
+            journal.snapshot_written(self.journal_path, generation, data["data"])
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +615,198 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            self._journal.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+class _StoreJournal:
+    """Journal of the changes to the items of a store since its last snapshot.
+
+    The first line of the journal holds the generation of the snapshot it
+    belongs to, each other line an added or changed item or the key of a
+    removed item. A journal of another generation is stale and ignored.
+
+    The methods of this class do blocking I/O and are run in the executor,
+    serialized by the write lock of the store.
+    """
+
+    def __init__(self, keys: Mapping[str | None, str]) -> None:
+        """Initialize the journal."""
+        self.keys = keys
+        self.generation = 0
+        self.entries = 0
+        # The items as written to disk, None until a snapshot has been written
+        self._items: dict[str | None, dict[str, Any]] | None = None
+        self._item_keys: dict[int, str] = {}
+
+    def reset(self) -> None:
+        """Forget the written items so the next write is a snapshot."""
+        self._items = None
+        self._item_keys = {}
+        self.entries = 0
+
+    def load(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the journal to the data of the snapshot."""
+        self.reset()
+        self.generation = data.get("journal_generation", 0)
+        try:
+            with open(path, "rb") as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return
+        if not lines:
+            return
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except ValueError:
+            header = {}
+        if header.get("generation") != self.generation:
+            _LOGGER.debug("Ignoring stale journal %s", path)
+            return
+
+        stored = _collections(data["data"])
+        indexes: dict[str | None, dict[str, int]] = {
+            collection: {
+                _item_key(item, field): idx
+                for idx, item in enumerate(stored[collection])
+            }
+            for collection, field in self.keys.items()
+            if collection in stored
+        }
+        removed = False
+        for line in lines[1:]:
+            try:
+                entry = json_util.json_loads_object(line)
+            except ValueError:
+                # The last line may be incomplete if writing was interrupted
+                _LOGGER.warning("Ignoring invalid entry in journal %s", path)
+                break
+            collection = cast(str | None, entry["collection"])
+            items = stored.setdefault(collection, [])
+            index = indexes.setdefault(collection, {})
+            key = cast(str, entry["key"])
+            if (item := entry["item"]) is None:
+                if (idx := index.pop(key, None)) is not None:
+                    items[idx] = None
+                    removed = True
+            elif (idx := index.get(key)) is not None:
+                items[idx] = item
+            else:
+                index[key] = len(items)
+                items.append(item)
+        if removed:
+            for collection in indexes:
+                stored[collection] = [
+                    item for item in stored[collection] if item is not None
+                ]
+        if None in stored:
+            data["data"] = stored[None]
+
+    def write_changes(
+        self, path: str, data: Mapping[str, Any] | list[Any], private: bool, fsync: bool
+    ) -> bool:
+        """Append the changed items to the journal.
+
+        Returns False if a snapshot should be written instead.
+        """
+        data = _collections(data)
+        if (written := self._items) is None or any(
+            collection not in self.keys for collection in data
+        ):
+            return False
+        item_keys = self._item_keys
+        items: dict[str | None, dict[str, Any]] = {}
+        new_item_keys: dict[int, str] = {}
+        changes: list[bytes] = []
+        for collection, field in self.keys.items():
+            old_items = written.get(collection, {})
+            collection_items = items[collection] = {}
+            for item in data.get(collection, ()):
+                key = item_keys.get(id(item))
+                if key is None or old_items.get(key) is not item:
+                    key = _item_key(item, field)
+                    changes.append(
+                        json_helper.json_bytes(
+                            {"collection": collection, "key": key, "item": item}
+                        )
+                    )
+                collection_items[key] = item
+                new_item_keys[id(item)] = key
+            changes.extend(
+                json_helper.json_bytes(
+                    {"collection": collection, "key": key, "item": None}
+                )
+                for key in old_items.keys() - collection_items.keys()
+            )
+
+        total_items = sum(len(collection) for collection in items.values())
+        if self.entries + len(changes) > max(
+            JOURNAL_MIN_COMPACT_ENTRIES, total_items // 2
+        ):
+            return False
+
+        if changes:
+            if not self.entries:
+                changes.insert(
+                    0, json_helper.json_bytes({"generation": self.generation})
+                )
+            try:
+                fd = os.open(
+                    path,
+                    os.O_WRONLY
+                    | os.O_CREAT
+                    | (os.O_TRUNC if not self.entries else os.O_APPEND),
+                    0o600 if private else 0o644,
+                )
+                with open(fd, "wb") as file:
+                    file.write(b"\n".join(changes) + b"\n")
+                    if fsync:
+                        file.flush()
+                        os.fsync(file.fileno())
+            except OSError as err:
+                # The journal may be partially written, write a snapshot next
+                self.reset()
+                raise WriteError(err) from err
+            self.entries += len(changes)
+
+        self._items = items
+        self._item_keys = new_item_keys
+        return True
+
+    def snapshot_written(
+        self, path: str, generation: int, data: Mapping[str, Any] | list[Any]
+    ) -> None:
+        """Start a new journal after a snapshot was written."""
+        data = _collections(data)
+        self.generation = generation
+        self.entries = 0
+        with suppress(FileNotFoundError):
+            os.unlink(path)
+        self._items = {
+            collection: {_item_key(item, field): item for item in data[collection]}
+            for collection, field in self.keys.items()
+            if collection in data
+        }
+        self._item_keys = {
+            id(item): key
+            for collection_items in self._items.values()
+            for key, item in collection_items.items()
+        }
+
+
+def _collections(data: Mapping[str, Any] | list[Any]) -> dict[str | None, Any]:
+    """Return the lists of items of the stored data."""
+    if isinstance(data, list):
+        return {None: data}
+    return cast(dict[str | None, Any], data)
+
+
+def _item_key(item: Any, field: str) -> str:
+    """Return the key of an item which may be or contain JSON fragments."""
+    for name in field.split("."):
+        if isinstance(item, json_helper.json_fragment):
+            item = json_util.json_loads_object(json_helper.json_bytes(item))
+        item = item[name]
+    return cast(str, item)
@@ -12,9 +12,12 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
+import marshal
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -53,14 +56,18 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -78,6 +85,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -94,6 +102,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -114,6 +123,9 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_CODE_CACHE: HassKey[TemplateCodeCache] = HassKey("template.code_cache")
+
+CODE_CACHE_FILE = "template.bytecode"
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -397,6 +409,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
         "rate_limit",
         "has_time",
     )
@@ -415,6 +428,8 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities of which only specific attributes were read
+        self.entity_attributes: dict[str, set[str]] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -427,6 +442,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_attributes={self.entity_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -469,7 +485,20 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
-        self.entities = frozenset(self.entities)
+        if entity_attributes := self.entity_attributes:
+            entities = self.entities
+            # Entities that were also read in full or through their
+            # domain re-render on any change
+            self.entity_attributes = {
+                entity_id: attributes
+                for entity_id, attributes in entity_attributes.items()
+                if entity_id not in entities
+                and not self.all_states
+                and split_entity_id(entity_id)[0] not in self.domains
+            }
+            self.entities = frozenset((*entities, *entity_attributes))
+        else:
+            self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -541,7 +570,7 @@ class Template:
 
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
-        self._compiled: jinja2.Template | None = None
+        self._compiled: jinja2.Template | NativeTemplate | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: OptExcInfo | None = None
@@ -836,7 +865,7 @@ class Template:
         limited: bool = False,
         strict: bool = False,
         log_fn: Callable[[int, str], None] | None = None,
-    ) -> jinja2.Template:
+    ) -> jinja2.Template | NativeTemplate:
         """Bind a template to a specific hass instance."""
         self.ensure_valid()
 
@@ -858,9 +887,10 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
+        compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._compiled = _native_template(env, self.template, compiled) or compiled
 
         return self._compiled
 
@@ -1376,13 +1406,9 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
 
     # fallback to just returning all entities for a domain
     # pylint: disable-next=import-outside-toplevel
-    from .entity import entity_sources
+    from .entity import entity_sources_for_domain
 
-    return [
-        entity_id
-        for entity_id, info in entity_sources(hass).items()
-        if info["domain"] == entry_name
-    ]
+    return entity_sources_for_domain(hass, entry_name)
 
 
 def config_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
@@ -1401,15 +1427,9 @@ def device_id(hass: HomeAssistant, entity_id_or_device_name: str) -> str | None:
         return entity.device_id
 
     dev_reg = device_registry.async_get(hass)
-    return next(
-        (
-            device_id
-            for device_id, device in dev_reg.devices.items()
-            if (name := device.name_by_user or device.name)
-            and (str(entity_id_or_device_name) == name)
-        ),
-        None,
-    )
+    if devices := dev_reg.devices.get_devices_for_name(str(entity_id_or_device_name)):
+        return devices[0].id
+    return None
 
 
 def device_attr(hass: HomeAssistant, device_or_entity_id: str, attr_name: str) -> Any:
@@ -1626,8 +1646,8 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         [
             entity.entity_id
             for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
+            for entity in ent_reg.entities.get_entries_for_device_area(device.id)
+            if not entity.disabled_by
         ]
     )
     return entity_ids
@@ -1885,9 +1905,16 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
-    if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
-    return None
+    if (state := hass.states.get(entity_id)) is None:
+        _collect_state(hass, entity_id)
+        return None
+    if (render_info := _render_info.get()) is not None:
+        # Only changes of the attribute need to re-render the template
+        if (attributes := render_info.entity_attributes.get(entity_id)) is None:
+            render_info.entity_attributes[entity_id] = {name}
+        else:
+            attributes.add(name)
+    return state.attributes.get(name)
 
 
 def has_value(hass: HomeAssistant, entity_id: str) -> bool:
@@ -2737,7 +2764,7 @@ _template_context_manager = TemplateContextManager()
 
 
 def _render_with_context(
-    template_str: str, template: jinja2.Template, **kwargs: Any
+    template_str: str, template: jinja2.Template | NativeTemplate, **kwargs: Any
 ) -> str:
     """Store template being rendered in a ContextVar to aid error handling."""
     with _template_context_manager as cm:
@@ -2745,6 +2772,228 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+class NativeTemplate:
+    """A simple expression template rendered without the jinja runtime.
+
+    Templates like {{ states('sensor.power') | float(0) * 2 }} are
+    evaluated by plain Python callables built from the parsed template.
+    The jinja template is used instead when the variables passed to
+    render shadow one of the globals used by the expression.
+    """
+
+    __slots__ = ("_evaluate", "_names", "_template")
+
+    def __init__(
+        self,
+        evaluate: Callable[[], Any],
+        names: frozenset[str],
+        template: jinja2.Template,
+    ) -> None:
+        """Initialize the native template."""
+        self._evaluate = evaluate
+        self._names = names
+        self._template = template
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        """Render the template."""
+        if args or not self._names.isdisjoint(kwargs):
+            return self._template.render(*args, **kwargs)
+        return str(self._evaluate())
+
+
+# A single expression without nested blocks, comments or dict literals
+_NATIVE_TEMPLATE_RE = re.compile(r"^\{\{[^{}%#]+\}\}$")
+_NATIVE_GLOBALS = {
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "states",
+}
+_NATIVE_FILTERS = {"bool", "float", "int", "round"}
+_NATIVE_BINOPS: dict[str, Callable[[Any, Any], Any]] = {
+    "Add": operator.add,
+    "Sub": operator.sub,
+    "Mul": operator.mul,
+    "Div": operator.truediv,
+    "FloorDiv": operator.floordiv,
+}
+_NATIVE_COMPARE_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+}
+_NATIVE_PLAN_CACHE_SIZE = 1024
+
+# A native plan describes a simple expression with nested tuples, so it
+# can be persisted with marshal next to the compiled code of the template
+type NativePlan = tuple[Any, ...]
+
+
+def _native_template(
+    env: TemplateEnvironment, source: str, template: jinja2.Template
+) -> NativeTemplate | None:
+    """Return a native template for a simple expression template."""
+    if not _NATIVE_TEMPLATE_RE.match(source):
+        return None
+    if (plan := env.native_plan(source)) is None:
+        return None
+    names: set[str] = set()
+    return NativeTemplate(
+        _native_evaluator(env, plan, names), frozenset(names), template
+    )
+
+
+def _native_plan_from_source(
+    env: TemplateEnvironment, source: str
+) -> NativePlan | None:
+    """Parse a simple expression template into a native plan."""
+    try:
+        body = env.parse(source).body
+    except jinja2.TemplateError:
+        return None
+    if (
+        len(body) != 1
+        or not isinstance(output := body[0], jinja2.nodes.Output)
+        or len(output.nodes) != 1
+    ):
+        return None
+    return _native_plan(output.nodes[0])
+
+
+def _native_arguments(
+    node: jinja2.nodes.Call | jinja2.nodes.Filter,
+) -> tuple[tuple[Any, ...], tuple[tuple[str, Any], ...]] | None:
+    """Return the constant arguments of a call or filter."""
+    if node.dyn_args is not None or node.dyn_kwargs is not None:
+        return None
+    if not all(isinstance(arg, jinja2.nodes.Const) for arg in node.args):
+        return None
+    if not all(isinstance(kwarg.value, jinja2.nodes.Const) for kwarg in node.kwargs):
+        return None
+    return (
+        tuple(arg.value for arg in node.args),
+        tuple((kwarg.key, kwarg.value.value) for kwarg in node.kwargs),
+    )
+
+
+def _native_plan(node: jinja2.nodes.Node) -> NativePlan | None:
+    """Return the native plan of a jinja expression node.
+
+    Returns None if the expression is not supported.
+    """
+    if isinstance(node, jinja2.nodes.Const):
+        return ("const", node.value)
+
+    if isinstance(node, jinja2.nodes.Call):
+        if (
+            not isinstance(node.node, jinja2.nodes.Name)
+            or (name := node.node.name) not in _NATIVE_GLOBALS
+            or (arguments := _native_arguments(node)) is None
+        ):
+            return None
+        return ("call", name, *arguments)
+
+    if isinstance(node, jinja2.nodes.Filter):
+        if (
+            node.node is None
+            or node.name not in _NATIVE_FILTERS
+            or (arguments := _native_arguments(node)) is None
+            or (value_plan := _native_plan(node.node)) is None
+        ):
+            return None
+        return ("filter", node.name, value_plan, *arguments)
+
+    if isinstance(node, jinja2.nodes.BinExpr):
+        if (
+            (binop := type(node).__name__) not in _NATIVE_BINOPS
+            or (left_plan := _native_plan(node.left)) is None
+            or (right_plan := _native_plan(node.right)) is None
+        ):
+            return None
+        return ("binop", binop, left_plan, right_plan)
+
+    if isinstance(node, jinja2.nodes.Neg):
+        if (value_plan := _native_plan(node.node)) is None:
+            return None
+        return ("neg", value_plan)
+
+    if isinstance(node, jinja2.nodes.Compare):
+        if (expr_plan := _native_plan(node.expr)) is None:
+            return None
+        operands: list[tuple[str, NativePlan]] = []
+        for operand in node.ops:
+            if (
+                operand.op not in _NATIVE_COMPARE_OPS
+                or (operand_plan := _native_plan(operand.expr)) is None
+            ):
+                return None
+            operands.append((operand.op, operand_plan))
+        return ("compare", expr_plan, tuple(operands))
+
+    return None
+
+
+def _native_evaluator(
+    env: TemplateEnvironment, plan: NativePlan, names: set[str]
+) -> Callable[[], Any]:
+    """Return a callable evaluating a native plan.
+
+    The names of the globals the expression uses are added to names.
+    """
+    kind = plan[0]
+
+    if kind == "const":
+        value = plan[1]
+        return lambda: value
+
+    if kind == "call":
+        _, name, args, kwargs = plan
+        names.add(name)
+        func = env.globals[name]
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            # The context is not used by the functions depending on hass
+            args = (None, *args)
+        return partial(func, *args, **dict(kwargs))
+
+    if kind == "filter":
+        _, name, value_plan, args, kwargs = plan
+        value_fn = _native_evaluator(env, value_plan, names)
+        func = env.filters[name]
+        filter_kwargs = dict(kwargs)
+        return lambda: func(value_fn(), *args, **filter_kwargs)
+
+    if kind == "binop":
+        binop = _NATIVE_BINOPS[plan[1]]
+        left_fn = _native_evaluator(env, plan[2], names)
+        right_fn = _native_evaluator(env, plan[3], names)
+        return lambda: binop(left_fn(), right_fn())
+
+    if kind == "neg":
+        value_fn = _native_evaluator(env, plan[1], names)
+        return lambda: -value_fn()
+
+    expr_fn = _native_evaluator(env, plan[1], names)
+    operands = [
+        (_NATIVE_COMPARE_OPS[op], _native_evaluator(env, operand_plan, names))
+        for op, operand_plan in plan[2]
+    ]
+
+    def _compare() -> bool:
+        left = expr_fn()
+        for compare, operand_fn in operands:
+            right = operand_fn()
+            if not compare(left, right):
+                return False
+            left = right
+        return True
+
+    return _compare
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2797,6 +3046,144 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+class TemplateCodeCache:
+    """Persist the compiled code of templates between restarts.
+
+    The code is stored with marshal, so the file is only valid for the
+    Home Assistant, Jinja and Python versions that wrote it. New code is
+    only recorded while recording is set, which is until startup is done,
+    so templates rendered once at runtime do not grow the cache.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the code cache."""
+        self.path = path
+        self.dirty = False
+        self.recording = True
+        self._codes: dict[str, bytes] = {}
+        self._used: set[str] = set()
+
+    @staticmethod
+    def key(kind: str, source: str) -> str:
+        """Return the key of the code of a template."""
+        return f"{kind}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the cached code for a key."""
+        if (data := self._codes.get(key)) is None:
+            return None
+        try:
+            code: CodeType = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            del self._codes[key]
+            return None
+        self._used.add(key)
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Cache the code for a key."""
+        if not self.recording:
+            return
+        self._codes[key] = marshal.dumps(code)
+        self._used.add(key)
+        self.dirty = True
+
+    def get_native_plan(self, key: str) -> NativePlan | None | Literal[False]:
+        """Return the cached native plan for a key.
+
+        Returns None for templates without a native plan and False if
+        the template is not cached.
+        """
+        if (data := self._codes.get(key)) is None:
+            return False
+        try:
+            plan: NativePlan | None = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            del self._codes[key]
+            return False
+        self._used.add(key)
+        return plan
+
+    def set_native_plan(self, key: str, plan: NativePlan | None) -> None:
+        """Cache the native plan for a key."""
+        if not self.recording:
+            return
+        self._codes[key] = marshal.dumps(plan)
+        self._used.add(key)
+        self.dirty = True
+
+    @property
+    def has_unused(self) -> bool:
+        """Return if code has not been used since the cache was loaded."""
+        return len(self._used) != len(self._codes)
+
+    def load(self) -> None:
+        """Load the code cache.
+
+        This method does blocking I/O and should be run in the executor.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.warning("Unable to read template code cache: %s", err)
+            return
+        try:
+            header, codes = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            _LOGGER.warning("Ignoring invalid template code cache %s", self.path)
+            return
+        if header == _code_cache_header():
+            self._codes = codes
+
+    def save(self, prune: bool = False) -> None:
+        """Save the code cache.
+
+        Code that has not been used since the cache was loaded is dropped
+        when prune is set.
+
+        This method does blocking I/O and should be run in the executor.
+        """
+        codes = self._codes
+        if prune:
+            codes = {key: codes[key] for key in self._used if key in codes}
+        self.dirty = False
+        try:
+            write_utf8_file(
+                self.path, marshal.dumps((_code_cache_header(), codes)), mode="wb"
+            )
+        except WriteError:
+            self.dirty = True
+
+
+def _code_cache_header() -> tuple[str, str, str | None]:
+    """Return the versions the compiled code depends on."""
+    return (__version__, jinja2.__version__, sys.implementation.cache_tag)
+
+
+async def async_load_code_cache(hass: HomeAssistant) -> None:
+    """Load the compiled template code persisted by the last run."""
+    code_cache = TemplateCodeCache(hass.config.path(STORAGE_DIR, CODE_CACHE_FILE))
+    await hass.async_add_executor_job(code_cache.load)
+    hass.data[_CODE_CACHE] = code_cache
+
+    async def _async_save(_: Event) -> None:
+        """Save the code cache once startup has compiled the templates."""
+        code_cache.recording = False
+        if code_cache.dirty:
+            await hass.async_add_executor_job(code_cache.save)
+
+    async def _async_save_and_prune(_: Event) -> None:
+        """Save the code cache without the code of removed templates."""
+        if code_cache.dirty or code_cache.has_unused:
+            await hass.async_add_executor_job(code_cache.save, True)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_and_prune)
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2867,6 +3254,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self._native_plans: LRU[str, NativePlan | None] = LRU(_NATIVE_PLAN_CACHE_SIZE)
+        # The generated code depends on the filters available at compile time
+        self.code_cache_kind = (
+            "limited" if limited else "strict" if strict else "default"
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3219,9 +3611,40 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            isinstance(source, str)
+            and self.hass is not None
+            and (code_cache := self.hass.data.get(_CODE_CACHE)) is not None
+        ):
+            # Reuse the code compiled by an earlier run
+            key = code_cache.key(self.code_cache_kind, source)
+            if (compiled := code_cache.get(key)) is None:
+                compiled = super().compile(source)
+                code_cache.set(key, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
+    def native_plan(self, source: str) -> NativePlan | None:
+        """Return the native plan of a simple expression template.
+
+        The template is only parsed when the plan is not cached yet.
+        """
+        if (plan := self._native_plans.get(source, False)) is not False:
+            return plan
+        if (
+            self.hass is not None
+            and (code_cache := self.hass.data.get(_CODE_CACHE)) is not None
+        ):
+            key = code_cache.key("native", source)
+            if (plan := code_cache.get_native_plan(key)) is False:
+                plan = _native_plan_from_source(self, source)
+                code_cache.set_native_plan(key, plan)
+        else:
+            plan = _native_plan_from_source(self, source)
+        self._native_plans[source] = plan
+        return plan
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
@@ -40,6 +40,12 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_trace import (
+    SPAN_IMPORT,
+    SPAN_IMPORT_PLATFORMS,
+    async_get_active_startup_trace,
+    run_timed,
+)
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -991,6 +997,8 @@ class Integration:
 
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
+        if trace := async_get_active_startup_trace(self.hass):
+            queued = time.monotonic()
 
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
@@ -1006,13 +1014,16 @@ class Integration:
                     self.domain,
                     time.perf_counter() - start,
                 )
+            if trace:
+                trace.async_add_span(domain, SPAN_IMPORT, queued, time.monotonic())
             return comp
 
         self._component_future = self.hass.loop.create_future()
+        executor_started: float | None = None
         try:
             try:
-                comp = await self.hass.async_add_import_executor_job(
-                    self._get_component, True
+                executor_started, comp = await self.hass.async_add_import_executor_job(
+                    run_timed, self._get_component, True
                 )
             except ModuleNotFoundError:
                 raise
@@ -1043,6 +1054,14 @@ class Integration:
                 time.perf_counter() - start,
                 load_executor,
             )
+        if trace:
+            trace.async_add_span(
+                domain,
+                SPAN_IMPORT,
+                queued,
+                time.monotonic(),
+                queue_wait=0 if executor_started is None else executor_started - queued,
+            )
 
         return comp
 
@@ -1146,15 +1165,20 @@ class Integration:
         if load_executor_platforms or load_event_loop_platforms:
             if debug := _LOGGER.isEnabledFor(logging.DEBUG):
                 start = time.perf_counter()
+            if trace := async_get_active_startup_trace(self.hass):
+                queued = time.monotonic()
+            executor_started: float | None = None
 
             try:
                 if load_executor_platforms:
                     try:
-                        platforms.update(
-                            await self.hass.async_add_import_executor_job(
-                                self._load_platforms, platform_names
-                            )
+                        (
+                            executor_started,
+                            loaded_platforms,
+                        ) = await self.hass.async_add_import_executor_job(
+                            run_timed, self._load_platforms, platform_names
                         )
+                        platforms.update(loaded_platforms)
                     except ModuleNotFoundError:
                         raise
                     except ImportError as ex:
@@ -1196,6 +1220,17 @@ class Integration:
                         load_event_loop_platforms,
                         time.perf_counter() - start,
                     )
+                if trace:
+                    trace.async_add_span(
+                        domain,
+                        SPAN_IMPORT_PLATFORMS,
+                        queued,
+                        time.monotonic(),
+                        group=",".join(name for name, _ in import_futures),
+                        queue_wait=0
+                        if executor_started is None
+                        else executor_started - queued,
+                    )
 
         if in_progress_imports:
             for platform_name, future in in_progress_imports.items():
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -223,6 +224,199 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Run 100k state changed events through 4000 keyed bus listeners."""
+    count = 0
+    entity_id = "sensor.power"
+    events_to_fire = 10**5
+
+    @core.callback
+    def entity_id_key(event_data):
+        """Key the event by entity_id."""
+        return event_data["entity_id"]
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(4000):
+        hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, entity_id_key, f"{entity_id}{idx}", listener
+        )
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Report state machine memory per entity with and without interning.
+
+    Writes 10 rounds of states for 10k power sensors whose attributes
+    come from a small set of shapes.
+    """
+    entities = 10**4
+    attribute_shapes = [
+        {
+            "state_class": "measurement",
+            "unit_of_measurement": unit,
+            "device_class": device_class,
+        }
+        for unit, device_class in (
+            ("W", "power"),
+            ("kWh", "energy"),
+            ("V", "voltage"),
+            ("A", "current"),
+        )
+    ]
+
+    def _measure(interning: bool) -> float:
+        hass.states.async_set_attribute_interning(interning)
+        for entity_id in hass.states.async_entity_ids():
+            hass.states.async_remove(entity_id)
+        tracemalloc.start()
+        for round_ in range(10):
+            for idx in range(entities):
+                hass.states.async_set(
+                    f"sensor.power_{idx}",
+                    str(round_ * idx),
+                    dict(attribute_shapes[(idx + round_) % len(attribute_shapes)]),
+                )
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return used / entities
+
+    start = timer()
+    without_interning = _measure(False)
+    with_interning = _measure(True)
+    print(
+        f"Memory per entity: {without_interning:.0f} bytes without interning,"
+        f" {with_interning:.0f} bytes with interning"
+    )
+    return timer() - start
+
+
+@benchmark
+async def state_set_many(hass):
+    """Write 100 ticks of 1000 state updates with and without batching."""
+    entities = 1000
+    ticks = 100
+    count = 0
+
+    @core.callback
+    def listener(events):
+        """Handle a batch of events."""
+        nonlocal count
+        count += len(events)
+
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, listener)
+
+    start = timer()
+    for tick in range(ticks):
+        for idx in range(entities):
+            hass.states.async_set(f"sensor.power_{idx}", str(tick), {"unit": "W"})
+        await asyncio.sleep(0)
+    single = timer() - start
+
+    start = timer()
+    for tick in range(ticks):
+        hass.states.async_set_many(
+            (f"sensor.power_{idx}", str(tick + ticks), {"unit": "W"})
+            for idx in range(entities)
+        )
+        await asyncio.sleep(0)
+    batched = timer() - start
+
+    assert count == 2 * ticks * entities
+    print(f"Single writes: {single:.3f}s, batched writes: {batched:.3f}s")
+    return batched
+
+
+@benchmark
+async def recorder_bulk_insert(hass):
+    """Write 50 commits of 1000 states to SQLite through the ORM and in bulk."""
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.table_managers.states import StatesManager
+
+    entities = 1000
+    commits = 50
+    tmp_dir = TemporaryDirectory()
+    engine = create_engine(f"sqlite:///{tmp_dir.name}/home-assistant_v2.db")
+    Base.metadata.create_all(engine)
+    states_manager = StatesManager()
+
+    with Session(engine) as session:
+        attributes = StateAttributes(shared_attrs='{"unit":"W"}', hash=1)
+        metas = [StatesMeta(entity_id=f"sensor.power_{idx}") for idx in range(entities)]
+        session.add(attributes)
+        session.add_all(metas)
+        session.commit()
+        attributes_id = attributes.attributes_id
+        metadata_ids = [meta.metadata_id for meta in metas]
+
+    def _write(bulk: bool) -> float:
+        """Write the states and return the runtime."""
+        old_state_ids: list[int | None] = [None] * entities
+        start = timer()
+        with Session(engine, expire_on_commit=False) as session:
+            for commit in range(commits):
+                db_states = [
+                    States(
+                        state=str(commit),
+                        last_updated_ts=commit,
+                        metadata_id=metadata_id,
+                        attributes_id=attributes_id,
+                        old_state_id=old_state_ids[idx],
+                    )
+                    for idx, metadata_id in enumerate(metadata_ids)
+                ]
+                if bulk:
+                    for db_state in db_states:
+                        states_manager.add_pending_insert(db_state)
+                    states_manager.insert_pending(session)
+                else:
+                    session.add_all(db_states)
+                session.commit()
+                old_state_ids = [db_state.state_id for db_state in db_states]
+        return timer() - start
+
+    orm = await hass.async_add_executor_job(_write, False)
+    bulk = await hass.async_add_executor_job(_write, True)
+    engine.dispose()
+    tmp_dir.cleanup()
+    rows = entities * commits
+    print(f"ORM: {rows / orm:.0f} rows/s, bulk insert: {rows / bulk:.0f} rows/s")
+    return bulk
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -308,3 +502,87 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_matching(hass):
+    """Match a second of 10k MQTT messages against 603 wildcard subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    devices = 200
+    messages = 10**4
+    topic_filters = [
+        "homeassistant/+/+/config",
+        "homeassistant/+/+/+/config",
+        "tasmota/discovery/#",
+    ]
+    for idx in range(devices):
+        topic_filters.append(f"zigbee2mqtt/device_{idx}/+")
+        topic_filters.append(f"tele/tasmota_{idx}/+")
+        topic_filters.append(f"stat/tasmota_{idx}/#")
+    topics = [
+        f"zigbee2mqtt/device_{idx % devices}/availability"
+        if idx % 3 == 0
+        else f"tele/tasmota_{idx % devices}/SENSOR"
+        if idx % 3 == 1
+        else f"stat/tasmota_{idx % devices}/RESULT/{idx}"
+        for idx in range(messages)
+    ]
+
+    def _matcher(topic_filter):
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        return lambda topic: next(matcher.iter_match(topic), False)
+
+    matchers = [_matcher(topic_filter) for topic_filter in topic_filters]
+    trie = TopicTrie()
+    for idx, topic_filter in enumerate(topic_filters):
+        trie.add(topic_filter, idx)
+
+    start = timer()
+    scan_matches = sum(1 for topic in topics for matcher in matchers if matcher(topic))
+    scan = timer() - start
+
+    start = timer()
+    trie_matches = sum(len(trie.match(topic)) for topic in topics)
+    trie_time = timer() - start
+
+    assert scan_matches == trie_matches
+    print(
+        f"Linear scan: {messages / scan:.0f} msg/s,"
+        f" topic trie: {messages / trie_time:.0f} msg/s"
+    )
+    return trie_time
+
+
+@benchmark
+async def template_render(hass):
+    """Render representative templates 10k times each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    renders = 10**4
+    hass.states.async_set("sensor.power", "1250.5", {"unit_of_measurement": "W"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+    sources = [
+        "{{ states('sensor.power') }}",
+        "{{ states('sensor.power') | float(0) * 2 }}",
+        "{{ (states('sensor.power') | float(0) / 1000) | round(2) }}",
+        "{{ is_state('light.kitchen', 'on') }}",
+        "{{ state_attr('light.kitchen', 'brightness') | int(0) > 100 }}",
+        "{% if is_state('light.kitchen', 'on') %}On{% else %}Off{% endif %}",
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+    ]
+    templates = [Template(source, hass) for source in sources]
+
+    start = timer()
+    for template in templates:
+        for _ in range(renders):
+            template.async_render()
+    runtime = timer() - start
+
+    print(f"{renders * len(templates) / runtime:.0f} renders/s")
+    return runtime
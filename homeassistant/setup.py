@@ -9,6 +9,7 @@ import contextlib
 import contextvars
 from enum import StrEnum
 from functools import partial
+from itertools import chain
 import logging.handlers
 import time
 from types import ModuleType
@@ -31,6 +32,11 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import (
+    SPAN_INTEGRATION,
+    SPAN_WAIT_DEPENDENCIES,
+    async_get_active_startup_trace,
+)
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -160,9 +166,13 @@ async def async_setup_component(
 
     setup_future = hass.loop.create_future()
     setup_futures[domain] = setup_future
+    if trace := async_get_active_startup_trace(hass):
+        started = time.monotonic()
 
     try:
         result = await _async_setup_component(hass, domain, config)
+        if trace:
+            trace.async_add_span(domain, SPAN_INTEGRATION, started, time.monotonic())
         setup_future.set_result(result)
         if setup_done_future := setup_done_futures.pop(domain, None):
             setup_done_future.set_result(result)
@@ -233,11 +243,22 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
+    if trace := async_get_active_startup_trace(hass):
+        trace.async_add_dependencies(
+            integration.domain, chain(dependencies_tasks, after_dependencies_tasks)
+        )
+        started = time.monotonic()
+
     async with hass.timeout.async_freeze(integration.domain):
         results = await asyncio.gather(
             *dependencies_tasks.values(), *after_dependencies_tasks.values()
         )
 
+    if trace:
+        trace.async_add_span(
+            integration.domain, SPAN_WAIT_DEPENDENCIES, started, time.monotonic()
+        )
+
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
     ]
@@ -770,8 +791,11 @@ def async_start_setup(
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         del setup_started[current]
+        if trace := async_get_active_startup_trace(hass):
+            trace.async_add_span(integration, phase, started, finished, group)
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
@@ -0,0 +1,112 @@
+"""Persistent cache of parsed YAML files."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import sys
+import threading
+from typing import Any
+
+import yaml
+
+from homeassistant.const import __version__
+from homeassistant.util.file import WriteError, write_utf8_file
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+class YamlParseCache:
+    """Persist the parsed content of YAML files between restarts.
+
+    Entries are stored per file and only used while the size and the hash of
+    the content of the file are unchanged. Tags which depend on other files or
+    on the environment, like !include and !secret, are stored unresolved and
+    are resolved each time the file is loaded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the parse cache."""
+        self.path = path
+        self.dirty = False
+        self._entries: dict[str, tuple[int, bytes, Any]] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, fname: str, content: str) -> Any | None:
+        """Return the cached data of a file if its content is unchanged."""
+        if (entry := self._entries.get(fname)) is None:
+            return None
+        size, digest, data = entry
+        if size != len(content) or digest != _digest(content):
+            return None
+        with self._lock:
+            self._used.add(fname)
+        return data
+
+    def set(self, fname: str, content: str, data: Any) -> None:
+        """Cache the data of a file."""
+        with self._lock:
+            self._entries[fname] = (len(content), _digest(content), data)
+            self._used.add(fname)
+            self.dirty = True
+
+    @property
+    def has_unused(self) -> bool:
+        """Return if files have not been loaded since the last save."""
+        return len(self._used) != len(self._entries)
+
+    def load(self) -> None:
+        """Load the parse cache.
+
+        This method does blocking I/O and should be run in the executor.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.warning("Unable to read YAML parse cache: %s", err)
+            return
+        try:
+            header, entries = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            _LOGGER.warning("Ignoring invalid YAML parse cache %s", self.path)
+            return
+        if header == _cache_header():
+            self._entries = entries
+
+    def save(self) -> None:
+        """Save the files loaded since the last save.
+
+        This method does blocking I/O and should be run in the executor.
+        """
+        with self._lock:
+            entries = {
+                fname: self._entries[fname]
+                for fname in self._used
+                if fname in self._entries
+            }
+            self._entries = entries
+            self._used = set()
+            self.dirty = False
+        try:
+            write_utf8_file(
+                self.path, marshal.dumps((_cache_header(), entries)), mode="wb"
+            )
+        except WriteError:
+            self.dirty = True
+
+
+def _digest(content: str) -> bytes:
+    """Return the hash of the content of a file."""
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).digest()
+
+
+def _cache_header() -> tuple[int, str, str, int]:
+    """Return the versions the cached data depends on."""
+    return (CACHE_VERSION, __version__, yaml.__version__, sys.hexversion)
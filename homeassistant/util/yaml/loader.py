@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, overload
+from typing import Any, TextIO, cast, overload
 
 import yaml
 
@@ -26,6 +27,7 @@ from propcache import cached_property
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import YamlParseCache
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -112,6 +114,11 @@ class _LoaderMixin:
 
     name: str
     stream: Any
+    secrets: Secrets | None
+    cache: YamlParseCache | None = None
+    # Cleared when loading the file logged warnings which would not be
+    # logged again if the file was loaded from the parse cache
+    cacheable = True
 
     @cached_property
     def get_name(self) -> str:
@@ -156,15 +163,22 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlParseCache | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    If a parse cache is passed, the file and the files it includes are loaded
+    from the cache if they have not changed.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
+            if cache is not None:
+                return _load_yaml_cached(conf_file, secrets, cache)
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
@@ -176,14 +190,16 @@ def load_yaml(
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlParseCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    loaded_yaml = load_yaml(fname, secrets, cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -316,7 +332,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
         return _add_reference(loaded_yaml, loader, node)
@@ -350,7 +366,7 @@ def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDi
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -369,7 +385,7 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference_to_node_class(mapping, loader, node)
@@ -385,7 +401,7 @@ def _include_dir_list_yaml(
         loaded_yaml
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := load_yaml(f, loader.secrets, loader.cache)) is not None
     ]
 
 
@@ -399,7 +415,7 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -433,6 +449,7 @@ def _handle_mapping_tag(
             ) from exc
 
         if key in seen:
+            loader.cacheable = False
             fname = loader.get_stream_name
             _LOGGER.warning(
                 'YAML file %s contains duplicate key "%s". Check lines %d and %d',
@@ -500,3 +517,203 @@ add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
 add_constructor("!include_dir_named", _include_dir_named_yaml)
 add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
 add_constructor("!input", Input.from_node)
+
+
+class _UncacheableError(Exception):
+    """Raised when parsed YAML can not be stored in the parse cache."""
+
+
+@dataclass(slots=True, frozen=True)
+class _UnresolvedTag:
+    """A tag which is resolved each time a file is loaded from the parse cache."""
+
+    tag: str
+    value: str
+    line: int
+    column: int
+
+
+def _unresolved_tag(loader: LoaderType, node: yaml.nodes.Node) -> _UnresolvedTag:
+    """Keep a tag to resolve it when the file is loaded."""
+    if not isinstance(node.value, str):
+        raise _UncacheableError
+    return _UnresolvedTag(
+        node.tag, node.value, node.start_mark.line, node.start_mark.column
+    )
+
+
+class _UnresolvedFastSafeLoader(FastSafeLoader):
+    """Fastest available safe loader which keeps tags unresolved."""
+
+
+class _CachedFileLoader:
+    """Stand-in for the loader when resolving the tags of a cached file."""
+
+    def __init__(
+        self, name: str, secrets: Secrets | None, cache: YamlParseCache
+    ) -> None:
+        """Initialize the loader."""
+        self.get_name = name
+        self.secrets = secrets
+        self.cache = cache
+
+
+# Tags which depend on other files or on the environment
+_RESOLVED_TAGS: dict[str, Callable[[LoaderType, yaml.nodes.Node], Any]] = {
+    "!include": _include_yaml,
+    "!env_var": _env_var_yaml,
+    "!secret": secret_yaml,
+    "!include_dir_list": _include_dir_list_yaml,
+    "!include_dir_merge_list": _include_dir_merge_list_yaml,
+    "!include_dir_named": _include_dir_named_yaml,
+    "!include_dir_merge_named": _include_dir_merge_named_yaml,
+}
+
+for _tag in _RESOLVED_TAGS:
+    _UnresolvedFastSafeLoader.add_constructor(_tag, _unresolved_tag)
+
+
+def _load_yaml_cached(
+    conf_file: TextIO, secrets: Secrets | None, cache: YamlParseCache
+) -> JSON_TYPE | None:
+    """Load a YAML file from the parse cache, parse it if it has changed."""
+    name = conf_file.name
+    content = conf_file.read()
+    # The data is cached in a tuple to tell empty files from cache misses
+    if (cached := cache.get(name, content)) is not None:
+        (data,) = cached
+    else:
+        conf_file.seek(0)
+        try:
+            data, cacheable = _parse_yaml_unresolved(conf_file)
+        except (yaml.YAMLError, _UncacheableError):
+            # Let the regular loaders parse the file and report errors
+            conf_file.seek(0)
+            return parse_yaml(conf_file, secrets)
+        if cacheable:
+            cache.set(name, content, (data,))
+    return cast(
+        JSON_TYPE | None, _decode(data, _CachedFileLoader(name, secrets, cache))
+    )
+
+
+def _parse_yaml_unresolved(content: TextIO) -> tuple[Any, bool]:
+    """Parse YAML into the format of the parse cache.
+
+    Return the parsed data and if it can be stored in the cache.
+    """
+    loader = _UnresolvedFastSafeLoader(content)
+    try:
+        obj = loader.get_single_data()
+    finally:
+        loader.dispose()
+    return _encode(obj, loader.get_name), loader.cacheable
+
+
+# The parse cache stores the data with marshal. Node classes, containers and
+# unresolved tags are stored as tuples starting with one of these kinds, other
+# values are stored as is.
+_KIND_STR = 0
+_KIND_NODE_DICT = 1
+_KIND_NODE_LIST = 2
+_KIND_DICT = 3
+_KIND_LIST = 4
+_KIND_TUPLE = 5
+_KIND_SET = 6
+_KIND_INPUT = 7
+_KIND_TAG = 8
+
+_PLAIN_TYPES = {type(None), bool, int, float, str, bytes}
+
+
+def _encode(obj: Any, name: str) -> Any:
+    """Encode parsed YAML for the parse cache."""
+    obj_type = type(obj)
+    if obj_type in _PLAIN_TYPES:
+        return obj
+    if obj_type is NodeStrClass:
+        return (_KIND_STR, str(obj), _encode_line(obj, name))
+    if obj_type is NodeDictClass:
+        return (
+            _KIND_NODE_DICT,
+            _encode_line(obj, name),
+            [(_encode(key, name), _encode(value, name)) for key, value in obj.items()],
+        )
+    if obj_type is NodeListClass:
+        return (
+            _KIND_NODE_LIST,
+            _encode_line(obj, name),
+            [_encode(item, name) for item in obj],
+        )
+    if obj_type is dict:
+        return (
+            _KIND_DICT,
+            [(_encode(key, name), _encode(value, name)) for key, value in obj.items()],
+        )
+    if obj_type is list:
+        return (_KIND_LIST, [_encode(item, name) for item in obj])
+    if obj_type is tuple:
+        return (_KIND_TUPLE, [_encode(item, name) for item in obj])
+    if obj_type is set:
+        return (_KIND_SET, [_encode(item, name) for item in obj])
+    if obj_type is Input:
+        return (_KIND_INPUT, obj.name)
+    if obj_type is _UnresolvedTag:
+        return (_KIND_TAG, obj.tag, obj.value, obj.line, obj.column)
+    # For example timestamps, which marshal can't store
+    raise _UncacheableError
+
+
+def _encode_line(
+    obj: NodeDictClass | NodeListClass | NodeStrClass, name: str
+) -> int | str | None:
+    """Return the line of a node class object."""
+    if getattr(obj, "__config_file__", name) != name:
+        raise _UncacheableError
+    return getattr(obj, "__line__", None)
+
+
+def _decode(data: Any, loader: _CachedFileLoader) -> Any:
+    """Decode parsed YAML from the parse cache and resolve its tags."""
+    if type(data) is not tuple:
+        return data
+    kind = data[0]
+    if kind == _KIND_STR:
+        return _decode_reference(NodeStrClass(data[1]), loader, data[2])
+    if kind == _KIND_NODE_DICT:
+        return _decode_reference(
+            NodeDictClass(
+                (_decode(key, loader), _decode(value, loader)) for key, value in data[2]
+            ),
+            loader,
+            data[1],
+        )
+    if kind == _KIND_NODE_LIST:
+        return _decode_reference(
+            NodeListClass(_decode(item, loader) for item in data[2]), loader, data[1]
+        )
+    if kind == _KIND_DICT:
+        return {_decode(key, loader): _decode(value, loader) for key, value in data[1]}
+    if kind == _KIND_LIST:
+        return [_decode(item, loader) for item in data[1]]
+    if kind == _KIND_TUPLE:
+        return tuple(_decode(item, loader) for item in data[1])
+    if kind == _KIND_SET:
+        return {_decode(item, loader) for item in data[1]}
+    if kind == _KIND_INPUT:
+        return Input(data[1])
+    _, tag, value, line, column = data
+    node = yaml.nodes.ScalarNode(
+        tag, value, yaml.Mark(loader.get_name, 0, line, column, None, None)
+    )
+    return _RESOLVED_TAGS[tag](cast(LoaderType, loader), node)
+
+
+def _decode_reference[_NodeT: (NodeDictClass, NodeListClass, NodeStrClass)](
+    obj: _NodeT, loader: _CachedFileLoader, line: int | str | None
+) -> _NodeT:
+    """Add file reference information to a decoded node class object."""
+    obj.__config_file__ = loader.get_name
+    if line is not None:
+        obj.__line__ = line
+    return obj
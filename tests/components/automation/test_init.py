@@ -1343,6 +1343,49 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+async def test_reload_only_changed_automations(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test reloading only recreates the automations with changed config."""
+
+    def automation_configs(changed_event: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "alias": f"Automation {idx}",
+                "trigger": {"platform": "event", "event_type": f"test_event_{idx}"},
+                "action": {"event": changed_event if idx == 1 else "test_done"},
+            }
+            for idx in range(3)
+        ]
+
+    with patch(
+        "homeassistant.components.automation.AutomationEntity", wraps=AutomationEntity
+    ) as automation_entity_init:
+        assert await async_setup_component(
+            hass, automation.DOMAIN, {automation.DOMAIN: automation_configs("test")}
+        )
+        assert automation_entity_init.call_count == 3
+        automation_entity_init.reset_mock()
+
+        with (
+            patch(
+                "homeassistant.config.load_yaml_config_file",
+                autospec=True,
+                return_value={automation.DOMAIN: automation_configs("test_changed")},
+            ),
+            caplog.at_level(logging.DEBUG, logger="homeassistant.components"),
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+
+        assert automation_entity_init.call_count == 1
+        assert automation_entity_init.call_args[0][1] == "Automation 1"
+        assert "2 unchanged, 1 removed, 1 added" in caplog.text
+
+    assert len(hass.states.async_entity_ids(automation.DOMAIN)) == 3
+
+
 @pytest.mark.parametrize("extra_config", [{}, {"id": "sun"}])
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls: list[ServiceCall], extra_config: dict[str, str]
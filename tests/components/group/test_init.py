@@ -894,7 +894,8 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.second_group",
         "group.test_group",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    # One keyed listener per tracked entity_id
+    assert hass.bus.async_listeners()["state_changed"] == 4
 
     with patch(
         "homeassistant.config.load_yaml_config_file",
@@ -909,7 +910,8 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.all_tests",
         "group.hello",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    # test.one and test.two from group.all_tests plus light.bowl
+    assert hass.bus.async_listeners()["state_changed"] == 3
 
 
 async def test_modify_group(hass: HomeAssistant) -> None:
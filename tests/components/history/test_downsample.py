@@ -0,0 +1,60 @@
+"""The tests for downsampling history states."""
+
+import pytest
+
+from homeassistant.components.history.downsample import downsample_states
+
+
+def _states(values: list[str]) -> list[dict[str, str | float]]:
+    """Return compressed states with one state per second."""
+    return [{"s": value, "lu": float(idx)} for idx, value in enumerate(values)]
+
+
+def test_downsample_below_max_points() -> None:
+    """Test states are not downsampled when there are few enough."""
+    states = _states(["1", "2", "3"])
+    assert downsample_states(states, 3, "lttb", 0, 3) is states
+
+
+def test_downsample_lttb_keeps_peaks() -> None:
+    """Test LTTB keeps the first, last and peak states."""
+    values = ["0"] * 50 + ["100"] + ["0"] * 49
+    downsampled = downsample_states(_states(values), 10, "lttb", 0, 100)
+    assert len(downsampled) == 10
+    assert downsampled[0]["lu"] == 0
+    assert downsampled[-1]["lu"] == 99
+    assert "100" in [state["s"] for state in downsampled]
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"),
+    [
+        ("min", ["0", "1.5", "4", "9"]),
+        ("max", ["0", "2.5", "6", "9"]),
+        ("mean", ["0", "2.0", "5", "9"]),
+        ("last", ["0", "2.5", "4", "9"]),
+    ],
+)
+def test_downsample_buckets(method: str, expected: list[str]) -> None:
+    """Test numeric states are aggregated per bucket."""
+    states = _states(["0", "1.5", "2.5", "6", "4", "9"])
+    downsampled = downsample_states(states, 2, method, 0, 6)
+    assert [state["s"] for state in downsampled] == expected
+
+
+def test_downsample_keeps_gaps() -> None:
+    """Test states that are not numeric are kept in order."""
+    states = _states(["1", "2", "3", "unavailable", "4", "5", "6", "7"])
+    downsampled = downsample_states(states, 4, "last", 0, 8)
+    assert [state["s"] for state in downsampled] == [
+        "1",
+        "2",
+        "3",
+        "unavailable",
+        "5",
+        "6",
+        "7",
+    ]
+    assert downsample_states(_states(["on", "off", "on"]), 2, "lttb", 0, 3) == (
+        _states(["on", "off", "on"])
+    )
@@ -173,6 +173,63 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_downsampled(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(20):
+        hass.states.async_set("sensor.power", str(value))
+        hass.states.async_set("sensor.mode", "auto" if value % 2 else "manual")
+    hass.states.async_set("sensor.power", "unavailable")
+    hass.states.async_set("sensor.power", "100")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.power", "sensor.mode"],
+            "minimal_response": True,
+            "max_points": 5,
+            "downsample": "max",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    power_history = response["result"]["sensor.power"]
+    # All the states are in the same bucket, so only the maximum of
+    # the numeric states before unavailable is kept
+    assert [state["s"] for state in power_history] == [
+        "0",
+        "19",
+        "unavailable",
+        "100",
+    ]
+    # States that are not numeric are never downsampled
+    assert len(response["result"]["sensor.mode"]) == 20
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "max_points": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -543,6 +600,112 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_in_batches(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends large periods in several messages."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    last_updated_timestamps: dict[str, float] = {}
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on")
+        last_updated_timestamps[entity_id] = hass.states.get(
+            entity_id
+        ).last_updated_timestamp
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_STREAM_BATCH_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["type"] == "result"
+
+        states: dict[str, list[dict[str, float | str]]] = {}
+        end_times = []
+        for _ in range(2):
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            end_times.append(response["event"]["end_time"])
+            for entity_id, entity_states in response["event"]["states"].items():
+                states.setdefault(entity_id, []).extend(entity_states)
+
+    assert end_times == [
+        pytest.approx(last_updated_timestamps["sensor.two"]),
+        pytest.approx(last_updated_timestamps["sensor.three"]),
+    ]
+    assert states == {
+        entity_id: [{"lu": pytest.approx(last_updated_timestamp), "s": "on"}]
+        for entity_id, last_updated_timestamp in last_updated_timestamps.items()
+    }
+
+
+async def test_history_stream_batches_end_time_does_not_go_back(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the end time of the batches only moves forward.
+
+    The states are sent by entity, so a batch of the next entities
+    can end before the previous batch.
+    """
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for entity_id, state in (
+        ("sensor.one", "on"),
+        ("sensor.two", "on"),
+        ("sensor.three", "on"),
+        ("sensor.one", "off"),
+    ):
+        hass.states.async_set(entity_id, state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    last_updated_timestamp = hass.states.get("sensor.one").last_updated_timestamp
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_STREAM_BATCH_SIZE", 2):
+        await client.send_json_auto_id(
+            {
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        end_times = []
+        for _ in range(2):
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            end_times.append(response["event"]["end_time"])
+
+    assert end_times[0] == end_times[1] == pytest.approx(last_updated_timestamp)
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components import automation
 from homeassistant.components.homeassistant.triggers import (
     numeric_state as numeric_state_trigger,
+    state as state_trigger,
 )
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -2004,3 +2005,44 @@ async def test_template_variable(
         assert len(service_calls) == 1
     else:
         assert len(service_calls) == 0
+
+
+@pytest.mark.parametrize(
+    ("trigger", "bucket"),
+    [
+        ({"below": 10}, "state_changes"),
+        ({"below": 10, "attribute": "level"}, "by_attribute"),
+        ({"below": "number.value_10"}, "all_changes"),
+        (
+            {"below": 10, "value_template": "{{ state.attributes.level }}"},
+            "all_changes",
+        ),
+    ],
+)
+async def test_state_trigger_index_bucket(
+    hass: HomeAssistant, trigger: dict[str, int | str], bucket: str
+) -> None:
+    """Test numeric state triggers only listen to the changes they depend on."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "numeric_state",
+                    "entity_id": "test.entity",
+                    **trigger,
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    triggers = state_trigger.async_get_state_trigger_index(hass)._entities[
+        "test.entity"
+    ]
+    assert {
+        name
+        for name in ("state_changes", "by_attribute", "all_changes")
+        if getattr(triggers, name)
+    } == {bucket}
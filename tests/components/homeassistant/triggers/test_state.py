@@ -1771,3 +1771,93 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(hass: HomeAssistant) -> None:
+    """Test the state trigger index only calls the matching listeners."""
+    index = state_trigger.async_get_state_trigger_index(hass)
+    assert state_trigger.async_get_state_trigger_index(hass) is index
+
+    to_on_calls = []
+    state_calls = []
+    attribute_calls = []
+    all_calls = []
+    remove_to_on = index.async_add(["test.entity"], to_on_calls.append, ["on"])
+    remove_state = index.async_add(
+        ["test.entity"], state_calls.append, state_changes_only=True
+    )
+    remove_attribute = index.async_add(
+        ["test.entity"], attribute_calls.append, attribute="brightness"
+    )
+    remove_all = index.async_add(["test.entity"], all_calls.append)
+
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+    assert (len(to_on_calls), len(state_calls)) == (0, 1)
+    assert (len(attribute_calls), len(all_calls)) == (0, 1)
+
+    hass.states.async_set("test.entity", "on", {"brightness": 10})
+    await hass.async_block_till_done()
+    assert (len(to_on_calls), len(state_calls)) == (1, 2)
+    assert (len(attribute_calls), len(all_calls)) == (1, 2)
+
+    hass.states.async_set("test.entity", "on", {"brightness": 10, "color": "red"})
+    await hass.async_block_till_done()
+    assert (len(to_on_calls), len(state_calls)) == (1, 2)
+    assert (len(attribute_calls), len(all_calls)) == (1, 3)
+
+    remove_to_on()
+    remove_state()
+    remove_attribute()
+    hass.states.async_set("test.entity", "off")
+    hass.states.async_set("test.entity", "on", {"brightness": 20})
+    await hass.async_block_till_done()
+    assert (len(to_on_calls), len(state_calls)) == (1, 2)
+    assert (len(attribute_calls), len(all_calls)) == (1, 5)
+
+    remove_all()
+    assert not index._entities
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+    assert len(all_calls) == 5
+
+
+@pytest.mark.parametrize(
+    ("trigger", "expected_calls"),
+    [({"to": "*"}, 1), ({"from": "*"}, 1), ({"to": ["*"]}, 0)],
+)
+async def test_state_trigger_index_match_all(
+    hass: HomeAssistant,
+    service_calls: list[ServiceCall],
+    trigger: dict[str, str | list[str]],
+    expected_calls: int,
+) -> None:
+    """Test triggers matching any state only listen to changes of the state."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {"platform": "state", "entity_id": "test.entity", **trigger},
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    triggers = state_trigger.async_get_state_trigger_index(hass)._entities[
+        "test.entity"
+    ]
+    if expected_calls:
+        assert not triggers.by_to_state
+        assert len(triggers.state_changes) == 1
+    else:
+        # A list is matched literally
+        assert list(triggers.by_to_state) == ["*"]
+
+    hass.states.async_set("test.entity", "hello", {"some": "attribute"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 0
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(service_calls) == expected_calls
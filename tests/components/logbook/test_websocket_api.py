@@ -1741,6 +1741,77 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.LOGBOOK_STREAM_BATCH_SIZE", 2)
+async def test_logbook_stream_past_only_in_windows(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the past events are read in windows and sent in batches."""
+    start = dt_util.utcnow().replace(microsecond=0) - timedelta(hours=4)
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await hass.async_block_till_done()
+
+    states: list[State] = []
+    for offset, state in (
+        (timedelta(seconds=10), STATE_ON),
+        (timedelta(hours=1), STATE_OFF),
+        (timedelta(hours=1, seconds=1), STATE_ON),
+        (timedelta(hours=2, minutes=30), STATE_OFF),
+    ):
+        hass.states.async_set(
+            "binary_sensor.is_light", state, timestamp=(start + offset).timestamp()
+        )
+        states.append(hass.states.get("binary_sensor.is_light"))
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=3)).isoformat(),
+            "entity_ids": ["binary_sensor.is_light"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    # The state changed at the end of the first window
+    # is read with the second window
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.is_light",
+            "state": state.state,
+            "when": state.last_updated_timestamp,
+        }
+        for state in states[1:3]
+    ]
+    assert msg["event"]["partial"] is True
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "binary_sensor.is_light",
+            "state": STATE_OFF,
+            "when": states[3].last_updated_timestamp,
+        }
+    ]
+    assert "partial" not in msg["event"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
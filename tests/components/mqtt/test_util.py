@@ -13,7 +13,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -102,6 +102,61 @@ async def test_canceling_debouncer_throws(
         await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize(
+    ("topic", "matches"),
+    [
+        ("sport/tennis/player1", ["sport/#", "sport/+/player1", "+/tennis/#", "#"]),
+        ("sport/tennis", ["sport/#", "sport/+", "+/tennis/#", "#"]),
+        ("sport", ["sport/#", "#"]),
+        ("sport/", ["sport/#", "sport/+", "#"]),
+        ("finance/tennis/player1", ["+/tennis/#", "#"]),
+        ("$SYS/tennis/player1", ["$SYS/#"]),
+        ("$SYS", ["$SYS/#"]),
+        ("/tennis", ["+/tennis/#", "#"]),
+    ],
+)
+def test_topic_trie(topic: str, matches: list[str]) -> None:
+    """Test the topic trie matches topics like the broker."""
+    topic_filters = [
+        "sport/#",
+        "sport/+",
+        "sport/+/player1",
+        "+/tennis/#",
+        "#",
+        "$SYS/#",
+        "other/+/player1",
+    ]
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in topic_filters:
+        trie.add(topic_filter, topic_filter)
+    # Matches are returned in the order the filters were added
+    assert trie.match(topic) == [
+        topic_filter for topic_filter in topic_filters if topic_filter in matches
+    ]
+
+
+def test_topic_trie_remove() -> None:
+    """Test removing topic filters from the topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/+/temperature", "first")
+    trie.add("home/+/temperature", "second")
+    trie.add("home/#", "all")
+    assert "home/+/temperature" in trie
+    assert "home/+" not in trie
+    assert trie.match("home/kitchen/temperature") == ["first", "second", "all"]
+
+    trie.remove("home/+/temperature", "first")
+    assert trie.match("home/kitchen/temperature") == ["second", "all"]
+    trie.remove("home/+/temperature", "second")
+    assert "home/+/temperature" not in trie
+    assert trie.match("home/kitchen/temperature") == ["all"]
+    with pytest.raises(KeyError):
+        trie.remove("home/+/temperature", "second")
+    trie.remove("home/#", "all")
+    assert trie.match("home/kitchen/temperature") == []
+    assert not trie._root.children
+
+
 async def help_create_test_certificate_file(
     hass: HomeAssistant,
     mock_temp_dir: str,
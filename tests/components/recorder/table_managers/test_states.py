@@ -0,0 +1,140 @@
+"""The tests for the recorder states manager."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.table_managers.states import StatesManager
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.mark.parametrize(
+    ("bulk_returning", "expected_inserts"), [(True, None), (False, 6)]
+)
+async def test_insert_pending_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    bulk_returning: bool,
+    expected_inserts: int | None,
+) -> None:
+    """Test pending states are inserted in bulk with their relationships."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    states_manager = StatesManager()
+    inserts: list[str] = []
+
+    def _count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO states "):
+            inserts.append(statement)
+
+    def _insert_states() -> dict[str, int]:
+        db_states: dict[str, States] = {}
+        with (
+            patch.object(
+                instance.engine.dialect,
+                "insert_executemany_returning_sort_by_parameter_order",
+                bulk_returning,
+            ),
+            session_scope(session=instance.get_session()) as session,
+        ):
+            shared_attributes = StateAttributes(shared_attrs='{"unit":"W"}', hash=1)
+            session.add(shared_attributes)
+            for entity_id in ("sensor.one", "sensor.two"):
+                states_meta = StatesMeta(entity_id=entity_id)
+                session.add(states_meta)
+                old_state: States | None = None
+                for idx in range(3):
+                    db_state = States(
+                        state=f"{entity_id}_{idx}", last_updated_ts=float(idx)
+                    )
+                    db_state.states_meta_rel = states_meta
+                    db_state.state_attributes = shared_attributes
+                    db_state.old_state = old_state
+                    states_manager.add_pending_insert(db_state)
+                    db_states[f"{entity_id}_{idx}"] = old_state = db_state
+            event.listen(instance.engine, "before_cursor_execute", _count_inserts)
+            try:
+                states_manager.insert_pending(session)
+            finally:
+                event.remove(instance.engine, "before_cursor_execute", _count_inserts)
+        return {state: db_state.state_id for state, db_state in db_states.items()}
+
+    def _fetch_states() -> dict[str, States]:
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            return {state.state: state for state in session.query(States)}
+
+    state_ids = await instance.async_add_executor_job(_insert_states)
+    states = await instance.async_add_executor_job(_fetch_states)
+
+    assert not states_manager._pending_inserts
+    if expected_inserts is not None:
+        # One statement per row without RETURNING
+        assert len(inserts) == expected_inserts
+    assert len(states) == 6
+    assert len({state.attributes_id for state in states.values()}) == 1
+    assert states["sensor.one_0"].metadata_id != states["sensor.two_0"].metadata_id
+    for entity_id in ("sensor.one", "sensor.two"):
+        assert states[f"{entity_id}_0"].old_state_id is None
+        for idx in range(3):
+            state = f"{entity_id}_{idx}"
+            assert states[state].state_id == state_ids[state]
+            assert states[state].metadata_id == states[f"{entity_id}_0"].metadata_id
+        for idx in (1, 2):
+            assert (
+                states[f"{entity_id}_{idx}"].old_state_id
+                == states[f"{entity_id}_{idx - 1}"].state_id
+            )
+
+
+async def test_insert_pending_states_after_rollback(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test the related rows of pending states are inserted again after a rollback."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    states_manager = StatesManager()
+
+    def _insert_states() -> None:
+        with session_scope(session=instance.get_session()) as session:
+            states_meta = StatesMeta(entity_id="sensor.rolled_back")
+            session.add(states_meta)
+            state_attributes = StateAttributes(shared_attrs='{"unit":"W"}', hash=1)
+            session.add(state_attributes)
+            db_state = States(state="on", last_updated_ts=1.0)
+            db_state.states_meta_rel = states_meta
+            db_state.state_attributes = state_attributes
+            states_manager.add_pending_insert(db_state)
+            # The related rows keep the ids of the failed attempt
+            session.flush()
+            session.rollback()
+            assert states_meta.metadata_id is not None
+            states_manager.insert_pending(session)
+
+    def _fetch_state() -> tuple[str | None, str | None]:
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            state = session.query(States).one()
+            return (
+                session.get(StatesMeta, state.metadata_id).entity_id,
+                session.get(StateAttributes, state.attributes_id).shared_attrs,
+            )
+
+    await instance.async_add_executor_job(_insert_states)
+    assert await instance.async_add_executor_job(_fetch_state) == (
+        "sensor.rolled_back",
+        '{"unit":"W"}',
+    )
@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import sentinel
 
 from freezegun import freeze_time
@@ -726,6 +727,54 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_iter_significant_states_matches_get_significant_states(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test the batches of states together match the states of the period."""
+    hass.states.async_set("sensor.one", "on", attributes={"any": "start"})
+    await async_wait_recording_done(hass)
+    start_time = dt_util.utcnow()
+    for entity_id, state, attributes in (
+        ("sensor.one", "on", {"any": "attr"}),
+        ("sensor.one", "on", {"any": "changed"}),
+        ("sensor.two", "off", {}),
+        ("sensor.one", "off", {"any": "attr"}),
+        ("sensor.one", "off", {"any": "again"}),
+        ("sensor.one", "on", {"any": "attr"}),
+        ("sensor.two", "on", {}),
+    ):
+        hass.states.async_set(entity_id, state, attributes=attributes)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+    entity_ids = ["sensor.one", "sensor.two"]
+
+    batched_states: dict[str, list[State | dict[str, Any]]] = {}
+    for states in history.iter_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        2,
+        significant_changes_only=False,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    ):
+        for entity_id, entity_states in states.items():
+            batched_states.setdefault(entity_id, []).extend(entity_states)
+
+    assert batched_states == history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        significant_changes_only=False,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from datetime import datetime, timedelta
 import sqlite3
 import sys
 import threading
+import time
 from typing import Any, cast
 from unittest.mock import MagicMock, Mock, patch
 
@@ -23,6 +24,7 @@ from homeassistant.components.recorder import (
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
+    CONF_DB_READ_POOL_SIZE,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
     CONFIG_SCHEMA,
@@ -34,6 +36,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -62,7 +65,11 @@ from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import (
+    async_add_read_job_for_connection,
+    async_stream_read_job_to_connection,
+    session_scope,
+)
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_CLOSE,
@@ -72,6 +79,7 @@ from homeassistant.const import (
     MATCH_ALL,
 )
 from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     entity_registry as er,
     issue_registry as ir,
@@ -395,11 +403,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass).states_manager._pending_inserts:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -427,6 +432,38 @@ async def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+async def test_statistics_states_cache_only_has_committed_states(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    setup_recorder: None,
+) -> None:
+    """Test states only join the statistics states cache once committed."""
+    entity_id = "sensor.recorder"
+    instance = get_instance(hass)
+    cache = instance.statistics_states_cache
+    cache.seed(entity_id, 0, [])
+
+    with (
+        patch("time.sleep"),
+        patch.object(
+            instance.event_session,
+            "commit",
+            side_effect=OperationalError("commit", "fake params", "forced to fail"),
+        ),
+    ):
+        hass.states.async_set(entity_id, "fail")
+        await async_wait_recording_done(hass)
+
+    assert "Error executing query" in caplog.text
+    assert cache.get_states([entity_id], 0, time.time() + 1, set()) == {entity_id: []}
+
+    hass.states.async_set(entity_id, "recorded")
+    await async_wait_recording_done(hass)
+
+    cached = cache.get_states([entity_id], 0, time.time() + 1, set())
+    assert [state.state for state in cached[entity_id]] == ["recorded"]
+
+
 async def test_saving_state_with_sqlalchemy_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -2746,3 +2783,119 @@ async def test_empty_entity_id(
     hass.bus.async_fire("hello", {"entity_id": ""})
     await async_wait_recording_done(hass)
     assert "Invalid entity ID" not in caplog.text
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_pool(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test read jobs run on the read-only connections of the read pool.
+
+    On-disk database because the read pool shares the connection of the
+    recorder with an in-memory database.
+    """
+    instance = await async_setup_recorder_instance(
+        hass, {CONF_COMMIT_INTERVAL: 0, CONF_DB_READ_POOL_SIZE: 2}
+    )
+    hass.states.async_set("sensor.read", "on")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> list[str]:
+        assert threading.current_thread().name.startswith(DB_READ_WORKER_PREFIX)
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance.read_engine
+            states = [state.state for state in session.query(States)]
+            session.add(RecorderRuns(start=dt_util.utcnow()))
+            with pytest.raises(OperationalError, match="readonly"):
+                session.flush()
+            return states
+
+    assert await instance.async_add_read_job(_read_states) == ["on"]
+    timing = instance.read_job_timings[_read_states.__qualname__]
+    assert timing.count == 1
+    assert timing.total == timing.max > 0
+
+
+async def test_read_job_cancelled_with_connection(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test a queued read job is dropped when the websocket connection closes."""
+    instance = await async_setup_recorder_instance(hass, {CONF_DB_READ_POOL_SIZE: 1})
+    release = threading.Event()
+    busy = instance.async_add_read_job(release.wait, 10)
+    connection = Mock(subscriptions={})
+    read_job = Mock()
+
+    task = hass.async_create_task(
+        async_add_read_job_for_connection(hass, connection, 5, read_job)
+    )
+    await asyncio.sleep(0)
+    assert 5 in connection.subscriptions
+    connection.subscriptions[5]()
+    with pytest.raises(HomeAssistantError, match="read was cancelled"):
+        await task
+    assert connection.subscriptions == {}
+
+    release.set()
+    assert await busy is True
+    await instance.async_add_read_job(lambda: None)
+    read_job.assert_not_called()
+
+
+async def test_stream_read_job_waits_for_slow_client(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test a streaming read job is held back by a client that does not keep up."""
+    instance = await async_setup_recorder_instance(hass, {CONF_DB_READ_POOL_SIZE: 1})
+    generated: list[int] = []
+    drained_callbacks: list[Callable[[], None]] = []
+    connection = Mock(call_when_drained=drained_callbacks.append)
+
+    def _generate() -> Generator[bytes, None, int]:
+        for idx in range(20):
+            generated.append(idx)
+            yield str(idx).encode()
+        return 20
+
+    task = hass.async_create_task(
+        async_stream_read_job_to_connection(hass, connection, _generate)
+    )
+    # The client stalls, so only the first message is generated
+    # and the read pool is free for other jobs meanwhile
+    await asyncio.sleep(0.2)
+    assert connection.send_message.call_count == 1
+    assert generated == [0]
+    assert len(drained_callbacks) == 1
+    assert await asyncio.wait_for(instance.async_add_read_job(lambda: True), 1)
+    assert generated == [0]
+
+    while not task.done():
+        if drained_callbacks:
+            drained_callbacks.pop()()
+        await asyncio.sleep(0.01)
+    assert await task == 20
+    assert [call.args[0] for call in connection.send_message.call_args_list] == [
+        str(idx).encode() for idx in range(20)
+    ]
+
+
+async def test_stream_read_job_dropped(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test a streaming read job dropped by the read pool raises."""
+    instance = await async_setup_recorder_instance(hass)
+    read_job: asyncio.Future[None] = hass.loop.create_future()
+    generate = Mock()
+
+    with patch.object(instance, "async_add_read_job", return_value=read_job):
+        task = hass.async_create_task(
+            async_stream_read_job_to_connection(hass, Mock(), generate)
+        )
+        await asyncio.sleep(0)
+        read_job.cancel()
+        with pytest.raises(HomeAssistantError, match="read was cancelled"):
+            await task
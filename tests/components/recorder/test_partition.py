@@ -0,0 +1,397 @@
+"""The tests for the recorder day partitioning."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+import sqlalchemy
+from sqlalchemy import delete, text
+from sqlalchemy.orm.session import Session
+
+from homeassistant.components.recorder import Recorder, migration
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import (
+    TABLE_STATES,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.partition import (
+    PARTITION_DAYS_AHEAD,
+    PARTITIONED_TABLES,
+    SECONDS_PER_DAY,
+    get_partition_days,
+    is_partitioned,
+    mysql_partition_definition,
+    partition_day,
+    partition_day_from_name,
+    partition_name,
+    postgresql_partition_bounds,
+    postgresql_partition_table,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.util import periodic_db_cleanups, session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def test_partition_names() -> None:
+    """Test partitions are named after the day they hold rows for."""
+    timestamp = datetime(2024, 3, 5, 23, 59, tzinfo=dt_util.UTC).timestamp()
+    day = partition_day(timestamp)
+    assert day == partition_day(timestamp - 23 * 3600)
+    assert day + 1 == partition_day(timestamp + 60)
+    assert partition_name(day) == "p20240305"
+    assert partition_day_from_name("p20240305") == day
+    assert partition_day_from_name("states_p20240305") == day
+    assert partition_day_from_name("pmax") is None
+    assert partition_day_from_name("states_pdefault") is None
+    assert postgresql_partition_table("states", day) == "states_p20240305"
+    assert mysql_partition_definition(day) == (
+        f"PARTITION p20240305 VALUES LESS THAN ({day + 1})"
+    )
+    assert postgresql_partition_bounds(day) == (
+        f"FOR VALUES FROM ({day * SECONDS_PER_DAY})"
+        f" TO ({(day + 1) * SECONDS_PER_DAY})"
+    )
+    assert postgresql_partition_bounds(day, first=True) == (
+        f"FOR VALUES FROM (MINVALUE) TO ({(day + 1) * SECONDS_PER_DAY})"
+    )
+
+
+async def test_sqlite_is_not_partitioned(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test SQLite tables are never partitioned."""
+    assert not recorder_mock.day_partitioned
+
+    def _check_partitions() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            for partitioned_table in PARTITIONED_TABLES:
+                assert not is_partitioned(
+                    session, recorder_mock.dialect_name, partitioned_table.table
+                )
+                assert not get_partition_days(
+                    session, recorder_mock.dialect_name, partitioned_table.table
+                )
+
+    await recorder_mock.async_add_executor_job(_check_partitions)
+
+
+async def test_purge_partitioned(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the purge drops partitions and cleans up unused attributes."""
+    now = datetime(2024, 3, 5, 12, tzinfo=dt_util.UTC)
+    purge_before = now - timedelta(days=2)
+    day_start = purge_before.replace(hour=0)
+
+    hass.states.async_set("sensor.kept", "on", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    def _add_states() -> dict[str, int]:
+        with session_scope(hass=hass) as session:
+            states_meta = StatesMeta(entity_id="sensor.old")
+            session.add(states_meta)
+            attribute_ids: dict[str, int] = {}
+            for name, timestamp in (
+                ("dropped", day_start - timedelta(hours=1)),
+                ("same_day", purge_before - timedelta(hours=1)),
+            ):
+                state_attributes = StateAttributes(
+                    shared_attrs=f'{{"name":"{name}"}}', hash=hash(name)
+                )
+                session.add(
+                    States(
+                        state=name,
+                        last_updated_ts=timestamp.timestamp(),
+                        states_meta_rel=states_meta,
+                        state_attributes=state_attributes,
+                    )
+                )
+                session.flush()
+                attribute_ids[name] = state_attributes.attributes_id
+            return attribute_ids
+
+    attribute_ids = await recorder_mock.async_add_executor_job(_add_states)
+    kept_state_id = recorder_mock.states_manager._last_committed_id["sensor.kept"]
+
+    def _drop_partitions(
+        instance: Recorder, session: Session, purge_before: datetime
+    ) -> tuple[set[int], set[int]]:
+        """Drop the rows of the partitions older than purge_before."""
+        session.execute(
+            delete(States).where(
+                States.last_updated_ts < day_start.timestamp(),
+                States.state != "on",
+            )
+        )
+        # The state of sensor.kept is in a dropped partition as well
+        session.execute(delete(States).where(States.state_id == kept_state_id))
+        return {attribute_ids["dropped"], attribute_ids["same_day"]}, set()
+
+    def _fetch() -> tuple[list[str], set[int]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                sorted(state.state for state in session.query(States)),
+                {
+                    attributes.attributes_id
+                    for attributes in session.query(StateAttributes)
+                },
+            )
+
+    recorder_mock.partition_by_day = True
+    recorder_mock.day_partitioned = True
+    with patch(
+        "homeassistant.components.recorder.purge.purge_partitions",
+        side_effect=_drop_partitions,
+    ):
+        assert await recorder_mock.async_add_executor_job(
+            purge_old_data, recorder_mock, purge_before, False
+        )
+
+    states, attributes_ids = await recorder_mock.async_add_executor_job(_fetch)
+    # Rows of the day of purge_before are dropped with its partition
+    assert states == ["same_day"]
+    assert attribute_ids["dropped"] not in attributes_ids
+    assert attribute_ids["same_day"] in attributes_ids
+    assert "sensor.kept" not in recorder_mock.states_manager._last_committed_id
+
+
+async def test_purge_partitioned_without_opt_in(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test partitions are not dropped unless partition_by_day is set."""
+    hass.states.async_set("sensor.kept", "on")
+    await async_wait_recording_done(hass)
+
+    recorder_mock.day_partitioned = True
+    with patch(
+        "homeassistant.components.recorder.purge.purge_partitions"
+    ) as purge_partitions_mock:
+        assert await recorder_mock.async_add_executor_job(
+            purge_old_data, recorder_mock, dt_util.utcnow(), False
+        )
+    assert not purge_partitions_mock.called
+
+
+def _get_partition_days(
+    hass: HomeAssistant, instance: Recorder
+) -> dict[str, list[int]]:
+    """Return the days each partitioned table has partitions for."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return {
+            partitioned_table.table: get_partition_days(
+                session, instance.dialect_name, partitioned_table.table
+            )
+            for partitioned_table in PARTITIONED_TABLES
+        }
+
+
+def _is_partitioning_marked_done(instance: Recorder) -> bool:
+    """Return if partitioning is marked as done in the migration changes."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        return (
+            migration.PartitionTablesByDayMigration.migration_id
+            in migration._get_migration_changes(session)
+        )
+
+
+def _get_foreign_key_columns(instance: Recorder, table: str) -> set[str]:
+    """Return the columns of a table with a foreign key."""
+    return {
+        column
+        for foreign_key in sqlalchemy.inspect(instance.engine).get_foreign_keys(table)
+        for column in foreign_key["constrained_columns"]
+    }
+
+
+def _is_states_partitioned(instance: Recorder) -> bool:
+    """Return if the states table is partitioned."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        return is_partitioned(session, instance.dialect_name, TABLE_STATES)
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_not_partitioned_without_opt_in(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test MySQL and PostgreSQL tables are only partitioned when opted in.
+
+    This test is run on MySQL and PostgreSQL only.
+    """
+    assert not recorder_mock.partition_by_day
+    assert not recorder_mock.day_partitioned
+    assert await recorder_mock.async_add_executor_job(
+        _get_partition_days, hass, recorder_mock
+    ) == {partitioned_table.table: [] for partitioned_table in PARTITIONED_TABLES}
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"partition_by_day": True}])
+async def test_partition_by_day(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test partitions are created ahead and dropped by the purge.
+
+    This test is run on MySQL and PostgreSQL only.
+    """
+    assert recorder_mock.day_partitioned
+    today = partition_day(dt_util.utcnow().timestamp())
+
+    hass.states.async_set("sensor.test", "old", {"name": "old"})
+    await async_wait_recording_done(hass)
+
+    assert await recorder_mock.async_add_executor_job(
+        _get_partition_days, hass, recorder_mock
+    ) == {
+        partitioned_table.table: list(range(today, today + PARTITION_DAYS_AHEAD + 1))
+        for partitioned_table in PARTITIONED_TABLES
+    }
+
+    freezer.tick(timedelta(days=6))
+    await recorder_mock.async_add_executor_job(periodic_db_cleanups, recorder_mock)
+    # The state links to the old state which is in a partition to drop
+    hass.states.async_set("sensor.test", "new", {"name": "new"})
+    await async_wait_recording_done(hass)
+
+    new_days = list(range(today + 6, today + 6 + PARTITION_DAYS_AHEAD + 1))
+    assert await recorder_mock.async_add_executor_job(
+        _get_partition_days, hass, recorder_mock
+    ) == {
+        partitioned_table.table: [
+            *range(today, today + PARTITION_DAYS_AHEAD + 1),
+            *new_days,
+        ]
+        for partitioned_table in PARTITIONED_TABLES
+    }
+
+    assert await recorder_mock.async_add_executor_job(
+        purge_old_data, recorder_mock, dt_util.utcnow() - timedelta(days=1), False
+    )
+
+    def _fetch() -> tuple[list[tuple[str, int | None]], list[str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                [(state.state, state.old_state_id) for state in session.query(States)],
+                [
+                    attributes.shared_attrs
+                    for attributes in session.query(StateAttributes)
+                ],
+            )
+
+    assert await recorder_mock.async_add_executor_job(
+        _get_partition_days, hass, recorder_mock
+    ) == {partitioned_table.table: new_days for partitioned_table in PARTITIONED_TABLES}
+    assert await recorder_mock.async_add_executor_job(
+        _is_partitioning_marked_done, recorder_mock
+    )
+    states, shared_attrs = await recorder_mock.async_add_executor_job(_fetch)
+    assert states == [("new", None)]
+    assert shared_attrs == ['{"name":"new"}']
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partitioning_resumes(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test partitioning resumes after it stopped part way.
+
+    This test is run on MySQL and PostgreSQL only.
+    """
+
+    def _stop_part_way() -> None:
+        migration._drop_all_foreign_key_constraints(
+            recorder_mock.get_session, recorder_mock.engine, TABLE_STATES
+        )
+        if recorder_mock.dialect_name == SupportedDialect.MYSQL:
+            with session_scope(session=recorder_mock.get_session()) as session:
+                session.execute(
+                    text(
+                        "ALTER TABLE states"
+                        " ADD COLUMN partition_day INT NOT NULL DEFAULT 0"
+                    )
+                )
+
+    await recorder_mock.async_add_executor_job(_stop_part_way)
+    assert await recorder_mock.async_add_executor_job(
+        migration.partition_tables_by_day, recorder_mock, recorder_mock.get_session
+    )
+
+    assert await recorder_mock.async_add_executor_job(
+        _is_states_partitioned, recorder_mock
+    )
+    assert await recorder_mock.async_add_executor_job(
+        _is_partitioning_marked_done, recorder_mock
+    )
+    # MySQL does not support foreign keys on partitioned tables
+    expected_foreign_keys = (
+        set()
+        if recorder_mock.dialect_name == SupportedDialect.MYSQL
+        else {"attributes_id", "metadata_id"}
+    )
+    assert (
+        await recorder_mock.async_add_executor_job(
+            _get_foreign_key_columns, recorder_mock, TABLE_STATES
+        )
+        == expected_foreign_keys
+    )
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partitioning_error_restores_foreign_keys(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the foreign keys are restored if a table can not be partitioned.
+
+    This test is run on MySQL and PostgreSQL only.
+    """
+    with (
+        patch(
+            "homeassistant.components.recorder.partition.mysql_max_partition_definition",
+            return_value="PARTITION broken",
+        ),
+        patch(
+            "homeassistant.components.recorder.partition.postgresql_partition_bounds",
+            return_value="broken",
+        ),
+    ):
+        assert not await recorder_mock.async_add_executor_job(
+            migration.partition_tables_by_day,
+            recorder_mock,
+            recorder_mock.get_session,
+        )
+
+    assert not await recorder_mock.async_add_executor_job(
+        _is_states_partitioned, recorder_mock
+    )
+    assert not await recorder_mock.async_add_executor_job(
+        _is_partitioning_marked_done, recorder_mock
+    )
+    assert await recorder_mock.async_add_executor_job(
+        _get_foreign_key_columns, recorder_mock, TABLE_STATES
+    ) == {"old_state_id", "attributes_id", "metadata_id"}
+
+    # The next attempt resumes from the steps that were done
+    assert await recorder_mock.async_add_executor_job(
+        migration.partition_tables_by_day, recorder_mock, recorder_mock.get_session
+    )
+    assert await recorder_mock.async_add_executor_job(
+        _is_states_partitioned, recorder_mock
+    )
@@ -0,0 +1,221 @@
+"""The tests for the recorder spool."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import os
+from pathlib import Path
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.spool import RecorderSpool
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import async_fire_time_changed
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_spool_round_trip(tmp_path: Path) -> None:
+    """Test events are read back from the spool in order."""
+    context = Context(user_id="user", parent_id="parent")
+    old_state = State("sensor.one", "1", {"unit": "W"})
+    new_state = State("sensor.one", "2", {"unit": "W"}, context=context)
+    events = [
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.one", "old_state": None, "new_state": old_state},
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.one", "old_state": old_state, "new_state": new_state},
+            context=context,
+        ),
+        Event("custom_event", {"value": 1}, EventOrigin.remote),
+        Event("not_serializable", {"value": object()}),
+    ]
+    spool = RecorderSpool(str(tmp_path / "storage" / "recorder.spool"))
+    assert not spool.exists()
+
+    assert spool.append(events) == 3
+    with open(spool.path, "ab") as spool_file:
+        # A record that was cut off by a crash while writing
+        spool_file.write(b"\x00\x00\x01\x00{")
+
+    read = list(spool.read())
+    assert [event.event_type for _, event in read] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_CHANGED,
+        "custom_event",
+    ]
+    for (_, spooled), event in zip(read, events, strict=False):
+        assert spooled.time_fired_timestamp == event.time_fired_timestamp
+        assert spooled.context == event.context
+        assert spooled.origin == event.origin
+
+    changed = read[1][1]
+    assert changed.data["old_state"].as_dict() == old_state.as_dict()
+    assert changed.data["new_state"].as_dict() == new_state.as_dict()
+    assert changed.data["new_state"].context.parent_id == "parent"
+    assert changed.data["new_state"].last_updated_timestamp == (
+        new_state.last_updated_timestamp
+    )
+    assert read[2][1].data == {"value": 1}
+
+    spool.offset = read[1][0]
+    assert [event.event_type for _, event in spool.read()] == ["custom_event"]
+
+    spool.remove()
+    assert not spool.exists()
+    assert spool.offset == 0
+
+
+def test_spool_resumes_after_restart(tmp_path: Path) -> None:
+    """Test the committed offset survives a restart in the middle of a replay."""
+    path = str(tmp_path / "storage" / "recorder.spool")
+    spool = RecorderSpool(path)
+    spool.append(Event("custom_event", {"value": idx}) for idx in range(4))
+
+    read = spool.read()
+    next(read)
+    offset, _ = next(read)
+    spool.commit(offset)
+    # Home Assistant stops while the next events are replayed
+    next(read)
+    read.close()
+
+    spool = RecorderSpool(path)
+    assert [event.data["value"] for _, event in spool.read()] == [2, 3]
+
+    # An offset which does not fit the spool is ignored
+    with open(spool.offset_path, "w", encoding="utf-8") as offset_file:
+        offset_file.write("1000000")
+    spool = RecorderSpool(path)
+    assert [event.data["value"] for _, event in spool.read()] == [0, 1, 2, 3]
+
+    spool.remove()
+    assert not os.path.exists(spool.offset_path)
+
+    # A stale offset is not applied to a new spool
+    spool.commit(offset)
+    spool = RecorderSpool(path)
+    spool.append([Event("custom_event", {"value": 4})])
+    assert [event.data["value"] for _, event in spool.read()] == [4]
+
+
+async def test_recorder_spools_and_replays_events(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test the recorder records spooled events in order once it catches up."""
+    hass.config.config_dir = str(tmp_path)
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0, recorder.CONF_SPOOL: True}
+    )
+    await async_wait_recording_done(hass)
+
+    instance._async_start_spooling()
+    for idx in range(3):
+        hass.states.async_set("sensor.spooled", str(idx))
+    assert len(instance._spool_buffer) == 3
+    assert instance.backlog == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert instance._spool_buffer is None
+    hass.states.async_set("sensor.spooled", "3")
+    await async_wait_recording_done(hass)
+
+    assert not instance._spool_replaying
+    assert not await hass.async_add_executor_job(instance._spool.exists)
+
+    def _fetch_states() -> list[tuple[str, int | None, int]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (state.state, state.old_state_id, state.state_id)
+                for state in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.spooled")
+                .order_by(States.state_id)
+            ]
+
+    states = await instance.async_add_executor_job(_fetch_states)
+    assert [state for state, _, _ in states] == ["0", "1", "2", "3"]
+    assert [old_state_id for _, old_state_id, _ in states[1:]] == [
+        state_id for _, _, state_id in states[:-1]
+    ]
+
+
+async def test_recorder_replays_spool_on_start(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test events spooled before a restart are recorded on the next start."""
+    hass.config.config_dir = str(tmp_path)
+    spool = RecorderSpool(hass.config.path(".storage", "recorder.spool"))
+    state = State("sensor.spooled", "before_restart")
+    spool.append(
+        [
+            Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": "sensor.spooled", "old_state": None, "new_state": state},
+            )
+        ]
+    )
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0, recorder.CONF_SPOOL: True}
+    )
+    await async_wait_recording_done(hass)
+
+    assert not spool.exists()
+
+    def _fetch_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [state.state for state in session.query(States)]
+
+    assert await instance.async_add_executor_job(_fetch_states) == ["before_restart"]
+
+
+async def test_recorder_resumes_interrupted_replay_on_start(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test a replay interrupted by a restart does not record events twice."""
+    hass.config.config_dir = str(tmp_path)
+    spool = RecorderSpool(hass.config.path(".storage", "recorder.spool"))
+    spool.append(
+        Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.spooled",
+                "old_state": None,
+                "new_state": State("sensor.spooled", str(idx)),
+            },
+        )
+        for idx in range(3)
+    )
+    # The first event was committed before Home Assistant stopped
+    offset, _ = next(spool.read())
+    spool.commit(offset)
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0, recorder.CONF_SPOOL: True}
+    )
+    await async_wait_recording_done(hass)
+
+    assert not spool.exists()
+    assert not os.path.exists(spool.offset_path)
+
+    def _fetch_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [state.state for state in session.query(States)]
+
+    assert await instance.async_add_executor_job(_fetch_states) == ["1", "2"]
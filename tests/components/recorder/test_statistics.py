@@ -17,6 +17,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     PlatformCompiledStatistics,
+    StatisticsStatesCache,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
@@ -37,7 +38,7 @@ from homeassistant.components.recorder.table_managers.statistics_meta import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
@@ -87,6 +88,55 @@ def test_converters_align_with_sensor() -> None:
         assert converter in UNIT_CONVERTERS.values()
 
 
+def test_statistics_states_cache() -> None:
+    """Test the statistics states cache returns the states of a period."""
+    start = dt_util.utcnow()
+
+    def _state(entity_id: str, state: str, seconds: int, changed: bool = True):
+        last_updated = start + timedelta(seconds=seconds)
+        return State(
+            entity_id,
+            state,
+            last_changed=last_updated if changed else start,
+            last_updated=last_updated,
+        )
+
+    cache = StatisticsStatesCache()
+    first = _state("sensor.one", "1", -10)
+    cache.seed("sensor.one", start.timestamp(), [first])
+    cache.add(_state("sensor.two", "1", 0))
+    attributes_changed = _state("sensor.one", "1", 10, changed=False)
+    changed = _state("sensor.one", "2", 20)
+    cache.add(attributes_changed)
+    cache.add(changed)
+    next_period = _state("sensor.one", "3", 300)
+    cache.add(next_period)
+
+    end_ts = (start + timedelta(minutes=5)).timestamp()
+    entity_ids = ["sensor.one", "sensor.two"]
+    assert cache.get_states(entity_ids, start.timestamp(), end_ts, set()) == {
+        "sensor.one": [first, attributes_changed, changed]
+    }
+    assert cache.get_states(entity_ids, start.timestamp(), end_ts, {"sensor.one"}) == {
+        "sensor.one": [first, changed]
+    }
+    # Periods before the cache was seeded are not covered
+    assert (
+        cache.get_states(entity_ids, start.timestamp() - 300, start.timestamp(), set())
+        == {}
+    )
+
+    cache.evict(entity_ids, end_ts)
+    next_end_ts = end_ts + 300
+    assert cache.get_states(entity_ids, end_ts, next_end_ts, set()) == {
+        "sensor.one": [changed, next_period]
+    }
+    assert cache.get_states(entity_ids, start.timestamp(), end_ts, set()) == {}
+
+    cache.evict(["sensor.two"], next_end_ts)
+    assert cache.get_states(entity_ids, next_end_ts, next_end_ts + 300, set()) == {}
+
+
 async def test_compile_hourly_statistics(
     hass: HomeAssistant,
     setup_recorder: None,
@@ -3719,3 +3719,25 @@ async def test_import_statistics_with_last_reset(
             },
         ]
     }
+
+
+async def test_read_job_timings(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the timings of the read jobs are returned."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/read_job_timings"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {}
+
+    await client.send_json_auto_id({"type": "recorder/list_statistic_ids"})
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json_auto_id({"type": "recorder/read_job_timings"})
+    response = await client.receive_json()
+    assert response["success"]
+    timings = response["result"]["_ws_get_list_statistic_ids"]
+    assert timings["count"] == 1
+    assert timings["total"] == timings["max"] == timings["mean"] > 0
@@ -1,6 +1,7 @@
 """The tests for the Template automation."""
 
 from datetime import timedelta
+from functools import partial
 from unittest import mock
 
 from freezegun.api import FrozenDateTimeFactory
@@ -364,6 +365,53 @@ async def test_if_fires_on_change_with_template_advanced(
     assert calls[0].data["some"] == "template - test.entity - hello - world - None"
 
 
+@pytest.mark.parametrize(("count", "domain"), [(1, automation.DOMAIN)])
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "template",
+                    "value_template": '{{ is_state("test.entity", "world") }}',
+                },
+                "action": {
+                    "service": "test.automation",
+                    "data_template": {
+                        "some": (
+                            "{{ trigger.platform }}"
+                            " - {{ trigger.entity_id }}"
+                            " - {{ trigger.from_state.state }}"
+                            " - {{ trigger.to_state.state }}"
+                            " - {{ trigger.for }}"
+                        )
+                    },
+                },
+            }
+        },
+    ],
+)
+@pytest.mark.usefixtures("start_ha")
+async def test_if_fires_on_change_coalesced(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test for firing on a change coalesced in a loop iteration."""
+    context = Context()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "again")
+    hass.states.async_set("test.entity", "almost", context=context)
+    # Changed while the events above are dispatched, so only the
+    # render coalesced for the second event sees the new state
+    hass.loop.call_soon(
+        partial(hass.states.async_set, "test.entity", "world", context=context)
+    )
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].context.parent_id == context.id
+    assert calls[0].data["some"] == "template - test.entity - again - almost - None"
+
+
 @pytest.mark.parametrize(("count", "domain"), [(1, automation.DOMAIN)])
 @pytest.mark.parametrize(
     "config",
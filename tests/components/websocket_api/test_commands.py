@@ -11,7 +11,7 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import commands as websocket_commands, const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -22,7 +22,7 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, startup_trace
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
@@ -1262,6 +1262,138 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_batched_state_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test states set with async_set_many are sent in a single message."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off", {"color": "red"})
+    hass.states.async_set("light.three", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.one", "light.two", "light.three", "light.four"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two", "light.three"}
+
+    hass.states.async_set_many(
+        [
+            ("light.one", "on", None),
+            ("light.two", "off", {"color": "blue"}),
+            ("light.four", "on", None),
+            ("light.not_subscribed", "on", None),
+        ]
+    )
+    hass.states.async_remove("light.three")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.four": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+            "light.two": {"+": {"a": {"color": "blue"}, "c": ANY, "lu": ANY}},
+        },
+    }
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.three"]}
+
+    # Multiple changes of the same entity are not merged
+    hass.states.async_set_many([("light.one", "off", None), ("light.one", "on", None)])
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+    msg = await websocket_client.receive_json()
+    # Both states are written at the same time so lc is unchanged
+    assert msg["event"] == {"c": {"light.one": {"+": {"c": ANY, "s": "on"}}}}
+
+
+async def test_subscribe_entities_latest_only(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test changes are merged until the client has caught up."""
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "latest_only": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two"}
+
+    hass.states.async_set("light.one", "on", {"color": "red"})
+    hass.states.async_set("light.one", "off", {"color": "blue"})
+    hass.states.async_set("light.one", "on", {"color": "green"})
+    hass.states.async_set("light.new", "on")
+    hass.states.async_remove("light.new")
+    hass.states.async_remove("light.two")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "r": ["light.two"],
+        "c": {
+            "light.one": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+    }
+
+    hass.states.async_set("light.one", "off", {"color": "green"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
+async def test_subscribe_entities_latest_only_shares_merged_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscriptions merging the same changes share the merged events."""
+    hass.states.async_set("light.one", "off")
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", "latest_only": True}
+        )
+        assert (await websocket_client.receive_json())["success"]
+        await websocket_client.receive_json()
+
+    merge_events = websocket_commands._merge_state_changed_events
+    merge_events.cache_clear()
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.one", "on")
+
+    messages = [await websocket_client.receive_json() for _ in range(2)]
+    assert {msg["id"] for msg in messages} == {7, 8}
+    for msg in messages:
+        assert msg["event"] == {
+            "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+    cache_info = merge_events.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 2)
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2566,6 +2698,32 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test getting the startup trace."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    trace = startup_trace.async_start_startup_trace(hass)
+    trace.async_add_span(
+        "august", startup_trace.SPAN_INTEGRATION, trace.started, trace.started + 2
+    )
+    trace.async_finish()
+
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    assert msg["result"]["finished"] is True
+    assert msg["result"]["critical_path"] == [
+        {"domain": "august", "start": 0, "end": 2, "self_time": 2}
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
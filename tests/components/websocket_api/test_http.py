@@ -299,6 +299,58 @@ async def test_pending_msg_peak_recovery(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_call_when_drained(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test callbacks are called once the queued messages are written."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    calls: list[int] = []
+
+    def _drained() -> None:
+        calls.append(len(instance._message_queue))
+        instance._send_message({"id": 2})
+
+    for idx in range(3):
+        instance._send_message({"id": idx})
+    instance._call_when_drained(_drained)
+    assert calls == []
+
+    for idx in (0, 1, 2, 2):
+        msg = await websocket_client.receive_json()
+        assert msg == {"id": idx}
+    assert calls == [0]
+
+    # Called soon when there are no queued messages
+    instance._call_when_drained(_drained)
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 2}
+    assert calls == [0, 0]
+
+    # Waiting callbacks are called when the connection closes
+    instance._writer_task.cancel()
+    await asyncio.sleep(0)
+    instance._send_message({"id": 3})
+    released = asyncio.Event()
+    instance._call_when_drained(released.set)
+    await websocket_client.close()
+    async with asyncio.timeout(5):
+        await released.wait()
+
+
 async def test_pending_msg_peak_but_does_not_overflow(
     hass: HomeAssistant,
     mock_low_peak,
@@ -4,8 +4,10 @@ import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
+    _partial_cached_state_diff_batch_message as lru_batch_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_batch_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -83,6 +85,29 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_cached_state_diff_batch_message(hass: HomeAssistant) -> None:
+    """Test that we serialize a batch once for every subscription."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    lru_batch_cache.cache_clear()
+
+    msgs0 = cached_state_diff_batch_message(b"2", events)
+    msgs1 = cached_state_diff_batch_message(b"3", list(events))
+
+    assert len(msgs0) == 1
+    assert msgs0[0].endswith(b'},"id":2}')
+    assert msgs1 == [msgs0[0].replace(b'"id":2}', b'"id":3}')]
+
+    cache_info = lru_batch_cache.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
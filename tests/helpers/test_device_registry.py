@@ -2982,6 +2982,39 @@ async def test_entries_for_label(
     assert not dr.async_entries_for_label(device_registry, "")
 
 
+async def test_entries_for_name(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test getting device entries by name."""
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+
+    entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        name="Device",
+    )
+    unnamed = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:00")},
+    )
+    assert device_registry.devices.get_devices_for_name("Device") == [entry]
+    assert not device_registry.devices.get_devices_for_name("")
+
+    entry = device_registry.async_update_device(entry.id, name_by_user="My device")
+    assert not device_registry.devices.get_devices_for_name("Device")
+    assert device_registry.devices.get_devices_for_name("My device") == [entry]
+
+    unnamed = device_registry.async_update_device(unnamed.id, name="My device")
+    assert device_registry.devices.get_devices_for_name("My device") == [
+        entry,
+        unnamed,
+    ]
+
+    device_registry.async_remove_device(entry.id)
+    assert device_registry.devices.get_devices_for_name("My device") == [unnamed]
+
+
 @pytest.mark.parametrize(
     (
         "translation_key",
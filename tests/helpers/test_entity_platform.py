@@ -2334,3 +2334,31 @@ async def test_device_type_error_checking(
     assert len(device_registry.devices) == 0
     assert len(entity_registry.entities) == number_of_entities
     assert len(hass.states.async_all()) == number_of_entities
+
+
+async def test_add_entities_batches_registry_saves(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test adding entities schedules a single registry save."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+    entities = [
+        MockEntity(name=f"test_{idx}", unique_id=f"id_{idx}") for idx in range(3)
+    ]
+
+    states_when_added: list[list[str]] = []
+
+    class StateCapturingEntity(MockEntity):
+        async def async_added_to_hass(self) -> None:
+            states_when_added.append(sorted(hass.states.async_entity_ids()))
+
+    entities.append(StateCapturingEntity(name="test_3", unique_id="id_3"))
+
+    with patch.object(entity_registry._store, "async_delay_save") as mock_delay_save:
+        await component.async_add_entities(entities)
+
+    assert len(mock_delay_save.mock_calls) == 1
+    assert len(entity_registry.entities) == 4
+    # The states of entities are written as soon as they are added
+    assert states_when_added == [[entity.entity_id for entity in entities[:3]]]
+    assert hass.states.get(entities[3].entity_id) is not None
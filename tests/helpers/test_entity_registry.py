@@ -2116,6 +2116,64 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_label(entity_registry, "")
 
 
+async def test_entries_for_secondary_indexes(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test getting entity entries by domain, platform, state and device area."""
+    config_entry = MockConfigEntry(domain="hue")
+    config_entry.add_to_hass(hass)
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    light = entity_registry.async_get_or_create(
+        "light", "hue", "1234", device_id=device_entry.id
+    )
+    sensor = entity_registry.async_get_or_create(
+        "sensor", "hue", "1234", device_id=device_entry.id
+    )
+    other = entity_registry.async_get_or_create("light", "mqtt", "1234")
+    entities = entity_registry.entities
+
+    assert entities.get_entries_for_domain("light") == [light, other]
+    assert entities.get_entries_for_platform("hue") == [light, sensor]
+    assert entities.get_entries_for_device_area(device_entry.id) == [light, sensor]
+    assert not entities.get_entries_for_domain("switch")
+    assert not entities.get_entries_for_disabled_by(er.RegistryEntryDisabler.USER)
+
+    sensor = entity_registry.async_update_entity(
+        sensor.entity_id,
+        area_id="kitchen",
+        disabled_by=er.RegistryEntryDisabler.USER,
+        hidden_by=er.RegistryEntryHider.USER,
+    )
+    assert entities.get_entries_for_device_area(device_entry.id) == [light]
+    assert entities.get_entries_for_disabled_by(er.RegistryEntryDisabler.USER) == [
+        sensor
+    ]
+    assert entities.get_entries_for_hidden_by(er.RegistryEntryHider.USER) == [sensor]
+
+    sensor = entity_registry.async_update_entity(
+        sensor.entity_id, area_id=None, disabled_by=None, hidden_by=None
+    )
+    assert entities.get_entries_for_device_area(device_entry.id) == [light, sensor]
+    assert not entities.get_entries_for_disabled_by(er.RegistryEntryDisabler.USER)
+    assert not entities.get_entries_for_hidden_by(er.RegistryEntryHider.USER)
+
+    renamed = entity_registry.async_update_entity(
+        light.entity_id, new_entity_id="light.renamed"
+    )
+    assert entities.get_entries_for_domain("light") == [other, renamed]
+    assert entities.get_entries_for_platform("hue") == [sensor, renamed]
+
+    entity_registry.async_remove(renamed.entity_id)
+    entity_registry.async_remove(sensor.entity_id)
+    assert entities.get_entries_for_platform("hue") == []
+    assert not entities.get_entries_for_device_area(device_entry.id)
+
+
 async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     """Make sure we can clear categories."""
     entry = entity_registry.async_get_or_create(
@@ -537,6 +537,153 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_event_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test async_track_state_change_event with an attribute selector."""
+    state_runs = []
+    attribute_runs = []
+
+    unsub_state = async_track_state_change_event(
+        hass,
+        ["sensor.one", "sensor.two"],
+        ha.callback(lambda event: state_runs.append(event.data["entity_id"])),
+        attributes=(),
+    )
+    unsub_attribute = async_track_state_change_event(
+        hass,
+        "sensor.one",
+        ha.callback(lambda event: attribute_runs.append(event.data["entity_id"])),
+        attributes=["battery"],
+    )
+
+    hass.states.async_set("sensor.one", "1", {"battery": 100, "rssi": -70})
+    hass.states.async_set("sensor.two", "1")
+    await hass.async_block_till_done()
+    assert state_runs == ["sensor.one", "sensor.two"]
+    assert attribute_runs == ["sensor.one"]
+
+    # Only the rssi changed
+    hass.states.async_set("sensor.one", "1", {"battery": 100, "rssi": -60})
+    await hass.async_block_till_done()
+    assert state_runs == ["sensor.one", "sensor.two"]
+    assert attribute_runs == ["sensor.one"]
+
+    hass.states.async_set("sensor.one", "1", {"battery": 90, "rssi": -60})
+    await hass.async_block_till_done()
+    assert state_runs == ["sensor.one", "sensor.two"]
+    assert attribute_runs == ["sensor.one", "sensor.one"]
+
+    hass.states.async_set("sensor.one", "2", {"battery": 90, "rssi": -50})
+    hass.states.async_remove("sensor.two")
+    await hass.async_block_till_done()
+    assert state_runs == ["sensor.one", "sensor.two", "sensor.one", "sensor.two"]
+    assert attribute_runs == ["sensor.one", "sensor.one", "sensor.one"]
+
+    unsub_state()
+    unsub_attribute()
+    hass.states.async_set("sensor.one", "3")
+    await hass.async_block_till_done()
+    assert len(state_runs) == 4
+    assert len(attribute_runs) == 3
+
+
+async def test_track_state_change_filtered_entity_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test async_track_state_change_filtered with entity attributes."""
+    runs = []
+
+    track = async_track_state_change_filtered(
+        hass,
+        TrackStates(
+            False,
+            {"sensor.one", "sensor.two", "switch.one"},
+            set(),
+            {
+                "sensor.one": frozenset({"battery"}),
+                "switch.one": frozenset({"battery"}),
+            },
+        ),
+        ha.callback(lambda event: runs.append(event.data["entity_id"])),
+    )
+
+    hass.states.async_set("sensor.one", "1", {"battery": 100, "rssi": -70})
+    hass.states.async_set("sensor.two", "1", {"rssi": -70})
+    await hass.async_block_till_done()
+    assert runs == ["sensor.one", "sensor.two"]
+
+    hass.states.async_set("sensor.one", "1", {"battery": 100, "rssi": -60})
+    hass.states.async_set("sensor.two", "1", {"rssi": -60})
+    await hass.async_block_till_done()
+    assert runs == ["sensor.one", "sensor.two", "sensor.two"]
+
+    hass.states.async_set("sensor.one", "1", {"battery": 90, "rssi": -60})
+    await hass.async_block_till_done()
+    assert runs == ["sensor.one", "sensor.two", "sensor.two", "sensor.one"]
+
+    # Entities in tracked domains are tracked in full
+    track.async_update_listeners(
+        TrackStates(
+            False,
+            {"sensor.one", "switch.one"},
+            {"switch"},
+            {
+                "sensor.one": frozenset({"battery"}),
+                "switch.one": frozenset({"battery"}),
+            },
+        )
+    )
+    runs.clear()
+    hass.states.async_set("switch.one", "on", {"rssi": -70})
+    hass.states.async_set("switch.one", "on", {"rssi": -60})
+    hass.states.async_set("sensor.one", "1", {"battery": 90, "rssi": -50})
+    await hass.async_block_till_done()
+    assert runs == ["switch.one", "switch.one"]
+
+    # The entity is tracked in full when it no longer has attributes
+    track.async_update_listeners(TrackStates(False, {"sensor.one"}, set()))
+    hass.states.async_set("sensor.one", "1", {"battery": 90, "rssi": -40})
+    await hass.async_block_till_done()
+    assert runs == ["switch.one", "switch.one", "sensor.one"]
+
+    track.async_remove()
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    assert runs == ["switch.one", "switch.one", "sensor.one"]
+
+
+async def test_track_template_result_tracks_used_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test template tracking only listens for the attributes it uses."""
+    hass.states.async_set("sensor.one", "1", {"battery": 100, "rssi": -70})
+    hass.states.async_set("sensor.two", "1", {"battery": 100})
+    template = Template(
+        "{{ state_attr('sensor.one', 'battery') }}"
+        " {{ state_attr('sensor.two', 'battery') }}",
+        hass,
+    )
+    other_template = Template(
+        "{{ state_attr('sensor.one', 'rssi') }} {{ states('sensor.two') }}", hass
+    )
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template, None), TrackTemplate(other_template, None)],
+        ha.callback(lambda event, updates: None),
+    )
+    await hass.async_block_till_done()
+
+    track_states = info._track_state_changes._last_track_states
+    assert track_states.entities == {"sensor.one", "sensor.two"}
+    assert track_states.entity_attributes == {
+        "sensor.one": frozenset({"battery", "rssi"})
+    }
+
+    info.async_remove()
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -1067,6 +1214,107 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_attribute_changes(hass: HomeAssistant) -> None:
+    """Test templates reading attributes only re-render when they change."""
+    specific_runs = []
+    hass.states.async_set("light.one", "on", {"brightness": 100, "color": "red"})
+    template_attribute = Template("{{ state_attr('light.one', 'brightness') }}", hass)
+
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_attribute, None)], specific_run_callback
+    )
+    await hass.async_block_till_done()
+    assert info.listeners["entities"] == {"light.one"}
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as render_mock:
+        hass.states.async_set("light.one", "off", {"brightness": 100, "color": "blue"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 0
+        assert specific_runs == []
+
+        hass.states.async_set("light.one", "on", {"brightness": 200, "color": "blue"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 1
+        assert specific_runs == [200]
+
+    hass.states.async_remove("light.one")
+    await hass.async_block_till_done()
+    assert specific_runs == [200, None]
+
+
+async def test_track_template_result_coalesce(hass: HomeAssistant) -> None:
+    """Test re-renders for events in the same loop iteration are coalesced."""
+    specific_runs = []
+    template_condition = Template("{{ states('sensor.test') }}", hass)
+
+    @ha.callback
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    async_track_template_result(
+        hass, [TrackTemplate(template_condition, None)], specific_run_callback
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as render_mock:
+        for value in range(1, 6):
+            hass.states.async_set("sensor.test", value)
+        await hass.async_block_till_done()
+        # Rendered for the first event and once more for the others
+        assert render_mock.call_count == 2
+        assert specific_runs == [5]
+
+        hass.states.async_set("sensor.test", 6)
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 3
+        assert specific_runs == [5, 6]
+
+
+async def test_track_template_result_coalesce_refreshes_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test coalesced templates are rendered again with their last event."""
+    template_one = Template("{{ states('sensor.test') }}", hass)
+    template_two = Template("{{ states('sensor.test') | int + 1 }}", hass)
+    track_templates = [
+        TrackTemplate(template_one, None),
+        TrackTemplate(template_two, None),
+    ]
+    info = async_track_template_result(hass, track_templates, lambda *_: None)
+    await hass.async_block_till_done()
+
+    with patch.object(info, "_refresh", wraps=info._refresh) as refresh_mock:
+        for value in (1, 2, 3):
+            hass.states.async_set("sensor.test", value)
+        await hass.async_block_till_done()
+
+    coalesced_calls = [
+        call for call in refresh_mock.mock_calls if "track_templates" in call.kwargs
+    ]
+    assert len(coalesced_calls) == 1
+    assert coalesced_calls[0].args[0].data["new_state"].state == "3"
+    assert coalesced_calls[0].kwargs["track_templates"] == track_templates
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -69,3 +69,32 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+async def test_async_defer_save(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test saves requested while deferred are scheduled once."""
+    registry = SampleRegistry(hass)
+    hass.set_state(CoreState.running)
+
+    with registry.async_defer_save():
+        with registry.async_defer_save():
+            registry.async_schedule_save()
+        registry.async_schedule_save()
+        freezer.tick(SAVE_DELAY)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert registry.save_calls == 0
+
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert registry.save_calls == 1
+
+    with registry.async_defer_save():
+        pass
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert registry.save_calls == 1
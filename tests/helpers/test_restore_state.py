@@ -6,6 +6,9 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,7 +18,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_REFRESH_INTERVAL,
     STORAGE_KEY,
+    ExtraStoredData,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -119,7 +125,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     assert mock_write_data.called
 
@@ -135,7 +141,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     assert not mock_write_data.called
 
@@ -168,7 +174,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     # Not quite the first interval
     assert not mock_write_data.called
@@ -185,7 +191,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
     # Verify still saving
     assert mock_write_data.called
 
@@ -342,6 +348,77 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_reuses_unchanged_items(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test dumping reuses the items of states which did not change."""
+
+    class ExtraEntity(RestoreEntity):
+        extra = {"value": 1}
+
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            return RestoredExtraData(dict(self.extra))
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = [RestoreEntity(), ExtraEntity(), ExtraEntity()]
+    for idx, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    data.last_states = {
+        "input_boolean.b3": StoredState(
+            State("input_boolean.b3", "off"), None, dt_util.utcnow()
+        )
+    }
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    first_items = mock_write_data.mock_calls[0][1][0]
+    assert len(first_items) == 4
+
+    hass.states.async_set("input_boolean.b0", "off")
+    entities[2].extra = {"value": 2}
+    freezer.tick(timedelta(hours=1))
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    items = mock_write_data.mock_calls[0][1][0]
+    assert [
+        item is first_item for item, first_item in zip(items, first_items, strict=True)
+    ] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert json_round_trip(items[0])["state"]["state"] == "off"
+    assert json_round_trip(items[2])["extra_data"] == {"value": 2}
+
+    # The last seen time of unchanged states is refreshed once in a while
+    freezer.tick(LAST_SEEN_REFRESH_INTERVAL)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    refreshed_items = mock_write_data.mock_calls[0][1][0]
+    assert [
+        item is refreshed
+        for item, refreshed in zip(items, refreshed_items, strict=True)
+    ] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -375,6 +452,37 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_extra_data_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test dumping extra data which can not be serialized logs an error."""
+
+    class UnserializableExtraData(ExtraStoredData):
+        def as_dict(self) -> dict[str, Any]:
+            return {"value": object()}
+
+    class UnserializableRestoreEntity(RestoreEntity):
+        @property
+        def extra_restore_state_data(self) -> ExtraStoredData:
+            return UnserializableExtraData()
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = UnserializableRestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    assert not mock_write_data.called
+    assert "Error saving current states" in caplog.text
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
@@ -38,6 +38,8 @@ from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
     service,
 )
 import homeassistant.helpers.config_validation as cv
@@ -46,6 +48,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -793,6 +796,79 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_referenced_entity_ids_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test resolved area, floor and label targets are cached."""
+    floor = floor_registry.async_create("Ground floor")
+    area = area_registry.async_create("Kitchen", floor_id=floor.floor_id)
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    in_device = entity_registry.async_get_or_create(
+        "light", "test", "1", device_id=device.id
+    )
+    in_area = entity_registry.async_get_or_create("light", "test", "2")
+    entity_registry.async_update_entity(in_area.entity_id, area_id=area.id)
+    resolution_cache = service.async_get_target_resolution_cache(hass)
+
+    def extract(data: dict[str, Any]) -> service.SelectedEntities:
+        return service.async_extract_referenced_entity_ids(
+            hass, ServiceCall(hass, "light", "turn_on", data)
+        )
+
+    selected = extract({"floor_id": floor.floor_id})
+    assert selected.indirectly_referenced == {in_device.entity_id, in_area.entity_id}
+    assert selected.referenced_areas == {area.id}
+    assert selected.referenced_devices == {device.id}
+    assert (resolution_cache.hits, resolution_cache.misses) == (0, 1)
+
+    selected.indirectly_referenced.clear()
+    selected = extract({"floor_id": floor.floor_id, "entity_id": "light.other"})
+    assert selected.referenced == {"light.other"}
+    assert selected.indirectly_referenced == {in_device.entity_id, in_area.entity_id}
+    assert (resolution_cache.hits, resolution_cache.misses) == (1, 1)
+
+    # Changes which don't affect targets keep the cache
+    entity_registry.async_update_entity(in_device.entity_id, name="Renamed")
+    floor_registry.async_update(floor.floor_id, name="First floor")
+    device_registry.async_update_device(device.id, name_by_user="Renamed")
+    await hass.async_block_till_done()
+    extract({"floor_id": floor.floor_id})
+    assert (resolution_cache.hits, resolution_cache.misses) == (2, 1)
+
+    entity_registry.async_update_entity(
+        in_device.entity_id, hidden_by=er.RegistryEntryHider.USER
+    )
+    await hass.async_block_till_done()
+    selected = extract({"floor_id": floor.floor_id})
+    assert selected.indirectly_referenced == {in_area.entity_id}
+    assert (resolution_cache.hits, resolution_cache.misses) == (2, 2)
+
+    area_registry.async_update(area.id, floor_id=None)
+    await hass.async_block_till_done()
+    selected = extract({"floor_id": floor.floor_id})
+    assert not selected.indirectly_referenced
+    assert (resolution_cache.hits, resolution_cache.misses) == (2, 3)
+
+    selected = extract({"label_id": "my_label"})
+    assert selected.missing_labels == {"my_label"}
+    label_registry.async_create("My label")
+    await hass.async_block_till_done()
+    selected = extract({"label_id": "my_label"})
+    assert not selected.missing_labels
+    assert (resolution_cache.hits, resolution_cache.misses) == (2, 5)
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -943,7 +1019,7 @@ async def test_async_get_all_descriptions_dot_keys(hass: HomeAssistant) -> None:
     mock_integration(hass, MockModule(domain), top_level_files={"services.yaml"})
     assert await async_setup_component(hass, domain, {})
 
-    def load_yaml(fname, secrets=None):
+    def load_yaml(fname, secrets=None, cache=None):
         with io.StringIO(service_descriptions) as file:
             return parse_yaml(file)
 
@@ -959,7 +1035,7 @@ async def test_async_get_all_descriptions_dot_keys(hass: HomeAssistant) -> None:
     ):
         descriptions = await service.async_get_all_descriptions(hass)
 
-    mock_load_yaml.assert_called_once_with("services.yaml", None)
+    mock_load_yaml.assert_called_once_with("services.yaml", None, None)
     assert proxy_load_services_files.mock_calls[0][1][1] == unordered(
         [
             await async_get_integration(hass, domain),
@@ -1015,7 +1091,7 @@ async def test_async_get_all_descriptions_filter(hass: HomeAssistant) -> None:
     mock_integration(hass, MockModule(domain), top_level_files={"services.yaml"})
     assert await async_setup_component(hass, domain, {})
 
-    def load_yaml(fname, secrets=None):
+    def load_yaml(fname, secrets=None, cache=None):
         with io.StringIO(service_descriptions) as file:
             return parse_yaml(file)
 
@@ -1031,7 +1107,7 @@ async def test_async_get_all_descriptions_filter(hass: HomeAssistant) -> None:
     ):
         descriptions = await service.async_get_all_descriptions(hass)
 
-    mock_load_yaml.assert_called_once_with("services.yaml", None)
+    mock_load_yaml.assert_called_once_with("services.yaml", None, None)
     assert proxy_load_services_files.mock_calls[0][1][1] == unordered(
         [
             await async_get_integration(hass, domain),
@@ -0,0 +1,75 @@
+"""Tests for the startup trace helper."""
+
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+def test_critical_path() -> None:
+    """Test the critical path follows the dependency finishing last."""
+    trace = startup_trace.StartupTrace()
+    start = trace.started
+    trace.async_add_span("http", startup_trace.SPAN_INTEGRATION, start, start + 1)
+    trace.async_add_span("slow", startup_trace.SPAN_INTEGRATION, start, start + 5)
+    trace.async_add_span("frontend", startup_trace.SPAN_INTEGRATION, start, start + 7)
+    trace.async_add_span("zone", startup_trace.SPAN_INTEGRATION, start, start + 8)
+    trace.async_add_span("other", startup_trace.SPAN_INTEGRATION, start, start + 6)
+    trace.async_add_dependencies("frontend", ["http", "slow"])
+    trace.async_add_dependencies("zone", ["frontend"])
+    trace.async_finish()
+
+    assert trace.async_critical_path() == [
+        {"domain": "slow", "start": 0, "end": 5, "self_time": 5},
+        {"domain": "frontend", "start": 0, "end": 7, "self_time": 2},
+        {"domain": "zone", "start": 0, "end": 8, "self_time": 1},
+    ]
+    data = trace.as_dict()
+    assert data["finished"] is True
+    assert data["dependencies"] == {"frontend": ["http", "slow"], "zone": ["frontend"]}
+    assert data["spans"][1] == {
+        "domain": "slow",
+        "kind": "integration",
+        "group": None,
+        "start": 0,
+        "end": 5,
+        "queue_wait": 0,
+    }
+
+
+def test_critical_path_empty() -> None:
+    """Test the critical path without any integrations."""
+    assert startup_trace.StartupTrace().async_critical_path() == []
+
+
+async def test_trace_setup(hass: HomeAssistant) -> None:
+    """Test setting up integrations is traced until the trace is finished."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["comp_dep"]))
+    mock_integration(hass, MockModule("comp_late"))
+    assert startup_trace.async_get_startup_trace(hass) is None
+
+    trace = startup_trace.async_start_startup_trace(hass)
+    assert startup_trace.async_get_active_startup_trace(hass) is trace
+    assert await async_setup_component(hass, "comp", {})
+
+    spans = {(span.domain, span.kind) for span in trace.spans}
+    assert {
+        ("comp", startup_trace.SPAN_INTEGRATION),
+        ("comp", startup_trace.SPAN_WAIT_DEPENDENCIES),
+        ("comp", "setup"),
+        ("comp_dep", startup_trace.SPAN_INTEGRATION),
+    } <= spans
+    assert trace.dependencies == {"comp": {"comp_dep"}}
+    assert [step["domain"] for step in trace.async_critical_path()] == [
+        "comp_dep",
+        "comp",
+    ]
+
+    trace.async_finish()
+    assert startup_trace.async_get_active_startup_trace(hass) is None
+    assert startup_trace.async_get_startup_trace(hass) is trace
+    assert await async_setup_component(hass, "comp_late", {})
+    assert "comp_late" not in {span.domain for span in trace.spans}
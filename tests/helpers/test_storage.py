@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1180,130 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store only appends the changed items after a snapshot."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {"items": "id", "deleted_items": "id"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+
+        def fragment(item_id: str, name: str) -> json_fragment:
+            return json_fragment(json_bytes({"id": item_id, "name": name}))
+
+        item_a = fragment("a", "A")
+        item_b = fragment("b", "B")
+        item_c = fragment("c", "C")
+        await store.async_save({"items": [item_a, item_b], "deleted_items": []})
+
+        def read_files() -> tuple[dict[str, Any], list[str] | None]:
+            with open(store.path, encoding="utf8") as file:
+                snapshot = json.load(file)
+            try:
+                with open(store.journal_path, encoding="utf8") as file:
+                    journal = file.read().splitlines()
+            except FileNotFoundError:
+                journal = None
+            return snapshot, journal
+
+        snapshot, journal = await hass.async_add_executor_job(read_files)
+        assert snapshot["journal_generation"] == 1
+        assert journal is None
+
+        await store.async_save(
+            {"items": [item_b, item_c], "deleted_items": [fragment("a", "A")]}
+        )
+        await store.async_save(
+            {"items": [fragment("b", "B2"), item_c], "deleted_items": []}
+        )
+        snapshot, journal = await hass.async_add_executor_job(read_files)
+        assert snapshot["data"]["items"] == [
+            {"id": "a", "name": "A"},
+            {"id": "b", "name": "B"},
+        ]
+        assert [json.loads(line) for line in journal] == [
+            {"generation": 1},
+            {"collection": "items", "key": "c", "item": {"id": "c", "name": "C"}},
+            {"collection": "items", "key": "a", "item": None},
+            {
+                "collection": "deleted_items",
+                "key": "a",
+                "item": {"id": "a", "name": "A"},
+            },
+            {"collection": "items", "key": "b", "item": {"id": "b", "name": "B2"}},
+            {"collection": "deleted_items", "key": "a", "item": None},
+        ]
+
+        def append_incomplete_line() -> None:
+            with open(store.journal_path, "a", encoding="utf8") as file:
+                file.write('{"coll')
+
+        # An interrupted append leaves an incomplete last line
+        await hass.async_add_executor_job(append_incomplete_line)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        assert await store.async_load() == {
+            "items": [{"id": "b", "name": "B2"}, {"id": "c", "name": "C"}],
+            "deleted_items": [],
+        }
+
+        # The first write after loading is a snapshot which replaces the journal
+        await store.async_save({"items": [item_c], "deleted_items": []})
+        snapshot, journal = await hass.async_add_executor_job(read_files)
+        assert snapshot["journal_generation"] == 2
+        assert snapshot["data"]["items"] == [{"id": "c", "name": "C"}]
+        assert journal is None
+
+        # Unchanged data does not write to the journal
+        await store.async_save({"items": [item_c], "deleted_items": []})
+        assert (await hass.async_add_executor_job(read_files))[1] is None
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_ignores_stale_journal(tmpdir: py.path.local) -> None:
+    """Test a journal of another snapshot is not applied."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        await store.async_save({"items": [{"id": "a"}]})
+
+        def write_journal() -> None:
+            with open(store.journal_path, "w", encoding="utf8") as file:
+                file.write('{"generation": 0}\n')
+                file.write('{"collection": "items", "key": "b", "item": {"id": "b"}}\n')
+
+        await hass.async_add_executor_job(write_journal)
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        assert await store.async_load() == {"items": [{"id": "a"}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_list(tmpdir: py.path.local) -> None:
+    """Test a journaled store with a list of items keyed by a nested field."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        journal_keys = {None: "state.entity_id"}
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        item_a = {"state": json_fragment(b'{"entity_id":"light.a","state":"on"}')}
+        item_b = {"state": json_fragment(b'{"entity_id":"light.b","state":"on"}')}
+        await store.async_save([item_a, item_b])
+        await store.async_save(
+            [{"state": json_fragment(b'{"entity_id":"light.a","state":"off"}')}]
+        )
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal_keys=journal_keys)
+        assert await store.async_load() == [
+            {"state": {"entity_id": "light.a", "state": "off"}}
+        ]
+
+        await hass.async_stop(force=True)
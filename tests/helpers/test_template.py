@@ -7,12 +7,14 @@ from datetime import datetime, timedelta
 import json
 import logging
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +24,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -5172,6 +5175,167 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_render_info_entity_attributes(hass: HomeAssistant) -> None:
+    """Test render info tracks the attributes read from entities."""
+    hass.states.async_set("light.one", "on", {"brightness": 100, "color": "red"})
+    hass.states.async_set("light.two", "on", {"brightness": 100})
+
+    info = template.Template(
+        "{{ state_attr('light.one', 'brightness') }}"
+        "{{ is_state_attr('light.one', 'color', 'red') }}"
+        "{{ state_attr('light.two', 'brightness') }}{{ states('light.two') }}",
+        hass,
+    ).async_render_to_info()
+    assert info.entities == {"light.one", "light.two"}
+    assert info.entity_attributes == {"light.one": {"brightness", "color"}}
+
+    info = template.Template(
+        "{{ state_attr('light.one', 'brightness') }}{{ states.light | list }}", hass
+    ).async_render_to_info()
+    assert info.entities == {"light.one"}
+    assert info.entity_attributes == {}
+
+
+async def test_native_template(hass: HomeAssistant) -> None:
+    """Test simple expression templates are rendered without jinja."""
+    hass.states.async_set("sensor.power", "1250.5")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+
+    for template_string, result in (
+        ("{{ states('sensor.power') }}", 1250.5),
+        ("{{ states('sensor.power') | float(0) * 2 }}", 2501.0),
+        ("{{ (states('sensor.power') | float / 1000) | round(1) }}", 1.3),
+        ("{{ -(states('sensor.missing') | float(0)) + 1 }}", 1.0),
+        ("{{ is_state('light.kitchen', 'on') }}", True),
+        ("{{ 100 < state_attr('light.kitchen', 'brightness') | int <= 200 }}", True),
+        ("{{ states('sensor.missing') | int(0) == 0 }}", True),
+    ):
+        tpl = template.Template(template_string, hass)
+        info = tpl.async_render_to_info()
+        assert isinstance(tpl._compiled, template.NativeTemplate)
+        assert info.result() == result
+        assert info.entities
+
+    tpl = template.Template("{{ states('sensor.power') | float }}", hass)
+    hass.states.async_set("sensor.power", "unknown")
+    with pytest.raises(TemplateError):
+        tpl.async_render()
+
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    assert tpl.async_render({"states": lambda _: "shadowed"}) == "shadowed"
+
+    tpl = template.Template("{{ states.sensor.power.state }}", hass)
+    assert tpl.async_render() == "unknown"
+    assert not isinstance(tpl._compiled, template.NativeTemplate)
+
+
+async def test_template_code_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled template code is persisted."""
+    path = str(tmp_path / template.CODE_CACHE_FILE)
+    code_cache = template.TemplateCodeCache(path)
+    hass.data[template._CODE_CACHE] = code_cache
+
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    assert tpl.async_render() == 2
+    assert code_cache.dirty
+    await hass.async_add_executor_job(code_cache.save)
+    assert not code_cache.dirty
+
+    # Start over with a new environment as a restart would
+    del tpl
+    hass.data.pop(template._ENVIRONMENT)
+    code_cache = template.TemplateCodeCache(path)
+    await hass.async_add_executor_job(code_cache.load)
+    hass.data[template._CODE_CACHE] = code_cache
+    with patch.object(
+        jinja2.Environment, "compile", side_effect=AssertionError
+    ) as mock_compile:
+        tpl = template.Template("{{ 1 + 1 }}", hass)
+        assert tpl.async_render() == 2
+    assert not mock_compile.called
+    assert not code_cache.dirty
+
+    with patch.object(template, "__version__", "0.0.0"):
+        code_cache = template.TemplateCodeCache(path)
+        await hass.async_add_executor_job(code_cache.load)
+    assert code_cache.get(code_cache.key("default", "{{ 1 + 1 }}")) is None
+
+
+async def test_template_code_cache_native_plan(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test native templates are not parsed again once cached."""
+    hass.states.async_set("sensor.power", "1250.5")
+    source = "{{ states('sensor.power') | float(0) * 2 }}"
+    path = str(tmp_path / template.CODE_CACHE_FILE)
+    code_cache = template.TemplateCodeCache(path)
+    hass.data[template._CODE_CACHE] = code_cache
+
+    tpl = template.Template(source, hass)
+    assert tpl.async_render() == 2501.0
+    assert isinstance(tpl._compiled, template.NativeTemplate)
+    await hass.async_add_executor_job(code_cache.save)
+
+    # The environment keeps the plan of templates compiled again
+    with patch.object(jinja2.Environment, "parse", side_effect=AssertionError):
+        tpl = template.Template(source, hass)
+        assert tpl.async_render() == 2501.0
+    assert isinstance(tpl._compiled, template.NativeTemplate)
+
+    # Start over with a new environment as a restart would
+    del tpl
+    hass.data.pop(template._ENVIRONMENT)
+    code_cache = template.TemplateCodeCache(path)
+    await hass.async_add_executor_job(code_cache.load)
+    hass.data[template._CODE_CACHE] = code_cache
+    with (
+        patch.object(jinja2.Environment, "compile", side_effect=AssertionError),
+        patch.object(jinja2.Environment, "parse", side_effect=AssertionError),
+    ):
+        tpl = template.Template(source, hass)
+        assert tpl.async_render() == 2501.0
+        info = tpl.async_render_to_info()
+    assert isinstance(tpl._compiled, template.NativeTemplate)
+    assert info.entities == {"sensor.power"}
+    assert not code_cache.dirty
+
+    # Templates that are not simple expressions are cached as such
+    tpl = template.Template("{{ states.sensor.power.state }}", hass)
+    assert tpl.async_render() == 1250.5
+    assert not isinstance(tpl._compiled, template.NativeTemplate)
+    assert (
+        code_cache.get_native_plan(
+            code_cache.key("native", "{{ states.sensor.power.state }}")
+        )
+        is None
+    )
+
+
+async def test_template_code_cache_records_until_started(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test only the code of templates compiled during startup is recorded."""
+    with patch.object(
+        hass.config, "path", return_value=str(tmp_path / template.CODE_CACHE_FILE)
+    ):
+        await template.async_load_code_cache(hass)
+    code_cache = hass.data[template._CODE_CACHE]
+
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    assert code_cache.dirty
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert not code_cache.recording
+    assert not code_cache.dirty
+    assert (tmp_path / template.CODE_CACHE_FILE).exists()
+
+    assert template.Template("{{ 2 + 2 }}", hass).async_render() == 4
+    assert not code_cache.dirty
+    assert code_cache.get(code_cache.key("default", "{{ 2 + 2 }}")) is None
+    assert code_cache.get(code_cache.key("default", "{{ 1 + 1 }}")) is not None
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -1165,6 +1165,125 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only receive events for their key."""
+    key_fn_calls = 0
+    calls_a = []
+    calls_b = []
+    calls_all = []
+
+    def _capture(calls):
+        return ha.callback(lambda event: calls.append(event))
+
+    @ha.callback
+    def key_fn(event_data):
+        """Return the key of the event."""
+        nonlocal key_fn_calls
+        key_fn_calls += 1
+        return event_data.get("key")
+
+    unsub_a = hass.bus.async_listen_keyed("test", key_fn, "a", _capture(calls_a))
+    unsub_b = hass.bus.async_listen_keyed("test", key_fn, "b", _capture(calls_b))
+    unsub_all = hass.bus.async_listen_keyed(
+        "test", key_fn, MATCH_ALL, _capture(calls_all)
+    )
+    assert hass.bus.async_listeners()["test"] == 3
+
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {})
+    await hass.async_block_till_done()
+
+    # The key function is called once per event, not once per listener
+    assert key_fn_calls == 3
+    assert [event.data for event in calls_a] == [{"key": "a"}]
+    assert calls_b == []
+    assert [event.data for event in calls_all] == [{"key": "a"}, {"key": "c"}]
+
+    unsub_a()
+    unsub_all()
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "b"})
+    await hass.async_block_till_done()
+
+    assert len(calls_a) == 1
+    assert len(calls_b) == 1
+    assert len(calls_all) == 2
+
+    unsub_b()
+    assert "test" not in hass.bus.async_listeners()
+    assert key_fn_calls == 5
+
+
+async def test_eventbus_keyed_listener_filter(hass: HomeAssistant) -> None:
+    """Test keyed listeners with an event filter."""
+    calls = []
+
+    @ha.callback
+    def key_fn(event_data):
+        """Return the key of the event."""
+        return event_data["key"]
+
+    @ha.callback
+    def event_filter(event_data):
+        """Filter the events."""
+        return event_data["value"] > 1
+
+    unsub = hass.bus.async_listen_keyed(
+        "test",
+        key_fn,
+        "a",
+        ha.callback(lambda event: calls.append(event)),
+        event_filter=event_filter,
+    )
+
+    hass.bus.async_fire("test", {"key": "a", "value": 1})
+    hass.bus.async_fire("test", {"key": "a", "value": 2})
+    hass.bus.async_fire("test", {"key": "b", "value": 2})
+    await hass.async_block_till_done()
+    assert [event.data for event in calls] == [{"key": "a", "value": 2}]
+
+    unsub()
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed(
+            "test", key_fn, "a", lambda event: None, event_filter=lambda data: True
+        )
+
+
+async def test_eventbus_keyed_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test keyed listener validation and key function errors."""
+
+    def not_a_callback(event_data):
+        return event_data["key"]
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_keyed("test", not_a_callback, "a", lambda event: None)
+
+    @ha.callback
+    def key_fn(event_data):
+        return event_data["key"]
+
+    with pytest.raises(HomeAssistantError, match="require a specific event type"):
+        hass.bus.async_listen_keyed(MATCH_ALL, key_fn, "a", lambda event: None)
+
+    calls = []
+    unsub = hass.bus.async_listen_keyed(
+        "test", key_fn, "a", ha.callback(lambda event: calls.append(event))
+    )
+    hass.bus.async_fire("test", {"other": "a"})
+    await hass.async_block_till_done()
+
+    assert calls == []
+    assert "Error in event key function" in caplog.text
+
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1679,148 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_attribute_interning(hass: HomeAssistant) -> None:
+    """Test identical attributes are shared between states when enabled."""
+    attrs = {"unit_of_measurement": "W", "device_class": "power", "value": 1.5}
+
+    hass.states.async_set("sensor.disabled_one", "1", dict(attrs))
+    hass.states.async_set("sensor.disabled_two", "2", dict(attrs))
+    assert (
+        hass.states.get("sensor.disabled_one").attributes
+        is not hass.states.get("sensor.disabled_two").attributes
+    )
+
+    hass.states.async_set_attribute_interning(True)
+    hass.states.async_set("sensor.one", "1", dict(attrs))
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    shared = hass.states.get("sensor.one").attributes
+    assert isinstance(shared, ReadOnlyDict)
+    assert hass.states.get("sensor.two").attributes is shared
+
+    # Different key order, value types or values are not shared
+    hass.states.async_set(
+        "sensor.three",
+        "3",
+        {"device_class": "power", "unit_of_measurement": "W", "value": 1.5},
+    )
+    assert hass.states.get("sensor.three").attributes is not shared
+    hass.states.async_set("sensor.four", "4", {"value": 1})
+    hass.states.async_set("sensor.five", "5", {"value": True})
+    assert type(hass.states.get("sensor.five").attributes["value"]) is bool
+    hass.states.async_set("sensor.six", "6", {"value": 0.0})
+    hass.states.async_set("sensor.seven", "7", {"value": -0.0})
+    assert str(hass.states.get("sensor.seven").attributes["value"]) == "-0.0"
+
+    # Values nested in tuples are compared by type too
+    hass.states.async_set("light.one", "on", {"rgb": (255, True)})
+    hass.states.async_set("light.two", "on", {"rgb": (255, 1)})
+    assert type(hass.states.get("light.two").attributes["rgb"][1]) is int
+    hass.states.async_set("light.three", "on", {"rgb": (255, True)})
+    assert (
+        hass.states.get("light.three").attributes
+        is hass.states.get("light.one").attributes
+    )
+
+    # Mappings with other values are stored without sharing
+    hass.states.async_set("sensor.eight", "8", {"options": ["a", "b"]})
+    hass.states.async_set("sensor.nine", "9", {"options": ["a", "b"]})
+    assert hass.states.get("sensor.nine").attributes == {"options": ["a", "b"]}
+    assert (
+        hass.states.get("sensor.nine").attributes
+        is not hass.states.get("sensor.eight").attributes
+    )
+
+    hass.states.async_set_attribute_interning(False)
+    hass.states.async_set("sensor.ten", "10", dict(attrs))
+    assert hass.states.get("sensor.ten").attributes is not shared
+
+
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("light.kitchen", "on")
+
+    events: list[ha.Event] = []
+    batches: list[list[ha.Event]] = []
+    reported: list[ha.Event] = []
+    seen_states: list[str | None] = []
+
+    @ha.callback
+    def _capture(event: ha.Event) -> None:
+        events.append(event)
+        # All states are committed before any event is fired
+        seen_states.append(hass.states.get("light.porch").state)
+
+    @ha.callback
+    def _capture_batch(batch: list[ha.Event]) -> None:
+        batches.append(batch)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _capture)
+    unsub_batch = hass.bus.async_listen_batch(EVENT_STATE_CHANGED, _capture_batch)
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        ha.callback(lambda event: reported.append(event)),
+        event_filter=ha.callback(lambda event_data: True),
+    )
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 100}),
+            ("light.kitchen", "on", None),
+            ("light.porch", "on", None),
+            ("light.porch", "off", None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.porch",
+        "light.porch",
+    ]
+    assert seen_states == ["off", "off", "off"]
+    assert events[2].data["old_state"].state == "on"
+    assert [event.data["entity_id"] for event in reported] == ["light.kitchen"]
+    assert len(batches) == 1
+    assert batches[0] == events
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.bowl").attributes == {"brightness": 100}
+
+    # Single events are delivered to batch listeners as a list
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert batches[1] == [events[3]]
+
+    # Nothing is fired if no state changed
+    hass.states.async_set_many([("light.bowl", "off", None)])
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+    unsub_batch()
+    assert EVENT_STATE_CHANGED not in hass.bus._batch_listeners
+
+
+async def test_statemachine_async_set_many_invalid_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test an invalid state does not partially apply a batch."""
+    hass.states.async_set("light.bowl", "off")
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("light.kitchen", "x" * 256, None)]
+        )
+
+    assert hass.states.get("light.bowl").state == "off"
+    assert hass.states.get("light.kitchen") is None
+
+
+async def test_eventbus_batch_listener_errors(hass: HomeAssistant) -> None:
+    """Test batch listeners require a specific event type."""
+    with pytest.raises(HomeAssistantError, match="require a specific event type"):
+        hass.bus.async_listen_batch(MATCH_ALL, ha.callback(lambda events: None))
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
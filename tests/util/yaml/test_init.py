@@ -602,3 +602,119 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+def _annotations(obj: Any) -> Any:
+    """Return a structure with the file references of parsed YAML."""
+    if isinstance(obj, dict):
+        return (
+            getattr(obj, "__config_file__", None),
+            getattr(obj, "__line__", None),
+            [(_annotations(key), _annotations(value)) for key, value in obj.items()],
+        )
+    if isinstance(obj, list):
+        return (
+            getattr(obj, "__config_file__", None),
+            getattr(obj, "__line__", None),
+            [_annotations(item) for item in obj],
+        )
+    if isinstance(obj, str):
+        return (
+            getattr(obj, "__config_file__", None),
+            getattr(obj, "__line__", None),
+            obj,
+        )
+    return obj
+
+
+def test_parse_cache(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test loading YAML files from the parse cache."""
+    monkeypatch.setenv("YAML_CACHE_TEST", "from_env")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pwhere\n")
+    (tmp_path / "included.yaml").write_text("- one\n- 2\n")
+    (tmp_path / "named").mkdir()
+    (tmp_path / "named" / "first.yaml").write_text("value: 1.5\n")
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text(
+        "key:\n"
+        "  password: !secret password\n"
+        "  env: !env_var YAML_CACHE_TEST\n"
+        "  included: !include included.yaml\n"
+        "  named: !include_dir_named named\n"
+        "  input: !input some_input\n"
+        "  empty:\n"
+    )
+    cache_path = str(tmp_path / "parse_cache")
+
+    def load(cache: yaml.YamlParseCache | None) -> dict:
+        return yaml.load_yaml_dict(str(config_path), yaml.Secrets(tmp_path), cache)
+
+    expected = load(None)
+    cache = yaml.YamlParseCache(cache_path)
+    data = load(cache)
+    assert data == expected
+    assert _annotations(data) == _annotations(expected)
+    assert cache.dirty
+    cache.save()
+    assert not cache.dirty
+
+    cache = yaml.YamlParseCache(cache_path)
+    cache.load()
+    with patch.object(
+        yaml_loader,
+        "_parse_yaml_unresolved",
+        side_effect=AssertionError("Parsed unchanged file"),
+    ):
+        data = load(cache)
+    assert data == expected
+    assert _annotations(data) == _annotations(expected)
+    assert data["key"]["input"] == yaml.Input("some_input")
+    assert not cache.dirty
+    assert not cache.has_unused
+
+    # Included files, secrets and environment variables are resolved on load
+    monkeypatch.setenv("YAML_CACHE_TEST", "changed_env")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: changed\n")
+    (tmp_path / "included.yaml").write_text("- changed\n")
+    (tmp_path / "named" / "second.yaml").write_text("value: 2\n")
+    data = load(cache)
+    assert data == load(None)
+    assert data["key"]["password"] == "changed"
+    assert data["key"]["env"] == "changed_env"
+    assert data["key"]["included"] == ["changed"]
+    assert data["key"]["named"] == {"first": {"value": 1.5}, "second": {"value": 2}}
+
+    # Files which were not loaded since the last save are dropped
+    (tmp_path / "named" / "second.yaml").unlink()
+    cache.save()
+    load(cache)
+    assert cache.has_unused
+    cache.save()
+    load(cache)
+    assert not cache.has_unused
+
+
+def test_parse_cache_skips_uncacheable_files(
+    tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test files which can't be cached are parsed on each load."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    cache = yaml.YamlParseCache(str(tmp_path / "parse_cache"))
+
+    # Timestamps can't be stored in the cache
+    config_path.write_text("key: 2024-01-01 10:00:00\n")
+    data = yaml.load_yaml_dict(str(config_path), None, cache)
+    assert data["key"].year == 2024
+    assert not cache.dirty
+
+    # Duplicate keys have to be reported on each load
+    config_path.write_text("key: 1\nkey: 2\n")
+    assert yaml.load_yaml_dict(str(config_path), None, cache) == {"key": 2}
+    assert "contains duplicate key" in caplog.text
+    assert not cache.dirty
+
+    # Syntax errors are reported by the regular loaders
+    config_path.write_text("key: [\n")
+    with pytest.raises(HomeAssistantError):
+        yaml.load_yaml_dict(str(config_path), None, cache)
+    assert not cache.dirty